@@ -0,0 +1,69 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+import aiomysql
+
+from app import metrics
+from app.db import dbconfig
+
+# Native asyncio pool (aiomysql). Created lazily on first use so importing the
+# app does not require the database to be reachable, and closed on shutdown.
+_pool = None
+_pool_lock = asyncio.Lock()
+
+ASYNC_POOL_MIN_SIZE = int(os.getenv("DB_ASYNC_POOL_MIN_SIZE", "1"))
+ASYNC_POOL_MAX_SIZE = int(os.getenv("DB_ASYNC_POOL_MAX_SIZE", "20"))
+
+_acquire_latency = metrics.POOL_WAIT.child("aiomysql")
+
+
+async def get_pool():
+    """Return the shared aiomysql pool, creating it on first call."""
+    global _pool
+
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await aiomysql.create_pool(
+                    host=dbconfig["host"],
+                    port=dbconfig["port"],
+                    user=dbconfig["user"],
+                    password=dbconfig["password"] or "",
+                    db=dbconfig["database"],
+                    minsize=ASYNC_POOL_MIN_SIZE,
+                    maxsize=ASYNC_POOL_MAX_SIZE,
+                    # Reads should never hold a snapshot open between requests;
+                    # writes call conn.begin() explicitly.
+                    autocommit=True,
+                )
+    return _pool
+
+
+async def close_pool():
+    """Close the pool (called from the app shutdown hook)."""
+    global _pool
+
+    if _pool is not None:
+        _pool.close()
+        await _pool.wait_closed()
+        _pool = None
+
+
+@asynccontextmanager
+async def get_async_connection():
+    """
+    Async equivalent of app.db.get_connection().
+
+    Usage:
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                ...
+    The connection goes back to the pool when the block exits.
+    """
+    pool = await get_pool()
+    started = time.perf_counter()
+    async with pool.acquire() as conn:
+        _acquire_latency.observe(time.perf_counter() - started)
+        yield conn
@@ -0,0 +1 @@
+from . import movies, tickets, reports, customers, showtimes
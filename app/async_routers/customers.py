@@ -0,0 +1,47 @@
+from typing import List
+
+import aiomysql
+from fastapi import APIRouter, HTTPException
+
+from app import metrics
+from app.async_db import get_async_connection
+from app.models import CustomerRead
+
+router = APIRouter(
+    prefix="/customers",
+    tags=["async: customers"],
+)
+
+
+@router.get(
+    "",
+    response_model=List[CustomerRead],
+    summary="List all customers (async)",
+    description="Async version of GET /api/customers.",
+)
+async def list_customers():
+    try:
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                rows = await metrics.fetchall_async(
+                    cursor,
+                    "async.customers.list",
+                    """
+                    SELECT
+                        CustomerID AS customer_id,
+                        FName      AS fname,
+                        LName      AS lname,
+                        MembershipStatus AS membership_status
+                    FROM Customers
+                    ORDER BY CustomerID
+                    """,
+                )
+
+        # Pydantic will validate/convert MembershipStatus (0/1) -> bool.
+        return rows
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching customers: {e}",
+        )
@@ -0,0 +1,131 @@
+from typing import List
+
+import aiomysql
+from fastapi import APIRouter, HTTPException
+
+from app import metrics
+from app.async_db import get_async_connection
+from app.models import MovieRead
+
+router = APIRouter(
+    prefix="/movies",
+    tags=["async: movies"],
+)
+
+
+def _to_movie(row) -> MovieRead:
+    return MovieRead(
+        movie_id=row["movie_id"],
+        title=row["title"],
+        genre=row["genre"],
+        runtime=row["runtime"],
+        release_date=row["release_date"],
+        price=float(row["price"]),
+        # IsActive is stored as TINYINT(1) (either 0 or 1) so we convert to bool for clarity
+        is_active=bool(row["is_active"]),
+        distributor_id=row["distributor_id"],
+    )
+
+
+@router.get(
+    "",
+    response_model=List[MovieRead],
+    summary="List all movies (async)",
+    description="Async version of GET /api/movies.",
+)
+async def list_movies():
+    try:
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                rows = await metrics.fetchall_async(
+                    cursor,
+                    "async.movies.list",
+                    """
+                    SELECT
+                        MovieID   AS movie_id,
+                        Title     AS title,
+                        Genre     AS genre,
+                        Runtime   AS runtime,
+                        ReleaseDate AS release_date,
+                        Price     AS price,
+                        IsActive  AS is_active,
+                        DistributorID AS distributor_id
+                    FROM Movies
+                    ORDER BY Title
+                    """,
+                )
+
+        return [_to_movie(row) for row in rows]
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {e}")
+
+
+@router.get(
+    "/now-playing",
+    response_model=List[MovieRead],
+    summary="Get all movies currently playing (async)",
+    description="Async version of GET /api/movies/now-playing.",
+)
+async def get_now_playing_movies():
+    try:
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                rows = await metrics.fetchall_async(
+                    cursor,
+                    "async.movies.now_playing",
+                    """
+                    SELECT
+                        MovieID  AS movie_id,
+                        Title    AS title,
+                        Genre  AS genre,
+                        Runtime  AS runtime,
+                        ReleaseDate AS release_date,
+                        Price   AS price,
+                        IsActive AS is_active,
+                        DistributorID AS distributor_id
+                    FROM Movies
+                    WHERE IsActive = 1
+                    ORDER BY Title
+                    """,
+                )
+
+        return [_to_movie(row) for row in rows]
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {e}")
+
+
+@router.get(
+    "/upcoming",
+    response_model=List[MovieRead],
+    summary="Get all upcoming movies (async)",
+    description="Async version of GET /api/movies/upcoming.",
+)
+async def get_upcoming_movies():
+    try:
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                rows = await metrics.fetchall_async(
+                    cursor,
+                    "async.movies.upcoming",
+                    """
+                    SELECT
+                        MovieID   AS movie_id,
+                        Title    AS title,
+                        Genre     AS genre,
+                        Runtime    AS runtime,
+                        ReleaseDate  AS release_date,
+                        Price   AS price,
+                        IsActive   AS is_active,
+                        DistributorID AS distributor_id
+                    FROM Movies
+                    WHERE ReleaseDate > CURDATE()
+                    ORDER BY ReleaseDate ASC
+                    """,
+                )
+
+        return [_to_movie(row) for row in rows]
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -0,0 +1,378 @@
+from datetime import date, timedelta
+from typing import List, Optional
+
+import aiomysql
+from fastapi import APIRouter, HTTPException, Query, Path
+from fastapi.concurrency import run_in_threadpool
+
+from app import metrics
+from app.async_db import get_async_connection
+from app.pool import PoolError
+from app.models import (
+    MovieShowtime,
+    ShowtimeAvailability,
+    ConcessionCategoryRevenue,
+    MovieLifetimeSales,
+    UpcomingShowtime,
+    DailyTicketSales,
+    MovieProfit,
+)
+from app.title_index import get_title_index
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["async: reports"],
+)
+
+
+async def _fetch_all(name, query, params=()):
+    """Run a read-only query on a pooled connection and return list[dict]."""
+    async with get_async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            return await metrics.fetchall_async(cursor, name, query, params)
+
+
+async def _fetch_one(name, query, params=()):
+    """Run a read-only query on a pooled connection and return one dict (or None)."""
+    async with get_async_connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            return await metrics.fetchone_async(cursor, name, query, params)
+
+
+@router.get(
+    "/movie-showtimes",
+    response_model=List[MovieShowtime],
+    summary="Query 1: Showtimes for a movie on a given date (async)",
+    description="Async version of GET /api/reports/movie-showtimes.",
+)
+async def get_movie_showtimes(
+    title: str = Query(
+        ..., description="Movie title, e.g., 'Minecraft'; small typos are forgiven"
+    ),
+    show_date: date = Query(
+        ..., alias="date", description="Date (YYYY-MM-DD) for which to find showtimes"
+    ),
+):
+    try:
+        # Same title resolution as the sync route; in the threadpool because a
+        # cold index loads the catalog through the sync repository
+        movie_ids = await run_in_threadpool(lambda: get_title_index().resolve(title))
+        if not movie_ids:
+            return []
+
+        placeholders = ", ".join(["%s"] * len(movie_ids))
+        rows = await _fetch_all(
+            "async.reports.movie_showtimes",
+            f"""
+            SELECT
+                m.Title   AS title,
+                s.ShowtimeID AS showtime_id,
+                s.TheaterID  AS theater_id,
+                s.StartTime  AS start_time,
+                s.EndTime    AS end_time
+            FROM Showtimes s
+            JOIN Movies m ON s.MovieID = m.MovieID
+            WHERE s.MovieID IN ({placeholders})
+              AND s.StartTime >= %s
+              AND s.StartTime < %s
+            ORDER BY s.StartTime
+            """,
+            (*movie_ids, show_date, show_date + timedelta(days=1)),
+        )
+
+        return [
+            MovieShowtime(
+                title=row["title"],
+                showtime_id=row["showtime_id"],
+                theater_id=row["theater_id"],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+            )
+            for row in rows
+        ]
+
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching movie showtimes: {e}",
+        )
+
+
+@router.get(
+    "/showtime-availability",
+    response_model=ShowtimeAvailability,
+    summary="Query 2: Remaining seats for a showtime (async)",
+    description="Async version of GET /api/reports/showtime-availability.",
+)
+async def get_showtime_availability(
+    showtime_id: int = Query(..., description="ID of the showtime to check"),
+):
+    try:
+        row = await _fetch_one(
+            "async.reports.showtime_availability",
+            """
+            SELECT
+                s.ShowtimeID                      AS showtime_id,
+                a.SeatCapacity                    AS seat_capacity,
+                s.TicketsSold                     AS tickets_sold,
+                (a.SeatCapacity - s.TicketsSold)  AS seats_remaining
+            FROM Showtimes s
+            JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+            WHERE s.ShowtimeID = %s
+            """,
+            (showtime_id,),
+        )
+
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Showtime with ID {showtime_id} not found.",
+            )
+
+        return ShowtimeAvailability(
+            showtime_id=row["showtime_id"],
+            seat_capacity=row["seat_capacity"],
+            tickets_sold=row["tickets_sold"],
+            seats_remaining=row["seats_remaining"],
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching showtime availability: {e}",
+        )
+
+
+@router.get(
+    "/concessions/top-categories",
+    response_model=List[ConcessionCategoryRevenue],
+    summary="Query 3: Total revenue per concession category (async)",
+    description="Async version of GET /api/reports/concessions/top-categories.",
+)
+async def get_concession_category_revenue(
+    limit: Optional[int] = Query(
+        None,
+        description="Optional limit (e.g., top 3). If omitted, returns all categories.",
+    )
+):
+    try:
+        query = """
+            SELECT
+                c.Category  AS category,
+                SUM(c.ConcessionPrice) AS total_revenue
+            FROM ConcessionSales cs
+            JOIN Concessions c ON cs.ConcessionID = c.ConcessionID
+            GROUP BY c.Category
+            ORDER BY total_revenue DESC
+        """
+        params = ()
+        if limit is not None:
+            query += " LIMIT %s"
+            params = (limit,)
+
+        rows = await _fetch_all(
+            "async.reports.concession_category_revenue", query, params
+        )
+
+        return [
+            ConcessionCategoryRevenue(
+                category=row["category"],
+                total_revenue=float(row["total_revenue"]),
+            )
+            for row in rows
+        ]
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching concession revenue: {e}",
+        )
+
+
+@router.get(
+    "/movie-lifetime-sales",
+    response_model=MovieLifetimeSales,
+    summary="Query 4: Lifetime ticket sales for a movie (async)",
+    description="Async version of GET /api/reports/movie-lifetime-sales.",
+)
+async def get_movie_lifetime_sales(
+    movie_id: int = Query(
+        ..., description="MovieID to look up lifetime ticket sales for"
+    ),
+):
+    try:
+        row = await _fetch_one(
+            "async.reports.movie_lifetime_sales",
+            """
+            SELECT
+                m.MovieID AS movie_id,
+                m.Title   AS title,
+                (
+                    SELECT COUNT(*)
+                    FROM TicketSales ts
+                    JOIN Showtimes s ON ts.ShowtimeID = s.ShowtimeID
+                    WHERE s.MovieID = m.MovieID
+                ) AS lifetime_ticket_sales
+            FROM Movies m
+            WHERE m.MovieID = %s
+            """,
+            (movie_id,),
+        )
+
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Movie with ID {movie_id} not found.",
+            )
+
+        return MovieLifetimeSales(
+            movie_id=row["movie_id"],
+            title=row["title"],
+            lifetime_ticket_sales=row["lifetime_ticket_sales"] or 0,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching movie lifetime sales: {e}",
+        )
+
+
+@router.get(
+    "/upcoming-showtimes",
+    response_model=List[UpcomingShowtime],
+    summary="Query 5: Upcoming showtimes (using view) (async)",
+    description="Async version of GET /api/reports/upcoming-showtimes.",
+)
+async def get_upcoming_showtimes(
+    days_ahead: Optional[int] = Query(
+        None,
+        description=(
+            "Optional number of days ahead to restrict upcoming showtimes. "
+            "If omitted, returns all future showtimes from now onward."
+        ),
+    )
+):
+    try:
+        query = """
+            SELECT
+                ShowtimeID    AS showtime_id,
+                MovieID       AS movie_id,
+                MovieTitle    AS movie_title,
+                TheaterID     AS theater_id,
+                StartTime     AS start_time,
+                EndTime       AS end_time,
+                IsSoldOut     AS is_sold_out,
+                DynamicStatus AS dynamic_status
+            FROM UpcomingShowtimesView
+        """
+        params = ()
+        if days_ahead is not None:
+            query += " WHERE StartTime <= DATE_ADD(NOW(), INTERVAL %s DAY)"
+            params = (days_ahead,)
+        query += " ORDER BY StartTime"
+
+        rows = await _fetch_all("async.reports.upcoming_showtimes", query, params)
+
+        return [
+            UpcomingShowtime(
+                showtime_id=row["showtime_id"],
+                movie_id=row["movie_id"],
+                movie_title=row["movie_title"],
+                theater_id=row["theater_id"],
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+                is_sold_out=bool(row["is_sold_out"]),
+                dynamic_status=row["dynamic_status"],
+            )
+            for row in rows
+        ]
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching upcoming showtimes: {e}",
+        )
+
+
+@router.get(
+    "/daily-ticket-sales",
+    response_model=DailyTicketSales,
+    summary="(Optional) Daily ticket sales (async)",
+    description="Async version of GET /api/reports/daily-ticket-sales.",
+)
+async def get_daily_ticket_sales(
+    target_date: date = Query(
+        ..., alias="date", description="Date (YYYY-MM-DD) to count ticket sales for"
+    ),
+):
+    try:
+        row = await _fetch_one(
+            "async.reports.daily_ticket_sales",
+            "SELECT get_number_of_ticket_sales(%s) AS tickets_sold",
+            (target_date,),
+        )
+
+        tickets_sold = (
+            row["tickets_sold"] if row and row["tickets_sold"] is not None else 0
+        )
+
+        return DailyTicketSales(
+            report_date=target_date,
+            tickets_sold=tickets_sold,
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching daily ticket sales: {e}",
+        )
+
+
+@router.get(
+    "/movies/{movie_id}/profit",
+    response_model=MovieProfit,
+    summary="(Optional) Movie profit (async)",
+    description="Async version of GET /api/reports/movies/{movie_id}/profit.",
+)
+async def get_movie_profit(
+    movie_id: int = Path(..., description="MovieID to compute profit for"),
+):
+    try:
+        row = await _fetch_one(
+            "async.reports.movie_profit",
+            """
+            SELECT
+                m.Title                    AS title,
+                get_movie_profits(%s)      AS net_profit
+            FROM Movies m
+            WHERE m.MovieID = %s
+            """,
+            (movie_id, movie_id),
+        )
+
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Movie with ID {movie_id} not found.",
+            )
+
+        return MovieProfit(
+            movie_id=movie_id,
+            title=row["title"],
+            net_profit=float(row["net_profit"] or 0.0),
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching movie profit: {e}",
+        )
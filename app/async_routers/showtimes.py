@@ -0,0 +1,47 @@
+from typing import List
+
+import aiomysql
+from fastapi import APIRouter, HTTPException
+
+from app import metrics
+from app.async_db import get_async_connection
+from app.models import ShowtimeRead
+
+router = APIRouter(
+    prefix="/showtimes",
+    tags=["async: showtimes"],
+)
+
+
+@router.get(
+    "",
+    response_model=List[ShowtimeRead],
+    summary="List all showtimes (async)",
+    description="Async version of GET /api/showtimes.",
+)
+async def list_showtimes():
+    try:
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                rows = await metrics.fetchall_async(
+                    cursor,
+                    "async.showtimes.list",
+                    """
+                    SELECT
+                        ShowtimeID AS showtime_id,
+                        MovieID    AS movie_id,
+                        TheaterID  AS theater_id,
+                        StartTime  AS start_time,
+                        EndTime    AS end_time
+                    FROM Showtimes
+                    ORDER BY StartTime
+                    """,
+                )
+
+        return rows
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching showtimes: {e}",
+        )
@@ -0,0 +1,282 @@
+from typing import List, Optional
+
+import aiomysql
+import pymysql
+from fastapi import APIRouter, HTTPException, Path, Query
+
+from app import cache, live, metrics, soldout
+from app.async_db import get_async_connection
+from app.models import (
+    TicketSaleRead,
+    TicketSalePage,
+    TicketPurchaseRequest,
+    TicketPurchaseResponse,
+    CustomerTicketHistoryEntry,
+    CustomerTicketHistoryPage,
+)
+from app.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+
+router = APIRouter(
+    prefix="/tickets",
+    tags=["async: tickets"],
+)
+
+
+def _to_ticket_sale(row) -> TicketSaleRead:
+    return TicketSaleRead(
+        ticket_sale_id=row["ticket_sale_id"],
+        customer_id=row["customer_id"],
+        showtime_id=row["showtime_id"],
+        ticket_price=float(row["ticket_price"]),
+        time_ticket_sold=row["time_ticket_sold"],
+    )
+
+
+@router.post(
+    "/purchase",
+    response_model=TicketPurchaseResponse,
+    summary="Purchase a ticket (async)",
+    description="Async version of POST /api/tickets/purchase.",
+)
+async def purchase_ticket(req: TicketPurchaseRequest):
+    if soldout.is_sold_out(req.showtime_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Ticket purchase failed: Sold out",
+        )
+
+    try:
+        async with get_async_connection() as conn:
+            # Pool runs in autocommit mode, so open the transaction explicitly
+            await conn.begin()
+            try:
+                live_state = None
+                async with conn.cursor() as cursor:
+                    await metrics.callproc_async(
+                        cursor,
+                        "async.tickets.purchase",
+                        "Process_Ticket_Purchase",
+                        (req.customer_id, req.showtime_id),
+                    )
+                    if live.hub.subscribers:
+                        live_state = await metrics.fetchone_async(
+                            cursor,
+                            "async.tickets.purchase.availability",
+                            """
+                            SELECT s.TicketsSold, a.SeatCapacity
+                            FROM Showtimes s
+                            JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+                            WHERE s.ShowtimeID = %s
+                            """,
+                            (req.showtime_id,),
+                        )
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+
+        cache.invalidate("seat_availability", key=req.showtime_id)
+        cache.invalidate("showtime_status")
+        if live_state:
+            live.publish_availability(req.showtime_id, *live_state)
+
+        return TicketPurchaseResponse(
+            status="success",
+            message="Ticket purchased successfully.",
+        )
+    except pymysql.err.MySQLError as e:
+        # SIGNAL errors arrive as (errno, MESSAGE_TEXT)
+        detail_msg = e.args[1] if len(e.args) > 1 else str(e)
+        soldout.mark_if_sold_out(req.showtime_id, detail_msg)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Ticket purchase failed: {detail_msg}",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Unexpected error during ticket purchase: {e}",
+        )
+
+
+@router.get(
+    "/today",
+    response_model=List[TicketSaleRead],
+    summary="Get all tickets sold today (async)",
+    description="Async version of GET /api/tickets/today.",
+)
+async def get_tickets_sold_today():
+    try:
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                rows = await metrics.fetchall_async(
+                    cursor,
+                    "async.tickets.today",
+                    """
+                    SELECT
+                        TicketSaleID  AS ticket_sale_id,
+                        CustomerID   AS customer_id,
+                        ShowtimeID  AS showtime_id,
+                        TicketPrice   AS ticket_price,
+                        TimeTicketSold AS time_ticket_sold
+                    FROM TicketSales
+                    WHERE TimeTicketSold >= CURDATE()
+                      AND TimeTicketSold < CURDATE() + INTERVAL 1 DAY
+                    ORDER BY TimeTicketSold ASC
+                    """,
+                )
+
+        return [_to_ticket_sale(row) for row in rows]
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching todays ticket sales: {e}",
+        )
+
+
+def _split_page(rows, limit):
+    """Trim the look-ahead row and build next_cursor from the last kept row."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last["time_ticket_sold"], last["ticket_sale_id"])
+
+
+@router.get(
+    "/customers/{customer_id}/tickets",
+    response_model=CustomerTicketHistoryPage,
+    summary="Get all tickets purchased by a given customer (async)",
+    description="Async version of GET /api/tickets/customers/{customer_id}/tickets.",
+)
+async def get_customer_ticket_history(
+    customer_id: int = Path(
+        ..., description="ID of the customer whose ticket history to fetch"
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+):
+    try:
+        query = """
+            SELECT
+                ts.TicketSaleID   AS ticket_sale_id,
+                m.Title      AS movie_title,
+                ts.ShowtimeID   AS showtime_id,
+                s.TheaterID    AS theater_id,
+                s.StartTime    AS start_time,
+                ts.TicketPrice  AS ticket_price,
+                ts.TimeTicketSold AS time_ticket_sold
+            FROM TicketSales ts
+            JOIN Showtimes s ON ts.ShowtimeID = s.ShowtimeID
+            JOIN Movies    m ON s.MovieID    = m.MovieID
+            WHERE ts.CustomerID = %s
+        """
+        params = [customer_id]
+        if cursor is not None:
+            sold_at, sale_id = decode_cursor(cursor)
+            query += """
+              AND (ts.TimeTicketSold < %s
+                   OR (ts.TimeTicketSold = %s AND ts.TicketSaleID < %s))
+            """
+            params += [sold_at, sold_at, sale_id]
+        query += " ORDER BY ts.TimeTicketSold DESC, ts.TicketSaleID DESC LIMIT %s"
+        params.append(limit + 1)
+
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as db_cursor:
+                rows = await metrics.fetchall_async(
+                    db_cursor, "async.tickets.customer_history", query, params
+                )
+
+        rows, next_cursor = _split_page(rows, limit)
+        return CustomerTicketHistoryPage(
+            items=[
+                CustomerTicketHistoryEntry(
+                    ticket_sale_id=row["ticket_sale_id"],
+                    movie_title=row["movie_title"],
+                    showtime_id=row["showtime_id"],
+                    theater_id=row["theater_id"],
+                    start_time=row["start_time"],
+                    ticket_price=float(row["ticket_price"]),
+                    time_ticket_sold=row["time_ticket_sold"],
+                )
+                for row in rows
+            ],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching ticket history: {e}",
+        )
+
+
+@router.get(
+    "",
+    response_model=TicketSalePage,
+    summary="List all ticket sales (async)",
+    description="Async version of GET /api/tickets.",
+)
+async def list_all_tickets(
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+):
+    try:
+        query = """
+            SELECT
+                TicketSaleID AS ticket_sale_id,
+                CustomerID   AS customer_id,
+                ShowtimeID   AS showtime_id,
+                TicketPrice  AS ticket_price,
+                TimeTicketSold AS time_ticket_sold
+            FROM TicketSales
+        """
+        params = []
+        if cursor is not None:
+            sold_at, sale_id = decode_cursor(cursor)
+            query += """
+            WHERE TimeTicketSold < %s
+               OR (TimeTicketSold = %s AND TicketSaleID < %s)
+            """
+            params += [sold_at, sold_at, sale_id]
+        query += " ORDER BY TimeTicketSold DESC, TicketSaleID DESC LIMIT %s"
+        params.append(limit + 1)
+
+        async with get_async_connection() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as db_cursor:
+                rows = await metrics.fetchall_async(
+                    db_cursor, "async.tickets.list", query, params
+                )
+
+        rows, next_cursor = _split_page(rows, limit)
+        return TicketSalePage(
+            items=[_to_ticket_sale(row) for row in rows],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching all ticket sales: {e}",
+        )
@@ -0,0 +1,123 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Set CACHE_ENABLED=0 to bypass every cache (e.g. when benchmarking queries)
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") != "0"
+
+_MISSING = object()
+
+# name -> TTLCache, filled in by TTLCache.__init__
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    Each cache is registered globally under `name` and carries a set of tags
+    naming the data it depends on (e.g. "movies", "seat_availability"), so
+    write paths can invalidate by tag without importing the routers that own
+    the caches.
+    """
+
+    def __init__(self, name, ttl, max_entries=128, tags=()):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.tags = frozenset(tags)
+
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        # Bumped by invalidate(); a load that overlaps one isn't stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        with _registry_lock:
+            _registry[name] = self
+
+    def get_or_load(self, key, loader):
+        """
+        Return the cached value for `key`, or call loader() and cache its
+        result. Exceptions from loader() propagate and nothing is cached.
+
+        If the cache is invalidated while loader() runs, its result may
+        predate the write that invalidated it: it is returned to this caller
+        but not stored, so the next lookup loads again.
+        """
+        if not CACHE_ENABLED:
+            return loader()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        # Load outside the lock so one slow query doesn't block other keys
+        value = loader()
+
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def invalidate(self, key=_MISSING):
+        """Drop one key, or every entry when no key is given."""
+        with self._lock:
+            if key is _MISSING:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "ttl_s": self.ttl,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "tags": sorted(self.tags),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+def invalidate(tag, key=_MISSING):
+    """
+    Invalidation hook for write paths: drop `key` (or everything) from every
+    cache tagged with `tag`.
+    """
+    with _registry_lock:
+        caches = [c for c in _registry.values() if tag in c.tags]
+    for cache in caches:
+        cache.invalidate(key)
+
+
+def cache_stats():
+    """Per-cache hit/miss counters, used by /health/cache."""
+    with _registry_lock:
+        caches = dict(_registry)
+    return {
+        "enabled": CACHE_ENABLED,
+        "caches": {name: cache.stats() for name, cache in sorted(caches.items())},
+    }
@@ -1,7 +1,9 @@
 import os
 from dotenv import load_dotenv
-import mysql.connector
-from mysql.connector import pooling
+
+from app import metrics
+from app.pool import ConnectionPool
+from app.replicas import Replica, ReplicaSet
 
 # Load variables from .env file
 load_dotenv()
@@ -12,12 +14,124 @@ dbconfig = {
     "user": os.getenv("DB_USER"),
     "password": os.getenv("DB_PASSWORD"),
     "database": os.getenv("DB_NAME"),
+    # C extension (faster row decoding) when installed; DB_USE_PURE=1 forces
+    # the pure-Python protocol
+    "use_pure": os.getenv("DB_USE_PURE", "0") == "1",
 }
 
-# Simple connection pool for reuse (avoids new connection overhead)
-pool = pooling.MySQLConnectionPool(pool_name="theater_pool", pool_size=5, **dbconfig)
+# Pool sizing (see README). Requests beyond DB_POOL_SIZE queue for up to
+# DB_POOL_ACQUIRE_TIMEOUT seconds instead of failing straight away.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+POOL_MAX_WAITERS = int(os.getenv("DB_POOL_MAX_WAITERS", "64"))
+POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", "5"))
+POOL_MAX_AGE = float(os.getenv("DB_POOL_MAX_AGE", "1800"))
+POOL_PING_AFTER = float(os.getenv("DB_POOL_PING_AFTER", "1"))
+# Seconds clients are told to wait (Retry-After) when the pool turns them away
+POOL_RETRY_AFTER = int(os.getenv("DB_POOL_RETRY_AFTER", "1"))
+
+# Connections are opened on demand, so importing this module doesn't connect
+pool = ConnectionPool(
+    size=POOL_SIZE,
+    max_waiters=POOL_MAX_WAITERS,
+    acquire_timeout=POOL_ACQUIRE_TIMEOUT,
+    max_age=POOL_MAX_AGE,
+    ping_after=POOL_PING_AFTER,
+    **dbconfig,
+)
+
+
+def _pool_connections():
+    stats = pool.stats()
+    return {(state,): stats[state] for state in ("in_use", "idle", "waiters")}
+
+
+metrics.POOL_WAIT.child("mysql", histogram=pool.acquire_latency)
+metrics.Collected(
+    "theater_db_pool_connections",
+    "Connections of the mysql pool by state, and callers waiting for one.",
+    labels=("state",),
+    collect=_pool_connections,
+)
+metrics.Collected(
+    "theater_db_pool_timeouts_total",
+    "Callers that gave up waiting for a mysql pool connection.",
+    collect=lambda: {(): pool.stats()["timeouts_total"]},
+    type="counter",
+)
+
+
+# Read replicas (see README): comma-separated host[:port] list. Same user,
+# password and database as the primary; each replica gets its own pool.
+REPLICA_HOSTS = [
+    host.strip() for host in os.getenv("DB_REPLICA_HOSTS", "").split(",") if host.strip()
+]
+REPLICA_POOL_SIZE = int(os.getenv("DB_REPLICA_POOL_SIZE", str(POOL_SIZE)))
+REPLICA_SELECTION = os.getenv("DB_REPLICA_SELECTION", "least_loaded")
+REPLICA_LAG_INTERVAL = float(os.getenv("DB_REPLICA_LAG_INTERVAL", "1"))
+# A saturated replica pool is skipped after this long instead of queueing
+REPLICA_ACQUIRE_TIMEOUT = float(os.getenv("DB_REPLICA_ACQUIRE_TIMEOUT", "0.5"))
+
+# Staleness budgets (seconds of replica lag) passed by read-only routes:
+# analytics can lag a little, seat counts a manager acts on barely at all
+REPORTS_MAX_STALENESS = float(os.getenv("DB_REPLICA_MAX_LAG_REPORTS", "30"))
+LIVE_MAX_STALENESS = float(os.getenv("DB_REPLICA_MAX_LAG_LIVE", "2"))
+
+
+def _replica(host):
+    name, _, port = host.partition(":")
+    config = {**dbconfig, "host": name, "port": int(port or dbconfig["port"])}
+    replica_pool = ConnectionPool(
+        size=REPLICA_POOL_SIZE,
+        max_waiters=POOL_MAX_WAITERS,
+        acquire_timeout=POOL_ACQUIRE_TIMEOUT,
+        max_age=POOL_MAX_AGE,
+        ping_after=POOL_PING_AFTER,
+        **config,
+    )
+    metrics.POOL_WAIT.child(f"replica:{host}", histogram=replica_pool.acquire_latency)
+    return Replica(host, replica_pool)
+
+
+replicas = ReplicaSet(
+    [_replica(host) for host in REPLICA_HOSTS],
+    selection=REPLICA_SELECTION,
+    lag_interval=REPLICA_LAG_INTERVAL,
+    acquire_timeout=REPLICA_ACQUIRE_TIMEOUT,
+)
+
+_READ_ROUTING = metrics.Counter(
+    "theater_db_read_routing_total",
+    "Read-only connections by where they were served (a replica or the primary).",
+    labels=("target",),
+)
+metrics.Collected(
+    "theater_db_replica_lag_seconds",
+    "Last measured replication lag per replica (absent while unknown).",
+    labels=("replica",),
+    collect=lambda: {
+        (replica.name,): lag
+        for replica in replicas.replicas
+        if (lag := replicas.lag(replica)) is not None
+    },
+)
 
 
 def get_connection():
     """Get a DB connection from the pool"""
     return pool.get_connection()
+
+
+def get_read_connection(max_staleness):
+    """
+    Connection for a read-only route that can tolerate `max_staleness`
+    seconds of replication lag. Served by a replica when one is fresh enough
+    and has a free connection, otherwise by the primary. Writes (and reads
+    that must see them, e.g. inside a purchase) use get_connection().
+    """
+    if replicas.replicas:
+        name, conn = replicas.get_connection(max_staleness)
+        if conn is not None:
+            _READ_ROUTING.inc(name)
+            return conn
+    _READ_ROUTING.inc("primary")
+    return pool.get_connection()
@@ -0,0 +1,58 @@
+import json
+from datetime import date, datetime
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback, same output, just slower
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    """
+    Encode plain dicts/lists to JSON bytes. Datetimes come out in the same
+    ISO format Pydantic uses, so responses match the response_model schema.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(Response):
+    """JSON response that skips FastAPI's response_model validation pass."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content  # already encoded (e.g. from a cache)
+        return dumps(content)
+
+
+def records(rows, fields):
+    """
+    Turn tuple-cursor rows into dicts ready for dumps().
+
+    `fields` is a sequence of (name, converter) in SELECT column order;
+    converter (e.g. float for DECIMAL, bool for TINYINT flags) may be None.
+    """
+    names = [name for name, _ in fields]
+    converters = [(i, conv) for i, (_, conv) in enumerate(fields) if conv is not None]
+    if not converters:
+        return [dict(zip(names, row)) for row in rows]
+
+    out = []
+    for row in rows:
+        row = list(row)
+        for i, conv in converters:
+            if row[i] is not None:
+                row[i] = conv(row[i])
+        out.append(dict(zip(names, row)))
+    return out
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+
+from app import cache, metrics
+from app.async_db import get_async_connection
+
+logger = logging.getLogger(__name__)
+
+# Events buffered per client before the oldest ones are dropped
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "256"))
+# Seconds between checks for shows that started or ended
+LIVE_STATUS_INTERVAL = float(os.getenv("LIVE_STATUS_INTERVAL", "15"))
+# Seconds of silence before a keep-alive is sent to each client
+LIVE_HEARTBEAT = float(os.getenv("LIVE_HEARTBEAT", "20"))
+
+
+class LiveHub:
+    """
+    In-process fan-out of live events to WebSocket/SSE clients.
+
+    Every client gets its own bounded asyncio.Queue. publish() is safe to
+    call from threadpool (sync) handlers: the event is handed to the event
+    loop and copied into every queue there. A client that falls behind loses
+    its oldest events instead of slowing down the publisher.
+    """
+
+    def __init__(self, queue_size=LIVE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._loop = None
+        self.published = 0
+        self.dropped = 0
+
+    def bind(self, loop):
+        """Remember the event loop that owns the client queues."""
+        self._loop = loop
+
+    @property
+    def subscribers(self):
+        return len(self._subscribers)
+
+    def publish(self, event):
+        """Send `event` (a JSON-serializable dict) to every connected client."""
+        loop = self._loop
+        if loop is None or not self._subscribers:
+            return
+        loop.call_soon_threadsafe(self._fan_out, event)
+
+    def _fan_out(self, event):
+        self.published += 1
+        for queue in list(self._subscribers):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self):
+        """Register a client queue for the duration of the block."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def stats(self):
+        return {
+            "subscribers": self.subscribers,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+hub = LiveHub()
+
+
+def publish_availability(showtime_id, tickets_sold, seat_capacity):
+    """Availability delta after a purchase commits (plus Sold Out if full)."""
+    hub.publish(
+        {
+            "type": "availability",
+            "showtime_id": showtime_id,
+            "seat_capacity": seat_capacity,
+            "tickets_sold": tickets_sold,
+            "seats_remaining": max(seat_capacity - tickets_sold, 0),
+        }
+    )
+    if tickets_sold >= seat_capacity:
+        hub.publish(
+            {"type": "status", "showtime_id": showtime_id, "status": "Sold Out"}
+        )
+
+
+# Shows that started or ended in (since, now]. Bounding StartTime lets MySQL
+# range scan idx_showtimes_start; shows are assumed to run under a day.
+_TRANSITIONS_QUERY = """
+    SELECT ShowtimeID, StartTime, EndTime
+    FROM Showtimes
+    WHERE StartTime > %s - INTERVAL 1 DAY
+      AND StartTime <= %s
+      AND ((StartTime > %s AND StartTime <= %s) OR (EndTime > %s AND EndTime <= %s))
+"""
+
+
+async def watch_status_transitions(interval=LIVE_STATUS_INTERVAL):
+    """
+    Background task: publish "In Progress" / "Completed" status events as
+    shows start and end. Runs one query per interval for all clients, and
+    none while nobody is connected.
+    """
+    since = None
+    while True:
+        await asyncio.sleep(interval)
+        if not hub.subscribers:
+            since = None
+            continue
+        try:
+            async with get_async_connection() as conn:
+                async with conn.cursor() as cursor:
+                    (now,) = await metrics.fetchone_async(
+                        cursor, "live.now", "SELECT NOW()"
+                    )
+                    rows = []
+                    if since is not None:
+                        rows = await metrics.fetchall_async(
+                            cursor,
+                            "live.status_transitions",
+                            _TRANSITIONS_QUERY,
+                            (since, now, since, now, since, now),
+                        )
+        except Exception:
+            logger.exception("Live status check failed")
+            continue
+
+        for showtime_id, start_time, end_time in rows:
+            status = "Completed" if since < end_time <= now else "In Progress"
+            hub.publish(
+                {"type": "status", "showtime_id": showtime_id, "status": status}
+            )
+        if rows:
+            cache.invalidate("showtime_status")
+        since = now
@@ -1,10 +1,51 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
-from app.db import get_connection
-from app.routers import movies, tickets, reports, customers, showtimes
+from app import async_db, live, metrics, soldout
+from app.cache import cache_stats
+from app.db import POOL_RETRY_AFTER, pool, replicas
+from app.pool import PoolError
+from app.repository import DB_BACKEND, get_repository
+from app.routers import movies, tickets, reports, customers, showtimes, exports, dashboard
+from app.routers import live as live_router
+from app import async_routers
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync handlers publish live events from the threadpool onto this loop
+    live.hub.bind(asyncio.get_running_loop())
+    # The status watcher polls MySQL through the async pool
+    status_watcher = None
+    if DB_BACKEND == "mysql":
+        status_watcher = asyncio.create_task(live.watch_status_transitions())
+    yield
+    if status_watcher is not None:
+        status_watcher.cancel()
+    # The async pool is created lazily, only close it if it was used
+    await async_db.close_pool()
+
+
+app = FastAPI(title="Movie Theater Dashboard", lifespan=lifespan)
+app.add_middleware(metrics.RequestMetricsMiddleware)
 
-app = FastAPI(title="Movie Theater Dashboard")
+
+@app.exception_handler(PoolError)
+async def pool_overloaded(request: Request, exc: PoolError):
+    """
+    The pool wait queue is full or the acquire timeout expired: the server is
+    overloaded, not broken, so answer 503 with a Retry-After instead of the
+    route's generic 500 (routes re-raise PoolError past their excepts).
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"Database busy, retry shortly: {exc}"},
+        headers={"Retry-After": str(POOL_RETRY_AFTER)},
+    )
 
 
 @app.get("/health")
@@ -13,23 +54,59 @@ def health_check():
     Simple health endpoint to check that FastAPI is running and DB connection works
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        row = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        return {"status": "ok", "db": row[0]}
+        get_repository().ping()
+        return {"status": "ok", "db": 1, "backend": DB_BACKEND}
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"DB error: {e}")
 
 
+@app.get("/health/pool")
+def pool_stats():
+    """
+    Live connection pool stats: in-use/idle/waiting connections, timeouts and
+    the acquire latency histogram. Used to size DB_POOL_SIZE from real data.
+    Read replicas (if configured) are listed with their last measured lag.
+    """
+    if replicas.replicas:
+        return {**pool.stats(), "replicas": replicas.stats()}
+    return pool.stats()
+
+
+@app.get("/health/cache")
+def cache_health():
+    """Hit/miss/eviction counters for every in-process cache."""
+    return {**cache_stats(), "sold_out": soldout.stats(), "live": live.hub.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def prometheus_metrics():
+    """
+    Prometheus scrape endpoint: per-query latency/rows/errors, pool wait
+    time and connection counts, and per-route request latency.
+    """
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 # Include routers
 app.include_router(movies.router, prefix="/api")
 app.include_router(tickets.router, prefix="/api")
 app.include_router(reports.router, prefix="/api")
 app.include_router(showtimes.router, prefix="/api")
 app.include_router(customers.router, prefix="/api")
+app.include_router(exports.router, prefix="/api")
+app.include_router(live_router.router, prefix="/api")
+app.include_router(dashboard.router, prefix="/api")
+
+# Async (aiomysql) versions of the same endpoints, same paths under /api/async
+app.include_router(async_routers.movies.router, prefix="/api/async")
+app.include_router(async_routers.tickets.router, prefix="/api/async")
+app.include_router(async_routers.reports.router, prefix="/api/async")
+app.include_router(async_routers.showtimes.router, prefix="/api/async")
+app.include_router(async_routers.customers.router, prefix="/api/async")
 
 # Serve static frontend (needs to be implemented)
 app.mount("/", StaticFiles(directory="static", html=True), name="static")
@@ -0,0 +1,396 @@
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Latency buckets in seconds (upper bounds), Prometheus-style
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram (values in seconds)."""
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot = +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self):
+        """
+        Cumulative bucket counts keyed by upper bound ("+Inf" for the last),
+        plus total sum and count.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        cumulative = {}
+        running = 0
+        for bound, n in zip(self.buckets, counts):
+            running += n
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = running + counts[-1]
+
+        return {"buckets": cumulative, "sum": total_sum, "count": total_count}
+
+
+# ---------- Prometheus-style metric families ----------
+
+# Families in exposition order, see render()
+REGISTRY = []
+
+
+def _label_text(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Family:
+    type = None
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        REGISTRY.append(self)
+
+    def samples(self):
+        """Exposition lines for this family (without HELP/TYPE)."""
+        raise NotImplementedError
+
+
+class Counter(_Family):
+    """Monotonic counter, one value per label combination."""
+
+    type = "counter"
+
+    def __init__(self, name, help, labels=()):
+        super().__init__(name, help, labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_label_text(self.label_names, labels)} {value}"
+            for labels, value in values
+        ]
+
+
+class Collected(_Family):
+    """
+    Values owned elsewhere (e.g. pool counters), read at scrape time from
+    `collect()`, which returns {label_values: value}. `type` is "gauge" or
+    "counter".
+    """
+
+    def __init__(self, name, help, labels=(), collect=None, type="gauge"):
+        super().__init__(name, help, labels)
+        self.collect = collect
+        self.type = type
+
+    def samples(self):
+        values = self.collect() if self.collect else {}
+        return [
+            f"{self.name}{_label_text(self.label_names, labels)} {value}"
+            for labels, value in sorted(values.items())
+        ]
+
+
+class HistogramFamily(_Family):
+    """One Histogram per label combination."""
+
+    type = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def child(self, *label_values, histogram=None):
+        """
+        The Histogram for these labels, created on first use. Pass an
+        existing `histogram` to export one that is owned elsewhere.
+        """
+        with self._lock:
+            if histogram is not None:
+                self._children[label_values] = histogram
+            elif label_values not in self._children:
+                self._children[label_values] = Histogram(self.buckets)
+            return self._children[label_values]
+
+    def observe(self, value, *label_values):
+        self.child(*label_values).observe(value)
+
+    def samples(self):
+        with self._lock:
+            children = sorted(self._children.items())
+        lines = []
+        for labels, histogram in children:
+            snapshot = histogram.snapshot()
+            for bound, count in snapshot["buckets"].items():
+                label_text = _label_text(self.label_names, labels, [("le", bound)])
+                lines.append(f"{self.name}_bucket{label_text} {count}")
+            label_text = _label_text(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {snapshot['sum']}")
+            lines.append(f"{self.name}_count{label_text} {snapshot['count']}")
+        return lines
+
+
+def render():
+    """Every registered family in the Prometheus text exposition format."""
+    lines = []
+    for family in REGISTRY:
+        lines.append(f"# HELP {family.name} {family.help}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        lines.extend(family.samples())
+    return "\n".join(lines) + "\n"
+
+
+# ---------- per-query instrumentation ----------
+
+QUERY_LATENCY = HistogramFamily(
+    "theater_query_duration_seconds",
+    "Time to execute a named query and fetch its rows.",
+    labels=("query",),
+)
+QUERY_ROWS = Counter(
+    "theater_query_rows_total",
+    "Rows returned (reads) or affected (writes) by a named query.",
+    labels=("query",),
+)
+QUERY_ERRORS = Counter(
+    "theater_query_errors_total",
+    "Named query executions that raised.",
+    labels=("query",),
+)
+POOL_WAIT = HistogramFamily(
+    "theater_db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    labels=("pool",),
+)
+REQUEST_LATENCY = HistogramFamily(
+    "theater_http_request_duration_seconds",
+    "HTTP request latency per route template, until the response body is sent.",
+    labels=("method", "route", "status"),
+)
+
+# Queries slower than this are logged with their SQL and parameters.
+# SLOW_QUERY_MS=0 logs every query, a negative value turns the log off.
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "500"))
+# Longer parameter lists (bulk inserts) are cut off in the log
+SLOW_QUERY_MAX_PARAMS_CHARS = 500
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+# Callbacks run with (name, sql, params) before every tracked query,
+# see capture_queries()
+_query_observers = []
+
+
+class _QueryRecord:
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows = 0
+
+
+@contextmanager
+def track_query(name, sql=None, params=None):
+    """
+    Time the block as one execution of query `name`.
+
+    Set `.rows` on the yielded record to count rows. Also usable in async
+    code around awaited cursor calls:
+
+        with metrics.track_query("reports.movie_profit", query, params) as q:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            q.rows = len(rows)
+    """
+    for observer in _query_observers:
+        observer(name, sql, params)
+    record = _QueryRecord()
+    started = time.perf_counter()
+    try:
+        yield record
+    except Exception:
+        QUERY_ERRORS.inc(name)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        QUERY_LATENCY.observe(elapsed, name)
+        if record.rows:
+            QUERY_ROWS.inc(name, amount=record.rows)
+        if 0 <= SLOW_QUERY_MS <= elapsed * 1000:
+            _log_slow_query(name, elapsed, record.rows, sql, params)
+
+
+@contextmanager
+def capture_queries():
+    """
+    Collect (name, sql, params) for every tracked query run in the block,
+    e.g. to EXPLAIN the SQL a handler really sends (scripts.check_query_plans).
+    """
+    captured = []
+
+    def observer(name, sql, params):
+        captured.append((name, sql, params))
+
+    _query_observers.append(observer)
+    try:
+        yield captured
+    finally:
+        _query_observers.remove(observer)
+
+
+def _log_slow_query(name, elapsed, rows, sql, params):
+    params_text = repr(params)
+    if len(params_text) > SLOW_QUERY_MAX_PARAMS_CHARS:
+        params_text = params_text[:SLOW_QUERY_MAX_PARAMS_CHARS] + "..."
+    slow_query_logger.warning(
+        "slow query %s: %.1f ms, %d rows | %s | params=%s",
+        name,
+        elapsed * 1000,
+        rows,
+        " ".join(str(sql).split()) if sql else "-",
+        params_text,
+    )
+
+
+def execute(cursor, name, sql, params=()):
+    """cursor.execute() recorded as `name`; counts affected rows for writes."""
+    with track_query(name, sql, params) as record:
+        cursor.execute(sql, params)
+        record.rows = max(cursor.rowcount, 0)
+
+
+def executemany(cursor, name, sql, seq_params):
+    """cursor.executemany() recorded as `name`."""
+    with track_query(name, sql, f"<{len(seq_params)} rows>") as record:
+        cursor.executemany(sql, seq_params)
+        record.rows = max(cursor.rowcount, 0)
+
+
+def fetchall(cursor, name, sql, params=()):
+    """cursor.execute() + fetchall() recorded as `name`."""
+    with track_query(name, sql, params) as record:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        record.rows = len(rows)
+    return rows
+
+
+def fetchone(cursor, name, sql, params=()):
+    """cursor.execute() + fetchone() recorded as `name`."""
+    with track_query(name, sql, params) as record:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+        record.rows = 0 if row is None else 1
+    return row
+
+
+def callproc(cursor, name, procedure, args):
+    """cursor.callproc() recorded as `name`."""
+    with track_query(name, f"CALL {procedure}", args):
+        return cursor.callproc(procedure, args)
+
+
+# aiomysql cursors: the same helpers with awaited cursor calls
+
+
+async def fetchall_async(cursor, name, sql, params=()):
+    with track_query(name, sql, params) as record:
+        await cursor.execute(sql, params)
+        rows = await cursor.fetchall()
+        record.rows = len(rows)
+    return rows
+
+
+async def fetchone_async(cursor, name, sql, params=()):
+    with track_query(name, sql, params) as record:
+        await cursor.execute(sql, params)
+        row = await cursor.fetchone()
+        record.rows = 0 if row is None else 1
+    return row
+
+
+async def callproc_async(cursor, name, procedure, args):
+    with track_query(name, f"CALL {procedure}", args):
+        return await cursor.callproc(procedure, args)
+
+
+# ---------- per-route request latency ----------
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware recording REQUEST_LATENCY. Routes are labelled by their
+    template (/api/reports/showtime-availability/{id} style), never the raw
+    path, so the label set stays small; unrouted requests (static files,
+    404s) share the "other" label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", None) or "other"
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - started, scope["method"], route, str(status)
+            )
@@ -1,14 +1,33 @@
-from .entities import MovieRead, ShowtimeRead, CustomerRead, TicketSaleRead
+from .entities import (
+    MovieRead,
+    ShowtimeRead,
+    CustomerRead,
+    TicketSaleRead,
+    TicketSalePage,
+)
 from .report_models import (
     MessageResponse,
     MovieShowtime,
+    MovieTitleSuggestion,
     ShowtimeAvailability,
     ConcessionCategoryRevenue,
+    ConcessionCubeCell,
     MovieLifetimeSales,
     UpcomingShowtime,
     TicketPurchaseRequest,
     TicketPurchaseResponse,
+    GroupTicketPurchaseLine,
+    GroupTicketPurchaseRequest,
+    GroupTicketPurchaseResponse,
+    ShowtimeCreate,
+    BulkShowtimeRequest,
+    ShowtimeConflict,
+    BulkShowtimeResponse,
     DailyTicketSales,
+    SalesSeriesPoint,
     MovieProfit,
+    MovieProfitLeaderboardEntry,
     CustomerTicketHistoryEntry,
-)
\ No newline at end of file
+    CustomerTicketHistoryPage,
+    DashboardBundle,
+)
@@ -1,4 +1,5 @@
 from datetime import datetime, date
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -48,3 +49,18 @@ class TicketSaleRead(BaseModel):
     showtime_id: int = Field(..., example=1)
     ticket_price: float = Field(..., example=15.00)
     time_ticket_sold: datetime = Field(..., example="2025-11-04T10:15:00")
+
+
+class TicketSalePage(BaseModel):
+    """
+    One page of ticket sales, newest first.
+    Pass next_cursor back as ?cursor= to get the following page.
+    """
+
+    items: List[TicketSaleRead]
+    limit: int = Field(..., example=50)
+    next_cursor: Optional[str] = Field(
+        None,
+        example="MjAyNS0xMS0yMFQxNDowMDowMHw1",
+        description="Opaque cursor for the next page; null on the last page",
+    )
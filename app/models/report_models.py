@@ -1,6 +1,8 @@
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, model_validator
+
+from .entities import MovieRead, ShowtimeRead, TicketSaleRead
 
 
 # ---------- Generic message / status ----------
@@ -29,6 +31,22 @@ class MovieShowtime(BaseModel):
     end_time: datetime = Field(..., example="2025-11-05T20:12:00")
 
 
+# ---------- General: movie title suggestions (for /movies/suggest) ----------
+
+
+class MovieTitleSuggestion(BaseModel):
+    """A movie whose title matches a (possibly misspelled) search."""
+
+    movie_id: int = Field(..., example=1)
+    title: str = Field(..., example="Minecraft")
+    match: Literal["exact", "prefix", "fuzzy"] = Field(
+        ..., example="fuzzy", description="How the search matched the title"
+    )
+    distance: int = Field(
+        ..., example=1, description="Edits between search and title (0 unless fuzzy)"
+    )
+
+
 # ---------- Query showtime availability ----------
 
 
@@ -57,6 +75,26 @@ class ConcessionCategoryRevenue(BaseModel):
     total_revenue: float = Field(..., example=1234.50)
 
 
+# ---------- Analytic: concession cube (ConcessionSalesCube) ----------
+
+
+class ConcessionCubeCell(BaseModel):
+    """
+    Concession units and revenue for one combination of the requested
+    dimensions. Dimensions that weren't requested are null.
+    Used in: /api/reports/concessions/cube
+    """
+
+    sales_date: Optional[date] = Field(None, example="2025-11-07")
+    weekday: Optional[int] = Field(
+        None, ge=0, le=6, example=4, description="0 = Monday ... 6 = Sunday"
+    )
+    hour: Optional[int] = Field(None, ge=0, le=23, example=19)
+    category: Optional[str] = Field(None, example="Popcorn")
+    units: int = Field(..., example=86)
+    revenue: float = Field(..., example=559.00)
+
+
 # ---------- Query lifetime ticket sales for movie ----------
 
 
@@ -109,6 +147,118 @@ class TicketPurchaseResponse(MessageResponse):
     pass
 
 
+# ---------- Operation: group ticket purchase ----------
+
+# Most tickets a single group purchase may book
+MAX_GROUP_TICKETS = 100
+
+
+class GroupTicketPurchaseLine(BaseModel):
+    """N tickets for one customer at one showtime."""
+
+    customer_id: int = Field(..., example=1)
+    showtime_id: int = Field(..., example=5)
+    quantity: int = Field(1, ge=1, le=MAX_GROUP_TICKETS, example=12)
+
+
+class GroupTicketPurchaseRequest(BaseModel):
+    """
+    Request body for a group purchase. Either give customer_id, showtime_id
+    and quantity directly, or a list of such lines. All lines succeed or
+    none do.
+    """
+
+    customer_id: Optional[int] = Field(None, example=1)
+    showtime_id: Optional[int] = Field(None, example=5)
+    quantity: Optional[int] = Field(None, ge=1, le=MAX_GROUP_TICKETS, example=12)
+    lines: List[GroupTicketPurchaseLine] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _normalize_lines(self):
+        single = (self.customer_id, self.showtime_id, self.quantity)
+        if any(v is not None for v in single):
+            if self.lines:
+                raise ValueError("Give either customer_id/showtime_id/quantity or lines, not both")
+            if self.customer_id is None or self.showtime_id is None:
+                raise ValueError("customer_id and showtime_id are required")
+            self.lines = [
+                GroupTicketPurchaseLine(
+                    customer_id=self.customer_id,
+                    showtime_id=self.showtime_id,
+                    quantity=self.quantity or 1,
+                )
+            ]
+        if not self.lines:
+            raise ValueError("At least one purchase line is required")
+        if sum(line.quantity for line in self.lines) > MAX_GROUP_TICKETS:
+            raise ValueError(f"At most {MAX_GROUP_TICKETS} tickets per group purchase")
+        return self
+
+
+class GroupTicketPurchaseResponse(MessageResponse):
+    """Response after a successful group purchase."""
+
+    tickets_purchased: int = Field(..., example=12)
+
+
+# ---------- Operation: bulk showtime import ----------
+
+# Most showtimes a single bulk import may create
+MAX_BULK_SHOWTIMES = 2000
+
+
+class ShowtimeCreate(BaseModel):
+    """One showtime to schedule."""
+
+    movie_id: int = Field(..., example=1)
+    theater_id: int = Field(..., example=3)
+    start_time: datetime = Field(..., example="2025-11-12T18:00:00")
+    end_time: datetime = Field(..., example="2025-11-12T20:12:00")
+    status: Literal["Scheduled", "In Progress", "Completed", "Canceled"] = Field(
+        "Scheduled", example="Scheduled"
+    )
+
+    @model_validator(mode="after")
+    def _check_times(self):
+        # Showtimes are stored as naive local time; an offset (e.g. "Z") can't
+        # be compared with them, or with naive rows in the same request
+        if self.start_time.tzinfo is not None or self.end_time.tzinfo is not None:
+            raise ValueError(
+                "start_time and end_time must be local times without a UTC offset"
+            )
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
+
+
+class BulkShowtimeRequest(BaseModel):
+    """Request body for importing a schedule in one go."""
+
+    showtimes: List[ShowtimeCreate] = Field(
+        ..., min_length=1, max_length=MAX_BULK_SHOWTIMES
+    )
+
+
+class ShowtimeConflict(BaseModel):
+    """
+    A showtime in the request that overlaps another one in the same
+    auditorium, either elsewhere in the request or already scheduled.
+    """
+
+    index: int = Field(..., example=4, description="Position in the request")
+    theater_id: int = Field(..., example=3)
+    start_time: datetime = Field(..., example="2025-11-12T18:00:00")
+    end_time: datetime = Field(..., example="2025-11-12T20:12:00")
+    conflicts_with_index: Optional[int] = Field(None, example=1)
+    conflicts_with_showtime_id: Optional[int] = Field(None, example=None)
+
+
+class BulkShowtimeResponse(MessageResponse):
+    """Response after a successful bulk import."""
+
+    showtimes_created: int = Field(..., example=500)
+
+
 # ---------- Optional analytic: daily ticket sales (function) ----------
 
 
@@ -119,6 +269,24 @@ class DailyTicketSales(BaseModel):
     tickets_sold: int = Field(..., example=42)
 
 
+# ---------- Analytic: sales time series (DailySalesRollup) ----------
+
+
+class SalesSeriesPoint(BaseModel):
+    """Ticket and concession sales for one day, week or month."""
+
+    period_start: date = Field(..., example="2025-11-03")
+    tickets_sold: int = Field(..., example=312)
+    ticket_revenue: float = Field(..., example=4056.00)
+    concession_revenue: float = Field(..., example=1874.50)
+    total_revenue: float = Field(..., example=5930.50)
+    partial: bool = Field(
+        False,
+        example=False,
+        description="Only part of the period lies within from/to",
+    )
+
+
 # ---------- Optional analytic: movie profit (function) ----------
 
 
@@ -130,6 +298,21 @@ class MovieProfit(BaseModel):
     net_profit: float = Field(..., example=5432.10)
 
 
+# ---------- Analytic: profit leaderboard (DailySalesRollup) ----------
+
+
+class MovieProfitLeaderboardEntry(BaseModel):
+    """One movie's ticket revenue, distributor fee and net profit."""
+
+    rank: int = Field(..., example=1)
+    movie_id: int = Field(..., example=2)
+    title: str = Field(..., example="Tron")
+    tickets_sold: int = Field(..., example=512)
+    ticket_revenue: float = Field(..., example=6656.00)
+    distributor_fee: float = Field(..., example=1223.90)
+    net_profit: float = Field(..., example=5432.10)
+
+
 # ---------- General: customer ticket history (for /customers/{id}/tickets) ----------
 
 
@@ -147,3 +330,31 @@ class CustomerTicketHistoryEntry(BaseModel):
     start_time: datetime = Field(..., example="2025-11-05T18:00:00")
     ticket_price: float = Field(..., example=15.00)
     time_ticket_sold: datetime = Field(..., example="2025-11-04T10:15:00")
+
+
+class CustomerTicketHistoryPage(BaseModel):
+    """
+    One page of a customer's ticket history, newest first.
+    Pass next_cursor back as ?cursor= to get the following page.
+    """
+
+    items: List[CustomerTicketHistoryEntry]
+    limit: int = Field(..., example=50)
+    next_cursor: Optional[str] = Field(
+        None,
+        example="MjAyNS0xMS0yMFQxNDowMDowMHw1",
+        description="Opaque cursor for the next page; null on the last page",
+    )
+
+
+# ---------- General: dashboard bundle (for /dashboard) ----------
+
+
+class DashboardBundle(BaseModel):
+    """Everything the dashboard needs on first load, in one response."""
+
+    now_playing: List[MovieRead]
+    upcoming: List[MovieRead]
+    movies: List[MovieRead]
+    showtimes: List[ShowtimeRead]
+    tickets_today: List[TicketSaleRead]
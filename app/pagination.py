@@ -0,0 +1,30 @@
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+
+# Page size bounds shared by the paginated endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(sold_at: datetime, sale_id: int) -> str:
+    """
+    Build an opaque keyset cursor for the (TimeTicketSold, TicketSaleID)
+    position of the last row on a page.
+    """
+    raw = f"{sold_at.isoformat()}|{sale_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str):
+    """
+    Inverse of encode_cursor. Returns (sold_at, sale_id).
+    Raises HTTPException(400) for anything that isn't a cursor we issued.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sold_at, sale_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(sold_at), int(sale_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
@@ -0,0 +1,262 @@
+import threading
+import time
+
+import mysql.connector
+
+from app.metrics import Histogram
+from app.statements import StatementRegistry
+
+
+class PoolError(Exception):
+    """Base class for connection pool errors."""
+
+
+class PoolTimeoutError(PoolError):
+    """No connection became free within the acquire timeout."""
+
+
+class PoolQueueFullError(PoolError):
+    """Too many callers are already waiting for a connection."""
+
+
+class _PoolEntry:
+    """A raw connection plus the bookkeeping the pool needs for it."""
+
+    __slots__ = ("conn", "created_at", "last_used_at", "statements")
+
+    def __init__(self, conn):
+        now = time.monotonic()
+        self.conn = conn
+        self.created_at = now
+        self.last_used_at = now
+        self.statements = None  # StatementRegistry, created on first use
+
+
+class PooledConnection:
+    """
+    Handed out by ConnectionPool.get_connection().
+
+    Behaves like the underlying mysql.connector connection, except close()
+    returns it to the pool instead of closing the socket (same contract as
+    mysql.connector's own PooledMySQLConnection, so router code is unchanged).
+    """
+
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+
+    def __getattr__(self, name):
+        entry = self.__dict__.get("_entry")
+        if entry is None:
+            raise AttributeError(f"connection already returned to pool: {name}")
+        return getattr(entry.conn, name)
+
+    @property
+    def statements(self):
+        """
+        Prepared statements of the underlying connection (app.statements).
+        They outlive this checkout and go away with the connection.
+        """
+        entry = self.__dict__.get("_entry")
+        if entry is None:
+            raise AttributeError("connection already returned to pool: statements")
+        if entry.statements is None:
+            entry.statements = StatementRegistry(entry.conn)
+        return entry.statements
+
+    def close(self):
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            self._pool._release(entry)
+
+    def discard(self):
+        """
+        Close the underlying socket and free the pool slot. Used when the
+        connection is mid-result (e.g. an aborted streaming export) and
+        draining the remaining rows would cost more than reconnecting.
+        """
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            self._pool._release(entry, discard=True)
+
+
+class ConnectionPool:
+    """
+    Fixed-size MySQL connection pool with a bounded wait queue.
+
+    Differences from mysql.connector's MySQLConnectionPool:
+    - When every connection is busy, callers wait (up to `acquire_timeout`)
+      instead of failing immediately. At most `max_waiters` callers may wait.
+    - Connections idle for longer than `ping_after` are pinged on checkout and
+      replaced if dead.
+    - Connections older than `max_age` are closed and reopened.
+    - Live counters and an acquire-latency histogram are exposed via stats().
+    """
+
+    def __init__(
+        self,
+        size,
+        max_waiters,
+        acquire_timeout,
+        max_age,
+        ping_after,
+        **dbconfig,
+    ):
+        self.size = size
+        self.max_waiters = max_waiters
+        self.acquire_timeout = acquire_timeout
+        self.max_age = max_age
+        self.ping_after = ping_after
+        self._dbconfig = dbconfig
+
+        self._cond = threading.Condition()
+        self._idle = []  # LIFO stack of _PoolEntry, keeps hot connections warm
+        self._open = 0  # connections opened (idle + in use)
+        self._in_use = 0
+        self._waiters = 0
+
+        self._acquired = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._recycled = 0
+        self._health_failures = 0
+        self.acquire_latency = Histogram()
+
+    # ---------- checkout / return ----------
+
+    def get_connection(self, timeout=None):
+        """Check out a connection, waiting for a free slot if necessary."""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        with self._cond:
+            if not self._idle and self._open >= self.size:
+                if self._waiters >= self.max_waiters:
+                    self._rejected += 1
+                    raise PoolQueueFullError(
+                        f"Connection pool wait queue is full ({self.max_waiters} waiting)"
+                    )
+                self._waiters += 1
+                try:
+                    while not self._idle and self._open >= self.size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timeouts += 1
+                            raise PoolTimeoutError(
+                                f"Timed out after {timeout:.1f}s waiting for a DB connection"
+                            )
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+            if self._idle:
+                entry = self._idle.pop()
+            else:
+                entry = None
+                self._open += 1  # reserve the slot before connecting
+            self._in_use += 1
+
+        # Network work happens outside the lock
+        try:
+            entry = self._prepare(entry)
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._acquired += 1
+        self.acquire_latency.observe(time.monotonic() - started)
+        return PooledConnection(self, entry)
+
+    def _prepare(self, entry):
+        """Open a new connection, or validate/recycle an idle one."""
+        if entry is None:
+            return _PoolEntry(mysql.connector.connect(**self._dbconfig))
+
+        now = time.monotonic()
+        if now - entry.created_at >= self.max_age:
+            self._close_quietly(entry)
+            with self._cond:
+                self._recycled += 1
+            return _PoolEntry(mysql.connector.connect(**self._dbconfig))
+
+        if now - entry.last_used_at >= self.ping_after:
+            try:
+                entry.conn.ping(reconnect=False)
+            except mysql.connector.Error:
+                self._close_quietly(entry)
+                with self._cond:
+                    self._health_failures += 1
+                return _PoolEntry(mysql.connector.connect(**self._dbconfig))
+
+        return entry
+
+    def _release(self, entry, discard=False):
+        """Return a connection to the idle stack (or drop it if unusable)."""
+        conn = entry.conn
+        keep = not discard
+        try:
+            # Never hand the next caller a half-read result or an open
+            # transaction (which would also pin an old read snapshot).
+            if keep and conn.unread_result:
+                conn.consume_results()
+            if keep and conn.in_transaction:
+                conn.rollback()
+        except Exception:
+            keep = False
+
+        if keep and time.monotonic() - entry.created_at >= self.max_age:
+            keep = False
+            with self._cond:
+                self._recycled += 1
+
+        if not keep:
+            self._close_quietly(entry)
+
+        with self._cond:
+            self._in_use -= 1
+            if keep:
+                entry.last_used_at = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._open -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(entry):
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+    # ---------- introspection ----------
+
+    def load(self):
+        """Busy fraction (in use + waiting) / size, for least-loaded routing."""
+        with self._cond:
+            return (self._in_use + self._waiters) / self.size
+
+    def stats(self):
+        """Snapshot of pool state, used by /health/pool."""
+        with self._cond:
+            snapshot = {
+                "size": self.size,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiters": self._waiters,
+                "max_waiters": self.max_waiters,
+                "acquire_timeout_s": self.acquire_timeout,
+                "max_age_s": self.max_age,
+                "acquired_total": self._acquired,
+                "timeouts_total": self._timeouts,
+                "rejected_total": self._rejected,
+                "recycled_total": self._recycled,
+                "health_check_failures_total": self._health_failures,
+            }
+        snapshot["acquire_latency_s"] = self.acquire_latency.snapshot()
+        return snapshot
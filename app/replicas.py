@@ -0,0 +1,152 @@
+import itertools
+import logging
+import threading
+import time
+
+import mysql.connector
+
+from app.pool import PoolError
+
+logger = logging.getLogger(__name__)
+
+
+class Replica:
+    """A replica's pool plus its last measured replication lag."""
+
+    __slots__ = ("name", "pool", "lag", "checked_at", "error")
+
+    def __init__(self, name, pool):
+        self.name = name
+        self.pool = pool
+        self.lag = None  # seconds behind the primary, None = unknown/broken
+        self.checked_at = 0.0
+        self.error = "not checked yet"
+
+
+class ReplicaSet:
+    """
+    Read replicas behind get_read_connection().
+
+    A daemon thread polls every replica's lag (SHOW REPLICA STATUS) every
+    `lag_interval` seconds, starting on the first read. A caller passes its
+    staleness budget and gets a connection to a replica whose last measured
+    lag fits it, or None when no replica qualifies (the caller then uses the
+    primary). Replicas that are stopped, unreachable or haven't been
+    measured for 3 intervals don't qualify.
+
+    `selection` is "least_loaded" (lowest pool utilisation first) or
+    "round_robin".
+    """
+
+    def __init__(self, replicas, selection, lag_interval, acquire_timeout):
+        if selection not in ("least_loaded", "round_robin"):
+            raise ValueError(
+                f"Unknown replica selection {selection!r} "
+                "(expected least_loaded or round_robin)"
+            )
+        self.replicas = replicas
+        self.selection = selection
+        self.lag_interval = lag_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._rotation = itertools.count()
+        self._monitor = None
+        self._monitor_lock = threading.Lock()
+
+    # ---------- lag monitoring ----------
+
+    def _start_monitor(self):
+        with self._monitor_lock:
+            if self._monitor is None:
+                self._monitor = threading.Thread(
+                    target=self._watch_lag, name="replica-lag", daemon=True
+                )
+                self._monitor.start()
+
+    def _watch_lag(self):
+        while True:
+            for replica in self.replicas:
+                self._check(replica)
+            time.sleep(self.lag_interval)
+
+    def _check(self, replica):
+        conn = None
+        cursor = None
+        try:
+            conn = replica.pool.get_connection(timeout=self.lag_interval)
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute("SHOW REPLICA STATUS")
+            except mysql.connector.Error:
+                # MySQL < 8.0.22
+                cursor.execute("SHOW SLAVE STATUS")
+            status = cursor.fetchone()
+            if status is None:
+                lag, error = None, "replication is not configured"
+            else:
+                lag = status.get(
+                    "Seconds_Behind_Source", status.get("Seconds_Behind_Master")
+                )
+                # NULL while the SQL/IO thread is stopped
+                error = None if lag is not None else "replication is stopped"
+        except Exception as e:
+            lag, error = None, str(e)
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if conn is not None:
+                conn.close()
+
+        if error is not None and error != replica.error:
+            logger.warning("replica %s not used for reads: %s", replica.name, error)
+        replica.lag = lag
+        replica.error = error
+        replica.checked_at = time.monotonic()
+
+    def lag(self, replica):
+        """Last measured lag in seconds, or None if unknown or out of date."""
+        if time.monotonic() - replica.checked_at > 3 * self.lag_interval:
+            return None
+        return replica.lag
+
+    # ---------- routing ----------
+
+    def _candidates(self, max_staleness):
+        fresh = []
+        for replica in self.replicas:
+            lag = self.lag(replica)
+            if lag is not None and lag <= max_staleness:
+                fresh.append(replica)
+        if self.selection == "least_loaded":
+            fresh.sort(key=lambda replica: replica.pool.load())
+        elif fresh:
+            start = next(self._rotation) % len(fresh)
+            fresh = fresh[start:] + fresh[:start]
+        return fresh
+
+    def get_connection(self, max_staleness):
+        """
+        (replica name, connection) from a replica at most `max_staleness`
+        seconds behind, or (None, None) if none is fresh enough or free.
+        """
+        self._start_monitor()
+        for replica in self._candidates(max_staleness):
+            try:
+                return replica.name, replica.pool.get_connection(
+                    timeout=self.acquire_timeout
+                )
+            except (PoolError, mysql.connector.Error):
+                # Saturated or unreachable: try the next one, then the primary
+                continue
+        return None, None
+
+    def stats(self):
+        """Per-replica lag and pool state, used by /health/pool."""
+        return {
+            replica.name: {
+                "lag_s": self.lag(replica),
+                "error": replica.error,
+                **replica.pool.stats(),
+            }
+            for replica in self.replicas
+        }
@@ -0,0 +1,60 @@
+"""
+Storage backends for the catalog and ticketing endpoints.
+
+DB_BACKEND=mysql (default) uses the connection pool in app.db.
+DB_BACKEND=sqlite runs on an in-process SQLite database instead (SQLITE_PATH,
+default in-memory), seeded from scripts/seed_data.sql unless SQLITE_SEED=0.
+"""
+
+import os
+import threading
+
+from app.repository.base import PurchaseRejected, TheaterRepository, UnknownShowtime
+
+DB_BACKEND = os.getenv("DB_BACKEND", "mysql").lower()
+SQLITE_PATH = os.getenv("SQLITE_PATH", ":memory:")
+SQLITE_SEED = os.getenv("SQLITE_SEED", "1") == "1"
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def _create():
+    if DB_BACKEND == "sqlite":
+        from app.repository.sqlite import SQLiteRepository
+
+        repo = SQLiteRepository(SQLITE_PATH)
+        if SQLITE_SEED and not repo.list_movies():
+            repo.load_seed()
+        return repo
+    if DB_BACKEND == "mysql":
+        from app.repository.mysql import MySQLRepository
+
+        return MySQLRepository()
+    raise ValueError(f"Unknown DB_BACKEND {DB_BACKEND!r} (expected mysql or sqlite)")
+
+
+def get_repository() -> TheaterRepository:
+    """The process-wide repository, created on first use."""
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = _create()
+    return _repository
+
+
+def set_repository(repo: TheaterRepository):
+    """Swap the backend (e.g. a fresh SQLiteRepository per benchmark run)."""
+    global _repository
+    _repository = repo
+
+
+__all__ = [
+    "DB_BACKEND",
+    "PurchaseRejected",
+    "TheaterRepository",
+    "UnknownShowtime",
+    "get_repository",
+    "set_repository",
+]
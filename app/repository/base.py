@@ -0,0 +1,178 @@
+from abc import ABC, abstractmethod
+
+
+class PurchaseRejected(Exception):
+    """
+    A ticket purchase broke a business rule (sold out, show in progress,
+    unknown customer, ...). str(exc) is the message shown to the client.
+
+    Group purchases set `showtime_id` to the showtime that failed its check,
+    and `sold_out` when that showtime has no seats left.
+    """
+
+    def __init__(self, message, showtime_id=None, sold_out=False):
+        super().__init__(message)
+        self.showtime_id = showtime_id
+        self.sold_out = sold_out
+
+
+class UnknownShowtime(PurchaseRejected):
+    """A group purchase named a showtime that doesn't exist."""
+
+
+def group_purchase_problem(show, wanted):
+    """
+    Process_Ticket_Purchase's rules for booking `wanted` tickets at once.
+
+    `show` has start_time, end_time, is_sold_out, tickets_sold, seat_capacity
+    and now (all times in the backend's own representation, compared with
+    each other only). Returns the rejection message, or None if it's fine.
+    """
+    if show["is_sold_out"]:
+        return "Sold out"
+    if show["now"] > show["end_time"]:
+        return "Show completed"
+    if show["start_time"] <= show["now"] <= show["end_time"]:
+        return "Show in progress"
+    if show["tickets_sold"] + wanted > show["seat_capacity"]:
+        remaining = show["seat_capacity"] - show["tickets_sold"]
+        return f"Auditorium full ({remaining} seats left, {wanted} requested)"
+    return None
+
+
+# Customers.CustomerID is a signed INT
+MAX_CUSTOMER_ID = 2**31 - 1
+
+
+def like_prefix(text):
+    """LIKE pattern matching values that start with `text` (escape is \\)."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+def name_prefixes(query):
+    """
+    (first word, rest) of a name search as LIKE prefixes; rest is None for a
+    single word.
+    """
+    first, _, rest = query.strip().partition(" ")
+    rest = rest.strip()
+    return like_prefix(first), like_prefix(rest) if rest else None
+
+
+def customer_id_term(query):
+    """
+    The query as a CustomerID, or None if it isn't one: ASCII digits only
+    (str.isdigit also accepts "²") within the signed INT column range.
+    """
+    query = query.strip()
+    if not (query.isascii() and query.isdigit()):
+        return None
+    customer_id = int(query)
+    return customer_id if customer_id <= MAX_CUSTOMER_ID else None
+
+
+class TheaterRepository(ABC):
+    """
+    Storage interface for the hot catalog and ticketing paths.
+
+    List methods return plain dicts keyed like the API models, with
+    JSON-ready values (float prices, bool flags, datetime/date objects), so
+    callers can either build Pydantic models or encode them directly.
+    Every method is abstract, so a backend missing one fails when it is
+    instantiated rather than on the first request that needs it.
+    """
+
+    @abstractmethod
+    def ping(self):
+        """Raise if the backend is unreachable."""
+
+    # ---------- catalog ----------
+
+    @abstractmethod
+    def list_movies(self):
+        """All movies ordered by title."""
+
+    @abstractmethod
+    def list_now_playing_movies(self):
+        """Movies with IsActive = 1, ordered by title."""
+
+    @abstractmethod
+    def list_upcoming_movies(self):
+        """Movies with a ReleaseDate after today, soonest first."""
+
+    @abstractmethod
+    def list_customers(self):
+        """All customers ordered by ID."""
+
+    @abstractmethod
+    def search_customers(self, query, limit):
+        """
+        Up to `limit` customers whose first or last name starts with `query`
+        (case-insensitive), ordered by name. "John Sm" matches first name
+        John* with last name Sm* (or the reverse); digits also match the ID.
+        """
+
+    @abstractmethod
+    def list_showtimes(self):
+        """All showtimes ordered by start time."""
+
+    # ---------- showtimes ----------
+
+    @abstractmethod
+    def showtime_availability(self, showtime_id):
+        """Capacity / sold / remaining for one showtime, or None if unknown."""
+
+    @abstractmethod
+    def upcoming_showtimes(self, days_ahead=None):
+        """Rows of UpcomingShowtimesView, optionally capped to days_ahead."""
+
+    @abstractmethod
+    def ticket_counts(self, showtime_id):
+        """
+        seat_capacity, the TicketsSold counter and ticket_rows (a real
+        COUNT(*) of its TicketSales) for one showtime, or None if unknown.
+        Used to check the counter against the rows after load tests.
+        """
+
+    # ---------- tickets ----------
+
+    @abstractmethod
+    def tickets_sold_today(self):
+        """Ticket sales with today's date, oldest first."""
+
+    @abstractmethod
+    def list_tickets(self, limit, after=None):
+        """
+        Up to `limit` ticket sales, newest first by (time_ticket_sold,
+        ticket_sale_id). `after` is the (time_ticket_sold, ticket_sale_id) of
+        the last row of the previous page (keyset pagination).
+        """
+
+    @abstractmethod
+    def customer_ticket_history(self, customer_id, limit, after=None):
+        """
+        Up to `limit` of a customer's tickets with movie title, auditorium and
+        start time, newest first; `after` works as in list_tickets().
+        """
+
+    @abstractmethod
+    def purchase_ticket(self, customer_id, showtime_id, read_availability=False):
+        """
+        Book one ticket with Process_Ticket_Purchase semantics and commit.
+
+        Raises PurchaseRejected on a rule violation. With read_availability,
+        returns (tickets_sold, seat_capacity) as of the commit, else None.
+        """
+
+    @abstractmethod
+    def purchase_tickets(self, lines):
+        """
+        Book several tickets in one transaction, all or nothing.
+
+        `lines` are (customer_id, showtime_id, quantity). The showtimes are
+        locked and group_purchase_problem() is checked once per showtime
+        against the total quantity asked for it. Raises UnknownShowtime or
+        PurchaseRejected; returns {showtime_id: (tickets_sold, seat_capacity)}
+        as of the commit.
+        """
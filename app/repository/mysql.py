@@ -0,0 +1,515 @@
+import mysql.connector
+
+from app import fastjson, metrics, statements
+from app.db import LIVE_MAX_STALENESS, get_connection, get_read_connection
+from app.repository.base import (
+    PurchaseRejected,
+    TheaterRepository,
+    UnknownShowtime,
+    customer_id_term,
+    group_purchase_problem,
+    name_prefixes,
+)
+
+# (name, converter) in SELECT column order, see fastjson.records()
+_MOVIE_FIELDS = (
+    ("movie_id", None),
+    ("title", None),
+    ("genre", None),
+    ("runtime", None),
+    ("release_date", None),
+    ("price", float),
+    # IsActive is stored as TINYINT(1) (either 0 or 1) so we convert to bool for clarity
+    ("is_active", bool),
+    ("distributor_id", None),
+)
+_MOVIE_COLUMNS = """
+    MovieID       AS movie_id,
+    Title         AS title,
+    Genre         AS genre,
+    Runtime       AS runtime,
+    ReleaseDate   AS release_date,
+    Price         AS price,
+    IsActive      AS is_active,
+    DistributorID AS distributor_id
+"""
+
+_CUSTOMER_FIELDS = (
+    ("customer_id", None),
+    ("fname", None),
+    ("lname", None),
+    ("membership_status", bool),
+)
+_CUSTOMER_COLUMNS = """
+    CustomerID       AS customer_id,
+    FName            AS fname,
+    LName            AS lname,
+    MembershipStatus AS membership_status
+"""
+_SHOWTIME_FIELDS = (
+    ("showtime_id", None),
+    ("movie_id", None),
+    ("theater_id", None),
+    ("start_time", None),
+    ("end_time", None),
+)
+_AVAILABILITY_FIELDS = (
+    ("showtime_id", None),
+    ("seat_capacity", None),
+    ("tickets_sold", None),
+    ("seats_remaining", None),
+)
+_UPCOMING_SHOWTIME_FIELDS = (
+    ("showtime_id", None),
+    ("movie_id", None),
+    ("movie_title", None),
+    ("theater_id", None),
+    ("start_time", None),
+    ("end_time", None),
+    ("is_sold_out", bool),
+    ("dynamic_status", None),
+)
+_TICKET_SALE_FIELDS = (
+    ("ticket_sale_id", None),
+    ("customer_id", None),
+    ("showtime_id", None),
+    ("ticket_price", float),
+    ("time_ticket_sold", None),
+)
+_TICKET_SALE_COLUMNS = """
+    TicketSaleID   AS ticket_sale_id,
+    CustomerID     AS customer_id,
+    ShowtimeID     AS showtime_id,
+    TicketPrice    AS ticket_price,
+    TimeTicketSold AS time_ticket_sold
+"""
+_HISTORY_FIELDS = (
+    ("ticket_sale_id", None),
+    ("movie_title", None),
+    ("showtime_id", None),
+    ("theater_id", None),
+    ("start_time", None),
+    ("ticket_price", float),
+    ("time_ticket_sold", None),
+)
+_TICKET_COUNT_FIELDS = (
+    ("seat_capacity", None),
+    ("tickets_sold", None),
+    ("ticket_rows", None),
+)
+
+
+class MySQLRepository(TheaterRepository):
+    """
+    The production backend: pooled mysql-connector connections, the stored
+    procedure, triggers and views from scripts/define_db.sql. Reads use
+    plain tuple cursors (C extension) and fastjson.records() for the dicts.
+    Reads that pass `max_staleness` may be served by a replica; hot lookups
+    pass prepared=True to reuse a server-side prepared statement.
+    """
+
+    def _fetch(
+        self, name, query, params=(), fields=None, max_staleness=None, prepared=False
+    ):
+        conn = None
+        cursor = None
+
+        try:
+            if max_staleness is None:
+                conn = get_connection()
+            else:
+                conn = get_read_connection(max_staleness)
+            if prepared:
+                rows = statements.fetchall(conn, name, query, params)
+            else:
+                cursor = conn.cursor()
+                rows = metrics.fetchall(cursor, name, query, params)
+            return fastjson.records(rows, fields)
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if conn is not None:
+                conn.close()
+
+    def ping(self):
+        self._fetch("health.ping", "SELECT 1", fields=(("ok", None),))
+
+    # ---------- catalog ----------
+
+    def list_movies(self):
+        return self._fetch(
+            "movies.list",
+            f"SELECT {_MOVIE_COLUMNS} FROM Movies ORDER BY Title",
+            fields=_MOVIE_FIELDS,
+        )
+
+    def list_now_playing_movies(self):
+        return self._fetch(
+            "movies.now_playing",
+            f"SELECT {_MOVIE_COLUMNS} FROM Movies WHERE IsActive = 1 ORDER BY Title",
+            fields=_MOVIE_FIELDS,
+        )
+
+    def list_upcoming_movies(self):
+        return self._fetch(
+            "movies.upcoming",
+            f"""
+            SELECT {_MOVIE_COLUMNS}
+            FROM Movies
+            WHERE ReleaseDate > CURDATE()
+            ORDER BY ReleaseDate ASC
+            """,
+            fields=_MOVIE_FIELDS,
+        )
+
+    def list_customers(self):
+        return self._fetch(
+            "customers.list",
+            """
+            SELECT
+                CustomerID       AS customer_id,
+                FName            AS fname,
+                LName            AS lname,
+                MembershipStatus AS membership_status
+            FROM Customers
+            ORDER BY CustomerID
+            """,
+            fields=_CUSTOMER_FIELDS,
+        )
+
+    def search_customers(self, query, limit):
+        # One branch per name column so each is a prefix range scan on its
+        # covering index (idx_customers_fname / idx_customers_lname) that
+        # stops after `limit` rows, instead of an OR over the whole table
+        first, rest = name_prefixes(query)
+        by_fname = "FName LIKE %s" + (" AND LName LIKE %s" if rest else "")
+        by_lname = "LName LIKE %s" + (" AND FName LIKE %s" if rest else "")
+        terms = (first, rest) if rest else (first,)
+        branches = [
+            f"(SELECT {_CUSTOMER_COLUMNS} FROM Customers WHERE {by_fname}"
+            " ORDER BY FName, LName LIMIT %s)",
+            f"(SELECT {_CUSTOMER_COLUMNS} FROM Customers WHERE {by_lname}"
+            " ORDER BY LName, FName LIMIT %s)",
+        ]
+        params = [*terms, limit, *terms, limit]
+        customer_id = customer_id_term(query)
+        if customer_id is not None:
+            branches.append(
+                f"(SELECT {_CUSTOMER_COLUMNS} FROM Customers WHERE CustomerID = %s)"
+            )
+            params.append(customer_id)
+
+        return self._fetch(
+            "customers.search",
+            f"""
+            SELECT customer_id, fname, lname, membership_status
+            FROM ({" UNION ".join(branches)}) matches
+            ORDER BY fname, lname, customer_id
+            LIMIT %s
+            """,
+            (*params, limit),
+            fields=_CUSTOMER_FIELDS,
+        )
+
+    def list_showtimes(self):
+        return self._fetch(
+            "showtimes.list",
+            """
+            SELECT
+                ShowtimeID AS showtime_id,
+                MovieID    AS movie_id,
+                TheaterID  AS theater_id,
+                StartTime  AS start_time,
+                EndTime    AS end_time
+            FROM Showtimes
+            ORDER BY StartTime
+            """,
+            fields=_SHOWTIME_FIELDS,
+        )
+
+    # ---------- showtimes ----------
+
+    def showtime_availability(self, showtime_id):
+        rows = self._fetch(
+            "reports.showtime_availability",
+            """
+            SELECT
+                s.ShowtimeID                      AS showtime_id,
+                a.SeatCapacity                    AS seat_capacity,
+                s.TicketsSold                     AS tickets_sold,
+                (a.SeatCapacity - s.TicketsSold)  AS seats_remaining
+            FROM Showtimes s
+            JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+            WHERE s.ShowtimeID = %s
+            """,
+            (showtime_id,),
+            fields=_AVAILABILITY_FIELDS,
+            max_staleness=LIVE_MAX_STALENESS,
+            prepared=True,
+        )
+        return rows[0] if rows else None
+
+    def upcoming_showtimes(self, days_ahead=None):
+        query = """
+            SELECT
+                ShowtimeID    AS showtime_id,
+                MovieID       AS movie_id,
+                MovieTitle    AS movie_title,
+                TheaterID     AS theater_id,
+                StartTime     AS start_time,
+                EndTime       AS end_time,
+                IsSoldOut     AS is_sold_out,
+                DynamicStatus AS dynamic_status
+            FROM UpcomingShowtimesView
+        """
+        params = ()
+        if days_ahead is not None:
+            # View already filters out past showtimes- simply cap them by days_ahead
+            query += " WHERE StartTime <= DATE_ADD(NOW(), INTERVAL %s DAY)"
+            params = (days_ahead,)
+        query += " ORDER BY StartTime"
+        return self._fetch(
+            "reports.upcoming_showtimes",
+            query,
+            params,
+            fields=_UPCOMING_SHOWTIME_FIELDS,
+            max_staleness=LIVE_MAX_STALENESS,
+        )
+
+    def ticket_counts(self, showtime_id):
+        rows = self._fetch(
+            "showtimes.ticket_counts",
+            """
+            SELECT
+                a.SeatCapacity,
+                s.TicketsSold,
+                (SELECT COUNT(*) FROM TicketSales t WHERE t.ShowtimeID = s.ShowtimeID)
+            FROM Showtimes s
+            JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+            WHERE s.ShowtimeID = %s
+            """,
+            (showtime_id,),
+            fields=_TICKET_COUNT_FIELDS,
+        )
+        return rows[0] if rows else None
+
+    # ---------- tickets ----------
+
+    def tickets_sold_today(self):
+        # Half-open range on TimeTicketSold (not DATE(...)) so MySQL can range
+        # scan idx_ticketsales_sold_at
+        return self._fetch(
+            "tickets.today",
+            f"""
+            SELECT {_TICKET_SALE_COLUMNS}
+            FROM TicketSales
+            WHERE TimeTicketSold >= CURDATE()
+              AND TimeTicketSold < CURDATE() + INTERVAL 1 DAY
+            ORDER BY TimeTicketSold ASC
+            """,
+            fields=_TICKET_SALE_FIELDS,
+        )
+
+    def list_tickets(self, limit, after=None):
+        # Keyset pagination (no OFFSET) served by idx_ticketsales_sold_at, so
+        # page N costs the same as page 1 regardless of table size
+        query = f"SELECT {_TICKET_SALE_COLUMNS} FROM TicketSales"
+        params = []
+        if after is not None:
+            sold_at, sale_id = after
+            query += """
+            WHERE TimeTicketSold < %s
+               OR (TimeTicketSold = %s AND TicketSaleID < %s)
+            """
+            params += [sold_at, sold_at, sale_id]
+        query += " ORDER BY TimeTicketSold DESC, TicketSaleID DESC LIMIT %s"
+        params.append(limit)
+        return self._fetch("tickets.list", query, params, fields=_TICKET_SALE_FIELDS)
+
+    def customer_ticket_history(self, customer_id, limit, after=None):
+        # Keyset pagination served by idx_ticketsales_customer_sold_at
+        query = """
+            SELECT
+                ts.TicketSaleID   AS ticket_sale_id,
+                m.Title      AS movie_title,
+                ts.ShowtimeID   AS showtime_id,
+                s.TheaterID    AS theater_id,
+                s.StartTime    AS start_time,
+                ts.TicketPrice  AS ticket_price,
+                ts.TimeTicketSold AS time_ticket_sold
+            FROM TicketSales ts
+            JOIN Showtimes s ON ts.ShowtimeID = s.ShowtimeID
+            JOIN Movies    m ON s.MovieID    = m.MovieID
+            WHERE ts.CustomerID = %s
+        """
+        params = [customer_id]
+        if after is not None:
+            sold_at, sale_id = after
+            query += """
+              AND (ts.TimeTicketSold < %s
+                   OR (ts.TimeTicketSold = %s AND ts.TicketSaleID < %s))
+            """
+            params += [sold_at, sold_at, sale_id]
+        query += " ORDER BY ts.TimeTicketSold DESC, ts.TicketSaleID DESC LIMIT %s"
+        params.append(limit)
+        # First page and keyset pages are two fixed texts, so both get
+        # prepared once per pooled connection and reused
+        return self._fetch(
+            "tickets.customer_history",
+            query,
+            params,
+            fields=_HISTORY_FIELDS,
+            prepared=True,
+        )
+
+    def purchase_ticket(self, customer_id, showtime_id, read_availability=False):
+        conn = None
+        cursor = None
+
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
+
+            # Call stored procedure defined in SQL:
+            # CREATE PROCEDURE Process_Ticket_Purchase(IN p_CustomerID INT, IN p_ShowtimeID INT) ...
+            metrics.callproc(
+                cursor,
+                "tickets.purchase",
+                "Process_Ticket_Purchase",
+                [customer_id, showtime_id],
+            )
+
+            # Read the new counter while the procedure's row lock is still held
+            state = None
+            if read_availability:
+                state = metrics.fetchone(
+                    cursor,
+                    "tickets.purchase.availability",
+                    """
+                    SELECT s.TicketsSold, a.SeatCapacity
+                    FROM Showtimes s
+                    JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+                    WHERE s.ShowtimeID = %s
+                    """,
+                    (showtime_id,),
+                )
+
+            # If we reach here, the procedure completed without SIGNAL / errors
+            conn.commit()
+            return state
+        except mysql.connector.Error as e:
+            # Errors raised with SIGNAL inside the procedure/triggers will show up here;
+            # e.msg will usually contain the MESSAGE_TEXT set in SIGNAL.
+            if conn:
+                conn.rollback()
+            raise PurchaseRejected(getattr(e, "msg", str(e)) or str(e))
+        except Exception:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if conn is not None:
+                conn.close()
+
+    def purchase_tickets(self, lines):
+        wanted = {}
+        for _, showtime_id, quantity in lines:
+            wanted[showtime_id] = wanted.get(showtime_id, 0) + quantity
+        showtime_ids = sorted(wanted)
+
+        conn = None
+        cursor = None
+
+        try:
+            conn = get_connection()
+            cursor = conn.cursor(dictionary=True)
+
+            # Lock in ShowtimeID order so concurrent group purchases can't deadlock
+            placeholders = ", ".join(["%s"] * len(showtime_ids))
+            locked = metrics.fetchall(
+                cursor,
+                "tickets.purchase_batch.lock_showtimes",
+                f"""
+                SELECT
+                    s.ShowtimeID   AS showtime_id,
+                    s.StartTime    AS start_time,
+                    s.EndTime      AS end_time,
+                    s.IsSoldOut    AS is_sold_out,
+                    s.TicketsSold  AS tickets_sold,
+                    a.SeatCapacity AS seat_capacity,
+                    m.Price        AS price,
+                    NOW()          AS now
+                FROM Showtimes s
+                JOIN Movies m ON s.MovieID = m.MovieID
+                JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+                WHERE s.ShowtimeID IN ({placeholders})
+                ORDER BY s.ShowtimeID
+                FOR UPDATE OF s
+                """,
+                showtime_ids,
+            )
+            showtimes = {row["showtime_id"]: row for row in locked}
+
+            for showtime_id in showtime_ids:
+                show = showtimes.get(showtime_id)
+                if show is None:
+                    raise UnknownShowtime(
+                        f"showtime {showtime_id} not found", showtime_id
+                    )
+                problem = group_purchase_problem(show, wanted[showtime_id])
+                if problem:
+                    raise PurchaseRejected(
+                        problem,
+                        showtime_id,
+                        sold_out=bool(show["is_sold_out"])
+                        or show["tickets_sold"] >= show["seat_capacity"],
+                    )
+
+            # executemany() on a plain INSERT is sent as one multi-row INSERT;
+            # the triggers still run per row and keep TicketsSold/IsSoldOut right
+            rows = [
+                (
+                    customer_id,
+                    showtime_id,
+                    showtimes[showtime_id]["price"],
+                    showtimes[showtime_id]["now"],
+                )
+                for customer_id, showtime_id, quantity in sorted(
+                    lines, key=lambda line: line[1]
+                )
+                for _ in range(quantity)
+            ]
+            metrics.executemany(
+                cursor,
+                "tickets.purchase_batch.insert",
+                """
+                INSERT INTO TicketSales (CustomerID, ShowtimeID, TicketPrice, TimeTicketSold)
+                VALUES (%s, %s, %s, %s)
+                """,
+                rows,
+            )
+
+            conn.commit()
+            return {
+                showtime_id: (
+                    show["tickets_sold"] + wanted[showtime_id],
+                    show["seat_capacity"],
+                )
+                for showtime_id, show in showtimes.items()
+            }
+        except mysql.connector.Error as e:
+            # Trigger SIGNALs and FK violations (unknown customer) end up here
+            if conn:
+                conn.rollback()
+            raise PurchaseRejected(getattr(e, "msg", str(e)) or str(e))
+        except Exception:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if conn is not None:
+                conn.close()
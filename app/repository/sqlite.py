@@ -0,0 +1,662 @@
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+from app import fastjson, metrics
+from app.repository.base import (
+    PurchaseRejected,
+    TheaterRepository,
+    UnknownShowtime,
+    customer_id_term,
+    group_purchase_problem,
+    name_prefixes,
+)
+
+SEED_FILE = Path(__file__).resolve().parents[2] / "scripts" / "seed_data.sql"
+
+# Datetimes are stored as 'YYYY-MM-DD HH:MM:SS' text (same as MySQL's literal
+# format), so string comparison orders them correctly
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _datetime(value):
+    return datetime.strptime(value, _TIME_FORMAT)
+
+
+def _now():
+    return datetime.now().strftime(_TIME_FORMAT)
+
+
+def _keyset(after):
+    """Keyset cursor (datetime, id) with the time in the stored text format."""
+    sold_at, sale_id = after
+    return sold_at.strftime(_TIME_FORMAT), sale_id
+
+
+# The subset of scripts/define_db.sql the repository reads and writes, with
+# the triggers and view translated to SQLite. Keep the two in step.
+SCHEMA = """
+CREATE TABLE Auditoriums (
+    TheaterID INTEGER PRIMARY KEY,
+    ProjType TEXT NOT NULL CHECK (ProjType IN ('2D', '3D', 'IMAX')),
+    SeatCapacity INTEGER NOT NULL
+);
+
+CREATE TABLE Distributors (
+    DistributorID INTEGER PRIMARY KEY,
+    DistributorName TEXT NOT NULL,
+    DistributionFee REAL NOT NULL
+);
+
+CREATE TABLE Movies (
+    MovieID INTEGER PRIMARY KEY,
+    Title TEXT NOT NULL,
+    Genre TEXT NOT NULL,
+    Runtime INTEGER NOT NULL,
+    ReleaseDate TEXT NOT NULL,
+    Price REAL NOT NULL,
+    IsActive INTEGER NOT NULL,
+    DistributorID INTEGER NOT NULL REFERENCES Distributors(DistributorID)
+);
+
+CREATE TABLE Showtimes (
+    ShowtimeID INTEGER PRIMARY KEY,
+    MovieID INTEGER NOT NULL REFERENCES Movies(MovieID),
+    TheaterID INTEGER NOT NULL REFERENCES Auditoriums(TheaterID),
+    StartTime TEXT NOT NULL,
+    EndTime TEXT NOT NULL,
+    Status TEXT NOT NULL
+        CHECK (Status IN ('Scheduled', 'In Progress', 'Completed', 'Canceled')),
+    IsSoldOut INTEGER NOT NULL DEFAULT 0,
+    TicketsSold INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE Customers (
+    CustomerID INTEGER PRIMARY KEY,
+    FName TEXT NOT NULL,
+    LName TEXT,
+    MembershipStatus INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE TicketSales (
+    TicketSaleID INTEGER PRIMARY KEY,
+    CustomerID INTEGER NOT NULL REFERENCES Customers(CustomerID),
+    ShowtimeID INTEGER NOT NULL REFERENCES Showtimes(ShowtimeID),
+    TicketPrice REAL NOT NULL,
+    TimeTicketSold TEXT NOT NULL
+);
+
+CREATE TABLE Concessions (
+    ConcessionID INTEGER PRIMARY KEY,
+    ConcessionPrice REAL NOT NULL,
+    Category TEXT NOT NULL CHECK (Category IN ('Meal','Popcorn','Beverage','Snack'))
+);
+
+CREATE TABLE ConcessionSales (
+    ConcessionSaleID INTEGER PRIMARY KEY,
+    CustomerID INTEGER NOT NULL REFERENCES Customers(CustomerID),
+    ConcessionID INTEGER NOT NULL REFERENCES Concessions(ConcessionID),
+    TimeConcessionSold TEXT NOT NULL
+);
+
+CREATE INDEX idx_ticketsales_sold_at
+    ON TicketSales (TimeTicketSold, TicketSaleID, CustomerID, ShowtimeID, TicketPrice);
+CREATE INDEX idx_showtimes_start ON Showtimes (StartTime);
+CREATE INDEX idx_showtimes_theater_end ON Showtimes (TheaterID, EndTime, StartTime);
+CREATE INDEX idx_movies_title ON Movies (Title);
+CREATE INDEX idx_customers_fname ON Customers (FName, LName, MembershipStatus);
+CREATE INDEX idx_customers_lname ON Customers (LName, FName, MembershipStatus);
+
+-- UpdateShowtimeStatus: SQLite evaluates every SET expression against the
+-- old row, so IsSoldOut sees the count before this ticket (as in MySQL)
+CREATE TRIGGER UpdateShowtimeStatus
+AFTER INSERT ON TicketSales
+FOR EACH ROW
+BEGIN
+    UPDATE Showtimes
+    SET IsSoldOut = CASE
+            WHEN TicketsSold + 1 >= (
+                SELECT A.SeatCapacity FROM Auditoriums A
+                WHERE A.TheaterID = Showtimes.TheaterID
+            ) THEN 1
+            ELSE IsSoldOut
+        END,
+        TicketsSold = TicketsSold + 1
+    WHERE ShowtimeID = NEW.ShowtimeID;
+END;
+
+CREATE TRIGGER EnforceShowtimeOverlap
+BEFORE INSERT ON Showtimes
+FOR EACH ROW
+BEGIN
+    SELECT RAISE(ABORT, 'Error: Scheduling conflict.')
+    WHERE EXISTS (
+        SELECT 1 FROM Showtimes S
+        WHERE S.TheaterID = NEW.TheaterID
+          AND NEW.StartTime < S.EndTime
+          AND NEW.EndTime > S.StartTime
+    );
+END;
+
+CREATE TRIGGER PreventInvalidTicketSales
+BEFORE INSERT ON TicketSales
+FOR EACH ROW
+BEGIN
+    SELECT RAISE(ABORT, 'Error: Sold out.')
+    FROM Showtimes WHERE ShowtimeID = NEW.ShowtimeID AND IsSoldOut = 1;
+
+    SELECT RAISE(ABORT, 'Error: Show completed.')
+    FROM Showtimes WHERE ShowtimeID = NEW.ShowtimeID AND NEW.TimeTicketSold > EndTime;
+
+    SELECT RAISE(ABORT, 'Error: Show in progress.')
+    FROM Showtimes
+    WHERE ShowtimeID = NEW.ShowtimeID
+      AND NEW.TimeTicketSold BETWEEN StartTime AND EndTime;
+END;
+
+CREATE VIEW UpcomingShowtimesView AS
+SELECT
+    s.ShowtimeID,
+    s.MovieID,
+    m.Title AS MovieTitle,
+    s.TheaterID,
+    s.StartTime,
+    s.EndTime,
+    s.IsSoldOut,
+    CASE
+        WHEN IsSoldOut = 1 THEN 'Sold Out'
+        WHEN datetime('now', 'localtime') < StartTime THEN 'Scheduled'
+        WHEN datetime('now', 'localtime') BETWEEN StartTime AND EndTime THEN 'In Progress'
+        ELSE 'Unknown'
+    END AS DynamicStatus
+FROM Showtimes s
+JOIN Movies m ON s.MovieID = m.MovieID
+WHERE s.EndTime > datetime('now', 'localtime');
+"""
+
+_MOVIE_FIELDS = (
+    ("movie_id", None),
+    ("title", None),
+    ("genre", None),
+    ("runtime", None),
+    ("release_date", date.fromisoformat),
+    ("price", None),
+    ("is_active", bool),
+    ("distributor_id", None),
+)
+_MOVIE_COLUMNS = """
+    MovieID, Title, Genre, Runtime, ReleaseDate, Price, IsActive, DistributorID
+"""
+_CUSTOMER_FIELDS = (
+    ("customer_id", None),
+    ("fname", None),
+    ("lname", None),
+    ("membership_status", bool),
+)
+_SHOWTIME_FIELDS = (
+    ("showtime_id", None),
+    ("movie_id", None),
+    ("theater_id", None),
+    ("start_time", _datetime),
+    ("end_time", _datetime),
+)
+_AVAILABILITY_FIELDS = (
+    ("showtime_id", None),
+    ("seat_capacity", None),
+    ("tickets_sold", None),
+    ("seats_remaining", None),
+)
+_UPCOMING_SHOWTIME_FIELDS = (
+    ("showtime_id", None),
+    ("movie_id", None),
+    ("movie_title", None),
+    ("theater_id", None),
+    ("start_time", _datetime),
+    ("end_time", _datetime),
+    ("is_sold_out", bool),
+    ("dynamic_status", None),
+)
+_TICKET_SALE_FIELDS = (
+    ("ticket_sale_id", None),
+    ("customer_id", None),
+    ("showtime_id", None),
+    ("ticket_price", None),
+    ("time_ticket_sold", _datetime),
+)
+_HISTORY_FIELDS = (
+    ("ticket_sale_id", None),
+    ("movie_title", None),
+    ("showtime_id", None),
+    ("theater_id", None),
+    ("start_time", _datetime),
+    ("ticket_price", None),
+    ("time_ticket_sold", _datetime),
+)
+_TICKET_COUNT_FIELDS = (
+    ("seat_capacity", None),
+    ("tickets_sold", None),
+    ("ticket_rows", None),
+)
+
+# Tables created by SCHEMA; INSERTs into anything else in the seed file
+# (rollups, cube) are skipped
+_TABLES = {
+    "Auditoriums",
+    "Distributors",
+    "Movies",
+    "Showtimes",
+    "Customers",
+    "TicketSales",
+    "Concessions",
+    "ConcessionSales",
+}
+_INSERT_TABLE = re.compile(r"^\s*INSERT\s+INTO\s+(\w+)", re.IGNORECASE)
+
+
+class SQLiteRepository(TheaterRepository):
+    """
+    In-process backend on the standard library's sqlite3, for benchmarks and
+    load tests without a MySQL server.
+
+    The triggers (TicketsSold / sold-out flag, overlap and sale checks) and
+    UpcomingShowtimesView are recreated in SQLite; Process_Ticket_Purchase is
+    reproduced in purchase_ticket() with the same rules and messages.
+
+    One connection is shared by all threads and serialized with a lock, which
+    also stands in for the procedure's FOR UPDATE row lock.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        # isolation_level=None: no implicit transactions, purchase_ticket()
+        # issues BEGIN IMMEDIATE / COMMIT itself
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Showtimes'"
+        ).fetchone()
+        if not exists:
+            self._conn.executescript(SCHEMA)
+
+    def load_seed(self, path=SEED_FILE):
+        """
+        Run the INSERT statements of scripts/seed_data.sql (the MySQL-only
+        DELETE / ALTER / USE lines are skipped). Triggers fire as in MySQL,
+        so TicketsSold and IsSoldOut come out the same.
+        """
+        statements = [
+            stmt
+            for stmt in Path(path).read_text().split(";")
+            if (match := _INSERT_TABLE.match(re.sub(r"--[^\n]*", "", stmt)))
+            and match.group(1) in _TABLES
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for stmt in statements:
+                    self._conn.execute(stmt)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def execute(self, query, params=()):
+        """Run one write statement in its own transaction (scripts, setup)."""
+        with self._lock:
+            return self._conn.execute(query, params).lastrowid
+
+    def _fetch(self, name, query, params=(), fields=None):
+        with self._lock:
+            rows = metrics.fetchall(self._conn.cursor(), name, query, params)
+        return fastjson.records(rows, fields)
+
+    def ping(self):
+        self._fetch("health.ping", "SELECT 1", fields=(("ok", None),))
+
+    # ---------- catalog ----------
+
+    def list_movies(self):
+        return self._fetch(
+            "movies.list",
+            f"SELECT {_MOVIE_COLUMNS} FROM Movies ORDER BY Title",
+            fields=_MOVIE_FIELDS,
+        )
+
+    def list_now_playing_movies(self):
+        return self._fetch(
+            "movies.now_playing",
+            f"SELECT {_MOVIE_COLUMNS} FROM Movies WHERE IsActive = 1 ORDER BY Title",
+            fields=_MOVIE_FIELDS,
+        )
+
+    def list_upcoming_movies(self):
+        return self._fetch(
+            "movies.upcoming",
+            f"""
+            SELECT {_MOVIE_COLUMNS}
+            FROM Movies
+            WHERE ReleaseDate > date('now', 'localtime')
+            ORDER BY ReleaseDate ASC
+            """,
+            fields=_MOVIE_FIELDS,
+        )
+
+    def list_customers(self):
+        return self._fetch(
+            "customers.list",
+            """
+            SELECT CustomerID, FName, LName, MembershipStatus
+            FROM Customers
+            ORDER BY CustomerID
+            """,
+            fields=_CUSTOMER_FIELDS,
+        )
+
+    def search_customers(self, query, limit):
+        # SQLite only allows ORDER BY / LIMIT per UNION branch in subqueries
+        first, rest = name_prefixes(query)
+        by_fname = "FName LIKE ? ESCAPE '\\'" + (
+            " AND LName LIKE ? ESCAPE '\\'" if rest else ""
+        )
+        by_lname = "LName LIKE ? ESCAPE '\\'" + (
+            " AND FName LIKE ? ESCAPE '\\'" if rest else ""
+        )
+        terms = (first, rest) if rest else (first,)
+        columns = "CustomerID, FName, LName, MembershipStatus"
+        branches = [
+            f"SELECT * FROM (SELECT {columns} FROM Customers WHERE {by_fname}"
+            " ORDER BY FName, LName LIMIT ?)",
+            f"SELECT * FROM (SELECT {columns} FROM Customers WHERE {by_lname}"
+            " ORDER BY LName, FName LIMIT ?)",
+        ]
+        params = [*terms, limit, *terms, limit]
+        customer_id = customer_id_term(query)
+        if customer_id is not None:
+            branches.append(f"SELECT {columns} FROM Customers WHERE CustomerID = ?")
+            params.append(customer_id)
+
+        return self._fetch(
+            "customers.search",
+            f"""
+            SELECT * FROM ({" UNION ".join(branches)})
+            ORDER BY FName, LName, CustomerID
+            LIMIT ?
+            """,
+            (*params, limit),
+            fields=_CUSTOMER_FIELDS,
+        )
+
+    def list_showtimes(self):
+        return self._fetch(
+            "showtimes.list",
+            """
+            SELECT ShowtimeID, MovieID, TheaterID, StartTime, EndTime
+            FROM Showtimes
+            ORDER BY StartTime
+            """,
+            fields=_SHOWTIME_FIELDS,
+        )
+
+    # ---------- showtimes ----------
+
+    def showtime_availability(self, showtime_id):
+        rows = self._fetch(
+            "reports.showtime_availability",
+            """
+            SELECT
+                s.ShowtimeID,
+                a.SeatCapacity,
+                s.TicketsSold,
+                (a.SeatCapacity - s.TicketsSold)
+            FROM Showtimes s
+            JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+            WHERE s.ShowtimeID = ?
+            """,
+            (showtime_id,),
+            fields=_AVAILABILITY_FIELDS,
+        )
+        return rows[0] if rows else None
+
+    def upcoming_showtimes(self, days_ahead=None):
+        query = """
+            SELECT
+                ShowtimeID, MovieID, MovieTitle, TheaterID,
+                StartTime, EndTime, IsSoldOut, DynamicStatus
+            FROM UpcomingShowtimesView
+        """
+        params = ()
+        if days_ahead is not None:
+            query += " WHERE StartTime <= datetime('now', 'localtime', ? || ' days')"
+            params = (f"+{days_ahead}",)
+        query += " ORDER BY StartTime"
+        return self._fetch(
+            "reports.upcoming_showtimes",
+            query,
+            params,
+            fields=_UPCOMING_SHOWTIME_FIELDS,
+        )
+
+    def ticket_counts(self, showtime_id):
+        rows = self._fetch(
+            "showtimes.ticket_counts",
+            """
+            SELECT
+                a.SeatCapacity,
+                s.TicketsSold,
+                (SELECT COUNT(*) FROM TicketSales t WHERE t.ShowtimeID = s.ShowtimeID)
+            FROM Showtimes s
+            JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+            WHERE s.ShowtimeID = ?
+            """,
+            (showtime_id,),
+            fields=_TICKET_COUNT_FIELDS,
+        )
+        return rows[0] if rows else None
+
+    # ---------- tickets ----------
+
+    def tickets_sold_today(self):
+        return self._fetch(
+            "tickets.today",
+            """
+            SELECT TicketSaleID, CustomerID, ShowtimeID, TicketPrice, TimeTicketSold
+            FROM TicketSales
+            WHERE TimeTicketSold >= date('now', 'localtime')
+              AND TimeTicketSold < date('now', 'localtime', '+1 day')
+            ORDER BY TimeTicketSold ASC
+            """,
+            fields=_TICKET_SALE_FIELDS,
+        )
+
+    def list_tickets(self, limit, after=None):
+        query = """
+            SELECT TicketSaleID, CustomerID, ShowtimeID, TicketPrice, TimeTicketSold
+            FROM TicketSales
+        """
+        params = []
+        if after is not None:
+            sold_at, sale_id = _keyset(after)
+            query += """
+            WHERE TimeTicketSold < ?
+               OR (TimeTicketSold = ? AND TicketSaleID < ?)
+            """
+            params += [sold_at, sold_at, sale_id]
+        query += " ORDER BY TimeTicketSold DESC, TicketSaleID DESC LIMIT ?"
+        params.append(limit)
+        return self._fetch("tickets.list", query, params, fields=_TICKET_SALE_FIELDS)
+
+    def customer_ticket_history(self, customer_id, limit, after=None):
+        query = """
+            SELECT
+                ts.TicketSaleID, m.Title, ts.ShowtimeID, s.TheaterID,
+                s.StartTime, ts.TicketPrice, ts.TimeTicketSold
+            FROM TicketSales ts
+            JOIN Showtimes s ON ts.ShowtimeID = s.ShowtimeID
+            JOIN Movies    m ON s.MovieID    = m.MovieID
+            WHERE ts.CustomerID = ?
+        """
+        params = [customer_id]
+        if after is not None:
+            sold_at, sale_id = _keyset(after)
+            query += """
+              AND (ts.TimeTicketSold < ?
+                   OR (ts.TimeTicketSold = ? AND ts.TicketSaleID < ?))
+            """
+            params += [sold_at, sold_at, sale_id]
+        query += " ORDER BY ts.TimeTicketSold DESC, ts.TicketSaleID DESC LIMIT ?"
+        params.append(limit)
+        return self._fetch(
+            "tickets.customer_history", query, params, fields=_HISTORY_FIELDS
+        )
+
+    def purchase_ticket(self, customer_id, showtime_id, read_availability=False):
+        """Process_Ticket_Purchase, step for step (see scripts/define_db.sql)."""
+        args = (customer_id, showtime_id)
+        with self._lock, metrics.track_query(
+            "tickets.purchase", "Process_Ticket_Purchase", args
+        ):
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = _now()
+                show = conn.execute(
+                    """
+                    SELECT s.StartTime, s.EndTime, s.IsSoldOut, s.TicketsSold,
+                           a.SeatCapacity, m.Price
+                    FROM Showtimes s
+                    JOIN Movies m ON s.MovieID = m.MovieID
+                    JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+                    WHERE s.ShowtimeID = ?
+                    """,
+                    (showtime_id,),
+                ).fetchone()
+                if show is None:
+                    # MySQL gets here too and fails the INSERT on the foreign key
+                    raise PurchaseRejected("Unknown showtime")
+                start, end, sold_out, sold, capacity, price = show
+
+                if sold_out:
+                    raise PurchaseRejected("Sold out")
+                if now > end:
+                    raise PurchaseRejected("Show completed")
+                if start <= now <= end:
+                    raise PurchaseRejected("Show in progress")
+                if sold >= capacity:
+                    raise PurchaseRejected("Auditorium full")
+
+                conn.execute(
+                    """
+                    INSERT INTO TicketSales (CustomerID, ShowtimeID, TicketPrice, TimeTicketSold)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (customer_id, showtime_id, price, now),
+                )
+
+                state = None
+                if read_availability:
+                    state = (sold + 1, capacity)
+
+                conn.execute("COMMIT")
+                return state
+            except sqlite3.IntegrityError as e:
+                # RAISE(ABORT, ...) in the triggers and foreign key failures
+                conn.execute("ROLLBACK")
+                raise PurchaseRejected(str(e))
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def purchase_tickets(self, lines):
+        """
+        The group purchase with the same checks as the MySQL backend; the
+        repository lock stands in for the FOR UPDATE on the showtimes.
+        """
+        wanted = {}
+        for _, showtime_id, quantity in lines:
+            wanted[showtime_id] = wanted.get(showtime_id, 0) + quantity
+        showtime_ids = sorted(wanted)
+
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = _now()
+                placeholders = ", ".join(["?"] * len(showtime_ids))
+                locked = metrics.fetchall(
+                    conn.cursor(),
+                    "tickets.purchase_batch.lock_showtimes",
+                    f"""
+                    SELECT s.ShowtimeID, s.StartTime, s.EndTime, s.IsSoldOut,
+                           s.TicketsSold, a.SeatCapacity, m.Price
+                    FROM Showtimes s
+                    JOIN Movies m ON s.MovieID = m.MovieID
+                    JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+                    WHERE s.ShowtimeID IN ({placeholders})
+                    """,
+                    showtime_ids,
+                )
+                showtimes = {
+                    row[0]: {
+                        "start_time": row[1],
+                        "end_time": row[2],
+                        "is_sold_out": row[3],
+                        "tickets_sold": row[4],
+                        "seat_capacity": row[5],
+                        "price": row[6],
+                        "now": now,
+                    }
+                    for row in locked
+                }
+
+                for showtime_id in showtime_ids:
+                    show = showtimes.get(showtime_id)
+                    if show is None:
+                        raise UnknownShowtime(
+                            f"showtime {showtime_id} not found", showtime_id
+                        )
+                    problem = group_purchase_problem(show, wanted[showtime_id])
+                    if problem:
+                        raise PurchaseRejected(
+                            problem,
+                            showtime_id,
+                            sold_out=bool(show["is_sold_out"])
+                            or show["tickets_sold"] >= show["seat_capacity"],
+                        )
+
+                rows = [
+                    (customer_id, showtime_id, showtimes[showtime_id]["price"], now)
+                    for customer_id, showtime_id, quantity in sorted(
+                        lines, key=lambda line: line[1]
+                    )
+                    for _ in range(quantity)
+                ]
+                metrics.executemany(
+                    conn.cursor(),
+                    "tickets.purchase_batch.insert",
+                    """
+                    INSERT INTO TicketSales (CustomerID, ShowtimeID, TicketPrice, TimeTicketSold)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+
+                conn.execute("COMMIT")
+                return {
+                    showtime_id: (
+                        show["tickets_sold"] + wanted[showtime_id],
+                        show["seat_capacity"],
+                    )
+                    for showtime_id, show in showtimes.items()
+                }
+            except sqlite3.IntegrityError as e:
+                # RAISE(ABORT, ...) in the triggers and foreign key failures
+                conn.execute("ROLLBACK")
+                raise PurchaseRejected(str(e))
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
@@ -1,8 +1,10 @@
 from typing import List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
-from app.db import get_connection
+from app.cache import TTLCache
+from app.pool import PoolError
+from app.repository import get_repository
 from app.models import CustomerRead
 
 router = APIRouter(
@@ -10,15 +12,17 @@ router = APIRouter(
     tags=["customers"],
 )
 
+# Sign-ups happen at the box office, a minute of lag in dropdowns is fine
+_customers_cache = TTLCache("customers.all", ttl=60, max_entries=1, tags=("customers",))
+
 
 @router.get(
     "",
     response_model=List[CustomerRead],
     summary="List all customers",
     description=(
-        "Returns all customers in the system. "
-        "Useful for populating dropdowns when selecting a customer "
-        "for ticket purchase or viewing ticket history."
+        "Returns all customers in the system. With many loyalty members this "
+        "is a large response; pickers should use /customers/search instead."
     ),
 )
 def list_customers():
@@ -28,37 +32,55 @@ def list_customers():
     - Output: list of all customers with their IDs, names, and membership status.
 
     Implementation notes:
-    - Simple SELECT from Customers table.
+    - Simple SELECT from Customers table (app.repository).
+    - Cached for 1 minute (customers.all).
     """
-    conn = None
-    cursor = None
-
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
+        return _customers_cache.get_or_load(
+            "all", lambda: get_repository().list_customers()
+        )
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching customers: {e}",
+        )
 
-        query = """
-            SELECT
-                CustomerID AS customer_id,
-                FName      AS fname,
-                LName      AS lname,
-                MembershipStatus AS membership_status
-            FROM Customers
-            ORDER BY CustomerID;
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()  # list[dict]
 
-        # Pydantic will validate/convert MembershipStatus (0/1) -> bool.
-        return rows
+@router.get(
+    "/search",
+    response_model=List[CustomerRead],
+    summary="Search customers by name prefix",
+    description=(
+        "Typeahead for customer pickers: customers whose first or last name "
+        "starts with q (case-insensitive), ordered by name. 'John Sm' matches "
+        "first name John* and last name Sm* (or the reverse); a number also "
+        "matches the customer ID."
+    ),
+)
+def search_customers(
+    q: str = Query(..., min_length=1, max_length=100, description="Name prefix"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of matches"),
+):
+    """
+    General endpoint:
+
+    - Input: name prefix and result limit.
+    - Output: up to `limit` matching customers.
 
+    Implementation notes:
+    - One prefix range scan per name column (idx_customers_fname,
+      idx_customers_lname), each stopping after `limit` rows, so the cost
+      depends on the limit rather than on the number of customers.
+    - Not cached: every keystroke is a different query.
+    """
+    try:
+        return get_repository().search_customers(q, limit)
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Error fetching customers: {e}",
+            detail=f"Error searching customers: {e}",
         )
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
@@ -0,0 +1,70 @@
+import asyncio
+import os
+from functools import partial
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from app.db import pool
+from app.models import DashboardBundle
+from app.routers import movies, showtimes, tickets
+
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["dashboard"],
+)
+
+# How many dashboard queries may hold a pooled connection at once, across all
+# requests. Defaults to the pool size so a burst of page loads queues here
+# instead of timing out in the pool.
+DASHBOARD_CONCURRENCY = int(os.getenv("DASHBOARD_CONCURRENCY", str(pool.size)))
+_query_slots = asyncio.Semaphore(DASHBOARD_CONCURRENCY)
+
+# section -> existing handler that produces it. Handlers are called directly,
+# so Query() parameters must be passed explicitly.
+_SECTIONS = {
+    "now_playing": movies.get_now_playing_movies,
+    "upcoming": movies.get_upcoming_movies,
+    "movies": partial(movies.list_movies, fast=False),
+    "showtimes": showtimes.list_showtimes,
+    "tickets_today": tickets.get_tickets_sold_today,
+}
+
+
+async def _load(name, handler):
+    async with _query_slots:
+        try:
+            return await run_in_threadpool(handler)
+        except HTTPException as e:
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=f"Dashboard section '{name}' failed: {e.detail}",
+            )
+
+
+@router.get(
+    "",
+    response_model=DashboardBundle,
+    summary="Dashboard overview in one request",
+    description=(
+        "Returns now playing, upcoming and all movies, showtimes and today's "
+        "tickets together. The sections are loaded concurrently, "
+        "so the response takes about as long as the slowest one."
+    ),
+)
+async def get_dashboard():
+    """
+    General endpoint:
+
+    - Output: DashboardBundle with every section the dashboard shows on load.
+
+    Implementation notes:
+    - Reuses the existing handlers (and their caches), each run in the
+      threadpool; at most DASHBOARD_CONCURRENCY of them hold a pooled
+      connection at the same time.
+    - If any section fails the whole request fails with that section's error.
+    """
+    results = await asyncio.gather(
+        *(_load(name, handler) for name, handler in _SECTIONS.items())
+    )
+    return DashboardBundle(**dict(zip(_SECTIONS, results)))
@@ -0,0 +1,233 @@
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from app import metrics
+from app.db import REPORTS_MAX_STALENESS, get_read_connection
+from app.pool import PoolError
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["exports"],
+)
+
+# Rows pulled off the wire per fetchmany() call. Memory use is bounded by one
+# batch regardless of how many rows the export contains.
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _json_value(value):
+    """Match the JSON API: DECIMAL -> float, DATETIME -> ISO string."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _date_range_filter(column, start_date, end_date):
+    """
+    Half-open range predicate on `column` so the index on it can be used.
+    end_date is inclusive (the whole day is exported).
+    """
+    clauses = []
+    params = []
+    if start_date is not None:
+        clauses.append(f"{column} >= %s")
+        params.append(start_date)
+    if end_date is not None:
+        clauses.append(f"{column} < %s")
+        params.append(end_date + timedelta(days=1))
+
+    where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+    return where, params
+
+
+def _stream_export(query, params, columns, fmt, filename):
+    """
+    Run `query` on an unbuffered cursor and stream the result in fixed-size
+    fetchmany() batches as CSV or NDJSON.
+
+    The query is executed before the response starts, so SQL errors still
+    surface as a normal 500 (and a saturated pool as a 503). The connection
+    is released by a background task once the response finishes, including
+    when the client disconnects mid-stream (in which case the socket is
+    dropped rather than drained).
+    """
+    conn = None
+    cursor = None
+    state = {"finished": False}
+
+    try:
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
+        # buffered=False: rows stay on the server socket until fetched
+        cursor = conn.cursor(buffered=False)
+        # Times the query up to its first row; the rows are streamed later
+        metrics.execute(cursor, f"exports.{filename}", query, params)
+    except PoolError:
+        raise
+    except Exception as e:
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        if conn is not None:
+            conn.discard()
+        raise HTTPException(status_code=500, detail=f"Database error during export: {e}")
+
+    def generate():
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue()
+
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                break
+
+            if fmt == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                # str() of DECIMAL/DATETIME is exact and spreadsheet friendly
+                writer.writerows(rows)
+                yield buffer.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(columns, map(_json_value, row)))) + "\n"
+                    for row in rows
+                )
+
+        state["finished"] = True
+
+    def release():
+        if state["finished"]:
+            cursor.close()
+            conn.close()
+        else:
+            # Client went away part way through: don't read the rest of the rows
+            conn.discard()
+
+    return StreamingResponse(
+        generate(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+        background=BackgroundTask(release),
+    )
+
+
+@router.get(
+    "/ticket-sales",
+    summary="Export ticket sales as CSV or NDJSON",
+    description=(
+        "Streams every ticket sale in the (optional) date range, oldest first. "
+        "Rows are read from an unbuffered cursor in fixed-size batches, so "
+        "memory use stays flat no matter how large the export is."
+    ),
+)
+def export_ticket_sales(
+    start_date: Optional[date] = Query(
+        None, alias="from", description="First sale date to include (YYYY-MM-DD)"
+    ),
+    end_date: Optional[date] = Query(
+        None, alias="to", description="Last sale date to include (YYYY-MM-DD)"
+    ),
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+):
+    """
+    Export endpoint:
+
+    - Input: optional from/to dates and output format.
+    - Output: streamed file, one row per TicketSales record.
+
+    Implementation notes:
+    - Range on TimeTicketSold is served by idx_ticketsales_sold_at, which
+      also yields rows in export order (no filesort).
+    """
+    columns = [
+        "ticket_sale_id",
+        "customer_id",
+        "showtime_id",
+        "ticket_price",
+        "time_ticket_sold",
+    ]
+    where, params = _date_range_filter("TimeTicketSold", start_date, end_date)
+    query = f"""
+        SELECT
+            TicketSaleID,
+            CustomerID,
+            ShowtimeID,
+            TicketPrice,
+            TimeTicketSold
+        FROM TicketSales
+        {where}
+        ORDER BY TimeTicketSold, TicketSaleID
+    """
+    return _stream_export(query, params, columns, fmt, "ticket_sales")
+
+
+@router.get(
+    "/concession-sales",
+    summary="Export concession sales as CSV or NDJSON",
+    description=(
+        "Streams every concession sale in the (optional) date range, oldest "
+        "first, with the item's category and price. Rows are read from an "
+        "unbuffered cursor in fixed-size batches."
+    ),
+)
+def export_concession_sales(
+    start_date: Optional[date] = Query(
+        None, alias="from", description="First sale date to include (YYYY-MM-DD)"
+    ),
+    end_date: Optional[date] = Query(
+        None, alias="to", description="Last sale date to include (YYYY-MM-DD)"
+    ),
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+):
+    """
+    Export endpoint:
+
+    - Input: optional from/to dates and output format.
+    - Output: streamed file, one row per ConcessionSales record.
+
+    Implementation notes:
+    - Range on TimeConcessionSold is served by idx_concessionsales_sold_at.
+    - Concessions is joined by primary key for category and price.
+    """
+    columns = [
+        "concession_sale_id",
+        "customer_id",
+        "concession_id",
+        "category",
+        "concession_price",
+        "time_concession_sold",
+    ]
+    where, params = _date_range_filter("cs.TimeConcessionSold", start_date, end_date)
+    query = f"""
+        SELECT
+            cs.ConcessionSaleID,
+            cs.CustomerID,
+            cs.ConcessionID,
+            c.Category,
+            c.ConcessionPrice,
+            cs.TimeConcessionSold
+        FROM ConcessionSales cs
+        JOIN Concessions c ON cs.ConcessionID = c.ConcessionID
+        {where}
+        ORDER BY cs.TimeConcessionSold, cs.ConcessionSaleID
+    """
+    return _stream_export(query, params, columns, fmt, "concession_sales")
@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.live import LIVE_HEARTBEAT, hub
+
+router = APIRouter(
+    prefix="/live",
+    tags=["live"],
+)
+
+
+@router.websocket("/ws")
+async def live_websocket(websocket: WebSocket):
+    """
+    Live endpoint (WebSocket):
+
+    - Output: JSON events as they happen:
+      {"type": "availability", "showtime_id", "seat_capacity", "tickets_sold", "seats_remaining"}
+      {"type": "status", "showtime_id", "status": "Sold Out" | "In Progress" | "Completed"}
+      {"type": "ping"} after LIVE_HEARTBEAT seconds without events.
+    """
+    await websocket.accept()
+    try:
+        async with hub.subscribe() as queue:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=LIVE_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    event = {"type": "ping"}
+                await websocket.send_json(event)
+    except (WebSocketDisconnect, RuntimeError):
+        # Client went away; RuntimeError is raised when sending on a closed socket
+        pass
+
+
+@router.get(
+    "/events",
+    summary="Live seat availability and showtime status (Server-Sent Events)",
+    description=(
+        "Same events as the /api/live/ws WebSocket, as a text/event-stream "
+        "for clients that prefer EventSource."
+    ),
+)
+async def live_events(request: Request):
+    """
+    Live endpoint (SSE):
+
+    - Output: one `data: {json}` message per event, `: ping` comments as
+      keep-alives.
+    """
+
+    async def stream():
+        async with hub.subscribe() as queue:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=LIVE_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield f"data: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
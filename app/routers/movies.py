@@ -1,14 +1,42 @@
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, HTTPException
-from app.models import MovieRead
-from app.db import get_connection
+from fastapi import APIRouter, HTTPException, Query
+from app import fastjson
+from app.cache import TTLCache
+from app.models import MovieRead, MovieTitleSuggestion
+from app.pool import PoolError
+from app.repository import get_repository
+from app.title_index import get_title_index
 
 router = APIRouter(
     prefix="/movies",
     tags=["movies"],
 )
 
+# The catalog changes a few times a week at most, so a few minutes of
+# staleness is fine. Writes should call app.cache.invalidate("movies").
+_all_movies_cache = TTLCache("movies.all", ttl=300, max_entries=1, tags=("movies",))
+_now_playing_cache = TTLCache(
+    "movies.now_playing", ttl=300, max_entries=1, tags=("movies",)
+)
+# Keyed by date so the list rolls over at midnight
+_upcoming_cache = TTLCache("movies.upcoming", ttl=300, max_entries=2, tags=("movies",))
+# Pre-encoded JSON for ?fast=true
+_all_movies_json_cache = TTLCache(
+    "movies.all.json", ttl=300, max_entries=1, tags=("movies",)
+)
+
+
+def _fetch_movies_json(load) -> bytes:
+    """Encode repository rows straight to JSON, skipping the models."""
+    return fastjson.dumps(load())
+
+
+def _fetch_movies(load) -> List[MovieRead]:
+    """Map repository rows to MovieRead models."""
+    return [MovieRead(**row) for row in load()]
+
 
 @router.get(
     "",
@@ -16,58 +44,31 @@ router = APIRouter(
     summary="List all movies",
     description="Returns all movies in the database, regardless of status.",
 )
-def list_movies():
+def list_movies(
+    fast: bool = Query(
+        False, description="Skip model validation and encode JSON directly (same schema)"
+    ),
+):
     """
     General endpoint:
 
     - Output: list of all movies (active, inactive, upcoming).
-    - Implementation will SELECT from Movies table.
+    - Reads Movies through the repository (app.repository).
+    - Cached for 5 minutes (movies.all); fast=true caches the encoded JSON
+      instead (movies.all.json).
     """
-
     try:
-        conn = get_connection()
-        # dictionary=True so we get dicts instead of tuples
-        cursor = conn.cursor(dictionary=True)
-
-        query = """
-         SELECT
-               MovieID   AS movie_id,
-               Title     AS title,
-               Genre     AS genre,
-               Runtime   AS runtime,
-               ReleaseDate AS release_date,
-               Price     AS price,
-               IsActive  AS is_active,
-               DistributorID AS distributor_id
-         FROM Movies
-         ORDER BY Title
-      """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-
-        # Clean up DB resources
-        cursor.close()
-        conn.close()
-
-        # Map rows to Pydantic models
-        movies: List[MovieRead] = []
-        for row in rows:
-            movies.append(
-                MovieRead(
-                    movie_id=row["movie_id"],
-                    title=row["title"],
-                    genre=row["genre"],
-                    runtime=row["runtime"],
-                    release_date=row["release_date"],
-                    price=float(row["price"]),
-                    # IsActive is stored as TINYINT(1) (either 0 or 1) so we convert to bool for clarity
-                    is_active=bool(row["is_active"]),
-                    distributor_id=row["distributor_id"],
+        if fast:
+            return fastjson.FastJSONResponse(
+                _all_movies_json_cache.get_or_load(
+                    "all", lambda: _fetch_movies_json(get_repository().list_movies)
                 )
             )
-
-        return movies
-
+        return _all_movies_cache.get_or_load(
+            "all", lambda: _fetch_movies(get_repository().list_movies)
+        )
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
@@ -86,48 +87,15 @@ def get_now_playing_movies():
     General endpoint:
 
     - Output: movies with IsActive = 1.
-    - Implementation will filter Movies on IsActive flag.
+    - Filters Movies on the IsActive flag (repository).
+    - Cached for 5 minutes (movies.now_playing).
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        query = """
-               SELECT
-                  MovieID  AS movie_id,
-                  Title    AS title,
-                  Genre  AS genre,
-                  Runtime  AS runtime,
-                  ReleaseDate AS release_date,
-                  Price   AS price,
-                  IsActive AS is_active,
-                  DistributorID AS distributor_id
-               FROM MOVIES
-               WHERE IsActive = 1
-               ORDER BY Title
-               """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        cursor.close()
-        conn.close()
-
-        # Map rows to Pydantic models
-        movies: List[MovieRead] = []
-        for row in rows:
-            movies.append(
-                MovieRead(
-                    movie_id=row["movie_id"],
-                    title=row["title"],
-                    genre=row["genre"],
-                    runtime=row["runtime"],
-                    release_date=row["release_date"],
-                    price=float(row["price"]),
-                    # IsActive is stored as TINYINT(1) (either 0 or 1) so we convert to bool for clarity
-                    is_active=bool(row["is_active"]),
-                    distributor_id=row["distributor_id"],
-                )
-            )
-        return movies
+        return _now_playing_cache.get_or_load(
+            "all", lambda: _fetch_movies(get_repository().list_now_playing_movies)
+        )
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
@@ -146,46 +114,53 @@ def get_upcoming_movies():
     General endpoint:
 
     - Output: movies with ReleaseDate > current date.
-    - Implementation will compare ReleaseDate with CURDATE()/NOW().
+    - Compares ReleaseDate with the current date (repository).
+    - Cached for 5 minutes per calendar day (movies.upcoming).
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        query = """
-               SELECT
-                  MovieID   AS movie_id,
-                  Title    AS title,
-                  Genre     AS genre,
-                  Runtime    AS runtime,
-                  ReleaseDate  AS release_date,
-                  Price   AS price,
-                  IsActive   AS is_active,
-                  DistributorID AS distributor_id
-               FROM Movies
-               WHERE ReleaseDate > CURDATE()
-               ORDER BY ReleaseDate ASC
-      """
-
-        cursor.execute(query)
-        rows = cursor.fetchall()
-
-        cursor.close()
-        conn.close()
+        return _upcoming_cache.get_or_load(
+            date.today(),
+            lambda: _fetch_movies(get_repository().list_upcoming_movies),
+        )
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {e}")
+
 
+@router.get(
+    "/suggest",
+    response_model=List[MovieTitleSuggestion],
+    summary="Suggest movie titles for a search",
+    description=(
+        "Title suggestions for search boxes: exact matches first, then titles "
+        "with the search as a prefix (of the title or any word in it), then "
+        "close misspellings. Case, accents and punctuation are ignored."
+    ),
+)
+def suggest_movie_titles(
+    q: str = Query(..., min_length=1, max_length=100, description="Title search"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+):
+    """
+    General endpoint:
+
+    - Input: (partial, possibly misspelled) title and result limit.
+    - Output: matching movies with how they matched.
+    - Served from the in-process title index (app.title_index), which is
+      rebuilt from the repository every 5 minutes or when "movies" is
+      invalidated; no SQL per keystroke.
+    """
+    try:
         return [
-            MovieRead(
-                movie_id=row["movie_id"],
-                title=row["title"],
-                genre=row["genre"],
-                runtime=row["runtime"],
-                release_date=row["release_date"],
-                price=float(row["price"]),
-                is_active=bool(row["is_active"]),
-                distributor_id=row["distributor_id"],
+            MovieTitleSuggestion(
+                movie_id=movie_id, title=title, match=match, distance=distance
+            )
+            for movie_id, title, match, distance in get_title_index().suggest(
+                q, limit
             )
-            for row in rows
         ]
-
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -1,17 +1,29 @@
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, HTTPException, Query, Path
 
-from app.db import get_connection
+from app import fastjson, metrics, statements
+from app.cache import TTLCache
+from app.db import (
+    LIVE_MAX_STALENESS,
+    REPORTS_MAX_STALENESS,
+    get_read_connection,
+)
+from app.pool import PoolError
+from app.repository import get_repository
+from app.title_index import get_title_index
 from app.models import (
     MovieShowtime,
     ShowtimeAvailability,
     ConcessionCategoryRevenue,
+    ConcessionCubeCell,
     MovieLifetimeSales,
     UpcomingShowtime,
     DailyTicketSales,
+    SalesSeriesPoint,
     MovieProfit,
+    MovieProfitLeaderboardEntry,
 )
 
 router = APIRouter(
@@ -19,6 +31,30 @@ router = APIRouter(
     tags=["reports"],
 )
 
+# Seat counts per showtime; purchases invalidate their showtime's entry, the
+# short TTL covers purchases made by other server processes.
+_availability_cache = TTLCache(
+    "reports.showtime_availability",
+    ttl=10,
+    max_entries=1024,
+    tags=("seat_availability",),
+)
+# Keyed by days_ahead. Sold-out flags change on purchase (invalidated), and
+# DynamicStatus moves with NOW(), hence the short TTL.
+_upcoming_showtimes_cache = TTLCache(
+    "reports.upcoming_showtimes",
+    ttl=30,
+    max_entries=32,
+    tags=("showtime_status", "showtimes", "movies"),
+)
+# Same data, pre-encoded JSON for ?fast=true
+_upcoming_showtimes_json_cache = TTLCache(
+    "reports.upcoming_showtimes.json",
+    ttl=30,
+    max_entries=32,
+    tags=("showtime_status", "showtimes", "movies"),
+)
+
 
 @router.get(
     "/movie-showtimes",
@@ -30,7 +66,9 @@ router = APIRouter(
     ),
 )
 def get_movie_showtimes(
-    title: str = Query(..., description="Exact movie title, e.g., 'Minecraft'"),
+    title: str = Query(
+        ..., description="Movie title, e.g., 'Minecraft'; small typos are forgiven"
+    ),
     show_date: date = Query(
         ..., alias="date", description="Date (YYYY-MM-DD) for which to find showtimes"
     ),
@@ -40,15 +78,28 @@ def get_movie_showtimes(
 
     - Input: movie title and specific date.
     - Output: list of showtimes (theater, start time, end time) for that movie on that date.
+
+    Implementation notes:
+    - The title is resolved to MovieID(s) in-process first (app.title_index:
+      normalized exact match, unique prefix, then bounded edit distance), so
+      "minecrft" still finds Minecraft. Unknown or ambiguous titles return
+      an empty list without touching MySQL; /movies/suggest lists candidates.
+    - The SQL is then a MovieID + half-open StartTime range on
+      idx_showtimes_movie_start, joined to Movies by primary key for the title.
     """
     conn = None
     cursor = None
 
     try:
-        conn = get_connection()
+        movie_ids = get_title_index().resolve(title)
+        if not movie_ids:
+            return []
+
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
         cursor = conn.cursor(dictionary=True)
 
-        query = """
+        placeholders = ", ".join(["%s"] * len(movie_ids))
+        query = f"""
             SELECT
                 m.Title   AS title,
                 s.ShowtimeID AS showtime_id,
@@ -57,12 +108,17 @@ def get_movie_showtimes(
                 s.EndTime    AS end_time
             FROM Showtimes s
             JOIN Movies m ON s.MovieID = m.MovieID
-            WHERE m.Title = %s
-              AND DATE(s.StartTime) = %s
+            WHERE s.MovieID IN ({placeholders})
+              AND s.StartTime >= %s
+              AND s.StartTime < %s
             ORDER BY s.StartTime
         """
-        cursor.execute(query, (title, show_date))
-        rows = cursor.fetchall()
+        rows = metrics.fetchall(
+            cursor,
+            "reports.movie_showtimes",
+            query,
+            (*movie_ids, show_date, show_date + timedelta(days=1)),
+        )
 
         return [
             MovieShowtime(
@@ -75,6 +131,8 @@ def get_movie_showtimes(
             for row in rows
         ]
 
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -93,7 +151,7 @@ def get_movie_showtimes(
     summary="Query 2: Remaining seats for a showtime",
     description=(
         "Given a showtime ID, returns the auditorium capacity, tickets sold, "
-        "and seats remaining. Demonstrates join and aggregation."
+        "and seats remaining. Reads the TicketsSold counter maintained on Showtimes."
     ),
 )
 def get_showtime_availability(
@@ -104,43 +162,128 @@ def get_showtime_availability(
 
     - Input: ShowtimeID.
     - Output: capacity, tickets sold, seats remaining.
+    - Cached briefly per showtime; purchase_ticket invalidates its showtime.
     """
+    try:
+        availability = _availability_cache.get_or_load(
+            showtime_id, lambda: _fetch_showtime_availability(showtime_id)
+        )
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching showtime availability: {e}",
+        )
+
+    if availability is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Showtime with ID {showtime_id} not found.",
+        )
+    return availability
+
+
+def _fetch_showtime_availability(showtime_id: int) -> Optional[ShowtimeAvailability]:
+    row = get_repository().showtime_availability(showtime_id)
+    if row is None:
+        return None
+    return ShowtimeAvailability(**row)
+
+
+# Upper bound on explicit IDs per batch request (keeps the IN list sane)
+MAX_BATCH_SHOWTIMES = 500
+
+
+@router.get(
+    "/showtime-availability/batch",
+    response_model=List[ShowtimeAvailability],
+    summary="Remaining seats for many showtimes at once",
+    description=(
+        "Returns capacity, tickets sold and seats remaining for a set of showtimes "
+        "in one set-based query. Select showtimes by repeating showtime_ids "
+        "(?showtime_ids=1&showtime_ids=2), and/or by date and auditorium."
+    ),
+)
+def get_showtime_availability_batch(
+    showtime_ids: Optional[List[int]] = Query(
+        None, description=f"Showtime IDs to check (max {MAX_BATCH_SHOWTIMES})"
+    ),
+    show_date: Optional[date] = Query(
+        None, alias="date", description="Only showtimes starting on this date"
+    ),
+    theater_id: Optional[int] = Query(
+        None, description="Only showtimes in this auditorium"
+    ),
+):
+    """
+    Batch variant of Query 2:
+
+    - Input: showtime IDs and/or date and/or auditorium (at least one).
+    - Output: availability for every matching showtime, ordered by start time.
+
+    Implementation notes:
+    - Reads the TicketsSold counter, so this is a plain filtered join with
+      no aggregation; the date filter is a half-open StartTime range served
+      by idx_showtimes_start / idx_showtimes_theater_start.
+    """
+    if not showtime_ids and show_date is None and theater_id is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide showtime_ids, date and/or theater_id.",
+        )
+    if showtime_ids and len(showtime_ids) > MAX_BATCH_SHOWTIMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_SHOWTIMES} showtime_ids per request.",
+        )
+
     conn = None
     cursor = None
 
     try:
-        conn = get_connection()
+        conn = get_read_connection(LIVE_MAX_STALENESS)
         cursor = conn.cursor(dictionary=True)
 
-        query = """
+        conditions = []
+        params = []
+        if showtime_ids:
+            placeholders = ", ".join(["%s"] * len(showtime_ids))
+            conditions.append(f"s.ShowtimeID IN ({placeholders})")
+            params.extend(showtime_ids)
+        if show_date is not None:
+            conditions.append("s.StartTime >= %s AND s.StartTime < %s")
+            params.extend([show_date, show_date + timedelta(days=1)])
+        if theater_id is not None:
+            conditions.append("s.TheaterID = %s")
+            params.append(theater_id)
+
+        query = f"""
             SELECT
                 s.ShowtimeID                      AS showtime_id,
                 a.SeatCapacity                    AS seat_capacity,
-                COUNT(t.TicketSaleID)             AS tickets_sold,
-                (a.SeatCapacity - COUNT(t.TicketSaleID)) AS seats_remaining
+                s.TicketsSold                     AS tickets_sold,
+                (a.SeatCapacity - s.TicketsSold)  AS seats_remaining
             FROM Showtimes s
             JOIN Auditoriums a ON s.TheaterID = a.TheaterID
-            LEFT JOIN TicketSales t ON s.ShowtimeID = t.ShowtimeID
-            WHERE s.ShowtimeID = %s
-            GROUP BY s.ShowtimeID, a.SeatCapacity
+            WHERE {" AND ".join(conditions)}
+            ORDER BY s.StartTime, s.ShowtimeID
         """
-        cursor.execute(query, (showtime_id,))
-        row = cursor.fetchone()
+        rows = metrics.fetchall(
+            cursor, "reports.showtime_availability_batch", query, params
+        )
 
-        if row is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Showtime with ID {showtime_id} not found.",
+        return [
+            ShowtimeAvailability(
+                showtime_id=row["showtime_id"],
+                seat_capacity=row["seat_capacity"],
+                tickets_sold=row["tickets_sold"],
+                seats_remaining=row["seats_remaining"],
             )
+            for row in rows
+        ]
 
-        return ShowtimeAvailability(
-            showtime_id=row["showtime_id"],
-            seat_capacity=row["seat_capacity"],
-            tickets_sold=row["tickets_sold"],
-            seats_remaining=row["seats_remaining"],
-        )
-
-    except HTTPException:
+    except PoolError:
         raise
     except Exception as e:
         raise HTTPException(
@@ -179,7 +322,7 @@ def get_concession_category_revenue(
     cursor = None
 
     try:
-        conn = get_connection()
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
         cursor = conn.cursor(dictionary=True)
 
         base_query = """
@@ -199,8 +342,9 @@ def get_concession_category_revenue(
             query = base_query
             params = ()
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        rows = metrics.fetchall(
+            cursor, "reports.concession_category_revenue", query, params
+        )
 
         return [
             ConcessionCategoryRevenue(
@@ -210,6 +354,8 @@ def get_concession_category_revenue(
             for row in rows
         ]
 
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -222,6 +368,107 @@ def get_concession_category_revenue(
             conn.close()
 
 
+# dimension -> SQL expression over ConcessionSalesCube (aliased to the name)
+_CUBE_DIMENSIONS = {
+    "date": "SalesDate",
+    "weekday": "WEEKDAY(SalesDate)",
+    "hour": "SaleHour",
+    "category": "Category",
+}
+
+
+@router.get(
+    "/concessions/cube",
+    response_model=List[ConcessionCubeCell],
+    summary="Concession units and revenue by category, hour and day of week",
+    description=(
+        "Slices pre-aggregated concession sales by any combination of date, "
+        "weekday, hour and category over an optional date window, e.g. "
+        "dimensions=weekday&dimensions=hour for a staffing heat map."
+    ),
+)
+def get_concession_cube(
+    start_date: Optional[date] = Query(
+        None, alias="from", description="First sale date to include (YYYY-MM-DD)"
+    ),
+    end_date: Optional[date] = Query(
+        None, alias="to", description="Last sale date to include (YYYY-MM-DD)"
+    ),
+    dimensions: List[Literal["date", "weekday", "hour", "category"]] = Query(
+        ["category"], description="Dimensions to group by (repeatable)"
+    ),
+    category: Optional[str] = Query(
+        None, description="Only this concession category, e.g. 'Popcorn'"
+    ),
+):
+    """
+    Concession analytics:
+
+    - Input: optional date window, dimensions to group by, optional category.
+    - Output: list of ConcessionCubeCell, ordered by the dimensions.
+
+    Implementation notes:
+    - Reads ConcessionSalesCube (one row per day, hour and category, kept
+      current by the CubeConcessionSale trigger) instead of joining
+      ConcessionSales to Concessions; the date window is a primary-key range.
+    """
+    dims = list(dict.fromkeys(dimensions))
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
+        cursor = conn.cursor(dictionary=True)
+
+        select = [f"{_CUBE_DIMENSIONS[d]} AS {d}" for d in dims]
+        query = f"""
+            SELECT
+                {", ".join(select + ["SUM(Units) AS units", "SUM(Revenue) AS revenue"])}
+            FROM ConcessionSalesCube
+            WHERE 1 = 1
+        """
+        params = []
+        if start_date is not None:
+            query += " AND SalesDate >= %s"
+            params.append(start_date)
+        if end_date is not None:
+            query += " AND SalesDate <= %s"
+            params.append(end_date)
+        if category is not None:
+            query += " AND Category = %s"
+            params.append(category)
+        if dims:
+            query += f" GROUP BY {', '.join(dims)} ORDER BY {', '.join(dims)}"
+
+        rows = metrics.fetchall(cursor, "reports.concession_cube", query, params)
+
+        return [
+            ConcessionCubeCell(
+                sales_date=row.get("date"),
+                weekday=row.get("weekday"),
+                hour=row.get("hour"),
+                category=row.get("category"),
+                units=int(row["units"] or 0),
+                revenue=float(row["revenue"] or 0.0),
+            )
+            for row in rows
+        ]
+
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching concession cube: {e}",
+        )
+    finally:
+        if cursor is not None:
+            cursor.close()
+        if conn is not None:
+            conn.close()
+
+
 @router.get(
     "/movie-lifetime-sales",
     response_model=MovieLifetimeSales,
@@ -243,11 +490,9 @@ def get_movie_lifetime_sales(
     - Output: movie title and total number of tickets ever sold for that movie.
     """
     conn = None
-    cursor = None
 
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
 
         # Using a subquery for the COUNT
         query = """
@@ -263,8 +508,10 @@ def get_movie_lifetime_sales(
             FROM Movies m
             WHERE m.MovieID = %s
         """
-        cursor.execute(query, (movie_id,))
-        row = cursor.fetchone()
+        # Same text on every call: prepared once per pooled connection
+        row = statements.fetchone(
+            conn, "reports.movie_lifetime_sales", query, (movie_id,), dictionary=True
+        )
 
         if row is None:
             raise HTTPException(
@@ -278,7 +525,7 @@ def get_movie_lifetime_sales(
             lifetime_ticket_sales=row["lifetime_ticket_sales"] or 0,
         )
 
-    except HTTPException:
+    except (HTTPException, PoolError):
         raise
     except Exception as e:
         raise HTTPException(
@@ -286,8 +533,6 @@ def get_movie_lifetime_sales(
             detail=f"Database error while fetching movie lifetime sales: {e}",
         )
     finally:
-        if cursor is not None:
-            cursor.close()
         if conn is not None:
             conn.close()
 
@@ -308,69 +553,45 @@ def get_upcoming_showtimes(
             "Optional number of days ahead to restrict upcoming showtimes. "
             "If omitted, returns all future showtimes from now onward."
         ),
-    )
+    ),
+    fast: bool = Query(
+        False, description="Skip model validation and encode JSON directly (same schema)"
+    ),
 ):
     """
     Assignment Query 5:
 
     - Input: optional days_ahead filter.
     - Output: upcoming showtimes with movie title, auditorium, and dynamic status.
+    - Cached for 30 seconds per days_ahead value; purchases invalidate it.
+    - fast=true encodes the repository rows and caches the JSON instead.
     """
-    conn = None
-    cursor = None
-
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        base_query = """
-            SELECT
-                ShowtimeID    AS showtime_id,
-                MovieID       AS movie_id,
-                MovieTitle    AS movie_title,
-                TheaterID     AS theater_id,
-                StartTime     AS start_time,
-                EndTime       AS end_time,
-                IsSoldOut     AS is_sold_out,
-                DynamicStatus AS dynamic_status
-            FROM UpcomingShowtimesView
-        """
-
-        params = ()
-        if days_ahead is not None:
-            # View already filters out past showtimes- simply cap them by days_ahead
-            base_query += " WHERE StartTime <= DATE_ADD(NOW(), INTERVAL %s DAY)"
-            params = (days_ahead,)
-
-        base_query += " ORDER BY StartTime"
-
-        cursor.execute(base_query, params)
-        rows = cursor.fetchall()
-
-        return [
-            UpcomingShowtime(
-                showtime_id=row["showtime_id"],
-                movie_id=row["movie_id"],
-                movie_title=row["movie_title"],
-                theater_id=row["theater_id"],
-                start_time=row["start_time"],
-                end_time=row["end_time"],
-                is_sold_out=bool(row["is_sold_out"]),
-                dynamic_status=row["dynamic_status"],
+        if fast:
+            return fastjson.FastJSONResponse(
+                _upcoming_showtimes_json_cache.get_or_load(
+                    days_ahead,
+                    lambda: _fetch_upcoming_showtimes(days_ahead, encode=True),
+                )
             )
-            for row in rows
-        ]
-
+        return _upcoming_showtimes_cache.get_or_load(
+            days_ahead, lambda: _fetch_upcoming_showtimes(days_ahead)
+        )
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Database error while fetching upcoming showtimes: {e}",
         )
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+
+
+def _fetch_upcoming_showtimes(days_ahead: Optional[int], encode=False):
+    """List[UpcomingShowtime], or the rows encoded as JSON bytes if encode."""
+    rows = get_repository().upcoming_showtimes(days_ahead)
+    if encode:
+        return fastjson.dumps(rows)
+    return [UpcomingShowtime(**row) for row in rows]
 
 
 # ---------- Optional / function based reports ----------
@@ -400,12 +621,13 @@ def get_daily_ticket_sales(
     cursor = None
 
     try:
-        conn = get_connection()
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
         cursor = conn.cursor(dictionary=True)
 
         query = "SELECT get_number_of_ticket_sales(%s) AS tickets_sold"
-        cursor.execute(query, (target_date,))
-        row = cursor.fetchone()
+        row = metrics.fetchone(
+            cursor, "reports.daily_ticket_sales", query, (target_date,)
+        )
 
         tickets_sold = (
             row["tickets_sold"] if row and row["tickets_sold"] is not None else 0
@@ -416,6 +638,8 @@ def get_daily_ticket_sales(
             tickets_sold=tickets_sold,
         )
 
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -428,6 +652,273 @@ def get_daily_ticket_sales(
             conn.close()
 
 
+# period_start expression per granularity; weeks start on Monday
+_SERIES_BUCKETS = {
+    "day": "SalesDate",
+    "week": "DATE_SUB(SalesDate, INTERVAL WEEKDAY(SalesDate) DAY)",
+    "month": "DATE_SUB(SalesDate, INTERVAL DAYOFMONTH(SalesDate) - 1 DAY)",
+}
+# Ten years of daily points
+MAX_SERIES_DAYS = 3660
+
+
+def _period_start(day, granularity):
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_period(period_start, granularity):
+    if granularity == "month":
+        return (period_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    if granularity == "week":
+        return period_start + timedelta(days=7)
+    return period_start + timedelta(days=1)
+
+
+def _periods(start, end, granularity):
+    """
+    (period_start, partial) for every period from start's period through
+    end, in order. partial is True when the period begins before start or
+    ends after end, i.e. only some of its days are summed.
+    """
+    current = _period_start(start, granularity)
+    while current <= end:
+        following = _next_period(current, granularity)
+        yield current, current < start or following - timedelta(days=1) > end
+        current = following
+
+
+@router.get(
+    "/sales-series",
+    response_model=List[SalesSeriesPoint],
+    summary="Ticket and concession sales per day, week or month",
+    description=(
+        "Returns one point per period between from and to (inclusive) with "
+        "tickets sold, ticket revenue and concession revenue, read from the "
+        "DailySalesRollup table. Periods without sales are returned as zeros. "
+        "Weeks and months are labeled by their first day; the first and last "
+        "ones may extend past from/to and then only sum the days inside the "
+        "range (partial=true)."
+    ),
+)
+def get_sales_series(
+    start_date: date = Query(
+        ..., alias="from", description="First sale date to include (YYYY-MM-DD)"
+    ),
+    end_date: date = Query(
+        ..., alias="to", description="Last sale date to include (YYYY-MM-DD)"
+    ),
+    granularity: Literal["day", "week", "month"] = Query("day"),
+    movie_id: Optional[int] = Query(
+        None,
+        description="Only this movie's tickets (concession revenue is then 0)",
+    ),
+    theater_id: Optional[int] = Query(
+        None,
+        description="Only this auditorium's tickets (concession revenue is then 0)",
+    ),
+):
+    """
+    Sales report:
+
+    - Input: date range, granularity, optional movie / auditorium filter.
+    - Output: list of SalesSeriesPoint, one per period.
+
+    Implementation notes:
+    - DailySalesRollup has one row per (day, movie, auditorium), kept current
+      by triggers on TicketSales and ConcessionSales, so years of history are
+      a primary-key range scan over a few thousand rows.
+    - Concession sales aren't tied to a movie; they are stored under
+      MovieID = 0 / TheaterID = 0 and drop out when filtering.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'.")
+    if (end_date - start_date).days > MAX_SERIES_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range is limited to {MAX_SERIES_DAYS} days.",
+        )
+
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
+        cursor = conn.cursor(dictionary=True)
+
+        query = f"""
+            SELECT
+                {_SERIES_BUCKETS[granularity]} AS period_start,
+                SUM(TicketCount)               AS tickets_sold,
+                SUM(TicketRevenue)             AS ticket_revenue,
+                SUM(ConcessionRevenue)         AS concession_revenue
+            FROM DailySalesRollup
+            WHERE SalesDate >= %s
+              AND SalesDate <= %s
+        """
+        params = [start_date, end_date]
+        if movie_id is not None:
+            query += " AND MovieID = %s"
+            params.append(movie_id)
+        if theater_id is not None:
+            query += " AND TheaterID = %s"
+            params.append(theater_id)
+        query += " GROUP BY period_start"
+
+        rows = metrics.fetchall(cursor, "reports.sales_series", query, params)
+        by_period = {row["period_start"]: row for row in rows}
+
+        points = []
+        for period_start, partial in _periods(start_date, end_date, granularity):
+            row = by_period.get(period_start)
+            tickets_sold = int(row["tickets_sold"]) if row else 0
+            ticket_revenue = float(row["ticket_revenue"]) if row else 0.0
+            concession_revenue = float(row["concession_revenue"]) if row else 0.0
+            points.append(
+                SalesSeriesPoint(
+                    period_start=period_start,
+                    tickets_sold=tickets_sold,
+                    ticket_revenue=ticket_revenue,
+                    concession_revenue=concession_revenue,
+                    total_revenue=round(ticket_revenue + concession_revenue, 2),
+                    partial=partial,
+                )
+            )
+        return points
+
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching sales series: {e}",
+        )
+    finally:
+        if cursor is not None:
+            cursor.close()
+        if conn is not None:
+            conn.close()
+
+
+_LEADERBOARD_SORTS = {
+    "net_profit": "net_profit",
+    "revenue": "ticket_revenue",
+    "tickets_sold": "tickets_sold",
+}
+
+
+@router.get(
+    "/movies/profit-leaderboard",
+    response_model=List[MovieProfitLeaderboardEntry],
+    summary="Ticket revenue, distributor fee and net profit for every movie",
+    description=(
+        "Ranks all movies by net profit (or revenue / tickets sold) in one "
+        "grouped query, optionally limited to sales between from and to. "
+        "Net profit is computed the same way as get_movie_profits: ticket "
+        "revenue minus the distributor's percentage fee."
+    ),
+)
+def get_movie_profit_leaderboard(
+    start_date: Optional[date] = Query(
+        None, alias="from", description="First sale date to include (YYYY-MM-DD)"
+    ),
+    end_date: Optional[date] = Query(
+        None, alias="to", description="Last sale date to include (YYYY-MM-DD)"
+    ),
+    sort: Literal["net_profit", "revenue", "tickets_sold"] = Query("net_profit"),
+    order: Literal["desc", "asc"] = Query("desc"),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Optional top-N. If omitted, returns every movie."
+    ),
+):
+    """
+    Profit report:
+
+    - Input: optional date window, sort column/direction and top-N.
+    - Output: list of MovieProfitLeaderboardEntry, ranked.
+
+    Implementation notes:
+    - One LEFT JOIN of Movies/Distributors onto DailySalesRollup grouped by
+      movie, instead of calling get_movie_profits (two queries) per movie.
+    - The date window filters the join, so movies without sales in the
+      window are still listed with zeros.
+    """
+    conn = None
+    cursor = None
+
+    try:
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
+        cursor = conn.cursor(dictionary=True)
+
+        window = ""
+        params = []
+        if start_date is not None:
+            window += " AND r.SalesDate >= %s"
+            params.append(start_date)
+        if end_date is not None:
+            window += " AND r.SalesDate <= %s"
+            params.append(end_date)
+
+        query = f"""
+            SELECT
+                movie_id,
+                title,
+                tickets_sold,
+                ticket_revenue,
+                ROUND(ticket_revenue * fee_pct / 100, 2)                  AS distributor_fee,
+                ROUND(ticket_revenue - ticket_revenue * fee_pct / 100, 2) AS net_profit
+            FROM (
+                SELECT
+                    m.MovieID                         AS movie_id,
+                    m.Title                           AS title,
+                    d.DistributionFee                 AS fee_pct,
+                    COALESCE(SUM(r.TicketCount), 0)   AS tickets_sold,
+                    COALESCE(SUM(r.TicketRevenue), 0) AS ticket_revenue
+                FROM Movies m
+                JOIN Distributors d ON m.DistributorID = d.DistributorID
+                LEFT JOIN DailySalesRollup r ON r.MovieID = m.MovieID{window}
+                GROUP BY m.MovieID, m.Title, d.DistributionFee
+            ) totals
+            ORDER BY {_LEADERBOARD_SORTS[sort]} {order.upper()}, movie_id
+        """
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(limit)
+
+        rows = metrics.fetchall(
+            cursor, "reports.movie_profit_leaderboard", query, params
+        )
+
+        return [
+            MovieProfitLeaderboardEntry(
+                rank=rank,
+                movie_id=row["movie_id"],
+                title=row["title"],
+                tickets_sold=int(row["tickets_sold"]),
+                ticket_revenue=float(row["ticket_revenue"]),
+                distributor_fee=float(row["distributor_fee"]),
+                net_profit=float(row["net_profit"]),
+            )
+            for rank, row in enumerate(rows, start=1)
+        ]
+
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error while fetching profit leaderboard: {e}",
+        )
+    finally:
+        if cursor is not None:
+            cursor.close()
+        if conn is not None:
+            conn.close()
+
+
 @router.get(
     "/movies/{movie_id}/profit",
     response_model=MovieProfit,
@@ -447,11 +938,9 @@ def get_movie_profit(
     - Output: net profit for that movie and its title.
     """
     conn = None
-    cursor = None
 
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
+        conn = get_read_connection(REPORTS_MAX_STALENESS)
 
         query = """
             SELECT
@@ -460,8 +949,9 @@ def get_movie_profit(
             FROM Movies m
             WHERE m.MovieID = %s
         """
-        cursor.execute(query, (movie_id, movie_id))
-        row = cursor.fetchone()
+        row = statements.fetchone(
+            conn, "reports.movie_profit", query, (movie_id, movie_id), dictionary=True
+        )
 
         if row is None:
             raise HTTPException(
@@ -475,7 +965,7 @@ def get_movie_profit(
             net_profit=float(row["net_profit"] or 0.0),
         )
 
-    except HTTPException:
+    except (HTTPException, PoolError):
         raise
     except Exception as e:
         raise HTTPException(
@@ -483,7 +973,5 @@ def get_movie_profit(
             detail=f"Database error while fetching movie profit: {e}",
         )
     finally:
-        if cursor is not None:
-            cursor.close()
         if conn is not None:
             conn.close()
@@ -1,15 +1,29 @@
 from typing import List
 
+import mysql.connector
 from fastapi import APIRouter, HTTPException
 
+from app import cache, metrics
+from app.cache import TTLCache
 from app.db import get_connection
-from app.models import ShowtimeRead
+from app.pool import PoolError
+from app.repository import get_repository
+from app.models import (
+    ShowtimeRead,
+    BulkShowtimeRequest,
+    BulkShowtimeResponse,
+    ShowtimeConflict,
+)
+from app.scheduling import find_conflicts
 
 router = APIRouter(
     prefix="/showtimes",
     tags=["showtimes"],
 )
 
+# Schedules are loaded in advance; invalidate("showtimes") after writes
+_showtimes_cache = TTLCache("showtimes.all", ttl=120, max_entries=1, tags=("showtimes",))
+
 
 @router.get(
     "",
@@ -29,34 +43,137 @@ def list_showtimes():
       and start/end times.
 
     Implementation notes:
-    - Simple SELECT from Showtimes table.
+    - Simple SELECT from Showtimes table (app.repository).
+    - Cached for 2 minutes (showtimes.all).
+    """
+    try:
+        return _showtimes_cache.get_or_load(
+            "all", lambda: get_repository().list_showtimes()
+        )
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching showtimes: {e}",
+        )
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkShowtimeResponse,
+    summary="Import a schedule of showtimes",
+    description=(
+        "Validates a whole schedule against itself and the existing showtimes "
+        "of the same auditoriums, then inserts it with one multi-row INSERT. "
+        "If any showtime overlaps another, nothing is inserted and every "
+        "conflict is returned (409)."
+    ),
+)
+def bulk_create_showtimes(req: BulkShowtimeRequest):
     """
+    Bulk import endpoint:
+
+    - Input: list of showtimes (movie, auditorium, start/end, status).
+    - Output: status, message and number of showtimes created.
+
+    Implementation notes:
+    - Only existing showtimes in the batch's time window are read, per
+      auditorium (idx_showtimes_theater_end), and locked FOR UPDATE so a
+      concurrent import can't slip into the gap.
+    - Overlaps are found with a sort-and-sweep per auditorium
+      (app.scheduling.find_conflicts) rather than one trigger scan per row.
+    - The EnforceShowtimeOverlap trigger still runs on insert as a backstop.
+    """
+    new = [(s.theater_id, s.start_time, s.end_time) for s in req.showtimes]
+    theater_ids = sorted({theater_id for theater_id, _, _ in new})
+    window_start = min(start for _, start, _ in new)
+    window_end = max(end for _, _, end in new)
+
     conn = None
     cursor = None
 
     try:
         conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        query = """
-            SELECT
-                ShowtimeID AS showtime_id,
-                MovieID    AS movie_id,
-                TheaterID  AS theater_id,
-                StartTime  AS start_time,
-                EndTime    AS end_time
+        cursor = conn.cursor()
+
+        placeholders = ", ".join(["%s"] * len(theater_ids))
+        existing = metrics.fetchall(
+            cursor,
+            "showtimes.bulk.lock_existing",
+            f"""
+            SELECT ShowtimeID, TheaterID, StartTime, EndTime
             FROM Showtimes
-            ORDER BY StartTime;
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()  # list[dict]
+            WHERE TheaterID IN ({placeholders})
+              AND EndTime > %s
+              AND StartTime < %s
+            FOR UPDATE
+            """,
+            [*theater_ids, window_start, window_end],
+        )
 
-        return rows
+        conflicts = find_conflicts(new, existing)
+        if conflicts:
+            conn.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "message": f"{len(conflicts)} scheduling conflict(s); nothing was imported.",
+                    "conflicts": [
+                        ShowtimeConflict(
+                            index=index,
+                            theater_id=new[index][0],
+                            start_time=new[index][1],
+                            end_time=new[index][2],
+                            conflicts_with_index=ref if kind == "new" else None,
+                            conflicts_with_showtime_id=ref if kind == "existing" else None,
+                        ).model_dump(mode="json")
+                        for index, (kind, ref) in conflicts
+                    ],
+                },
+            )
 
+        metrics.executemany(
+            cursor,
+            "showtimes.bulk.insert",
+            """
+            INSERT INTO Showtimes (MovieID, TheaterID, StartTime, EndTime, Status)
+            VALUES (%s, %s, %s, %s, %s)
+            """,
+            [
+                (s.movie_id, s.theater_id, s.start_time, s.end_time, s.status)
+                for s in req.showtimes
+            ],
+        )
+        conn.commit()
+
+        cache.invalidate("showtimes")
+        cache.invalidate("showtime_status")
+
+        return BulkShowtimeResponse(
+            status="success",
+            message=f"{len(req.showtimes)} showtimes scheduled.",
+            showtimes_created=len(req.showtimes),
+        )
+    except HTTPException:
+        raise
+    except mysql.connector.Error as e:
+        # Unknown movie/auditorium (FK) or the overlap trigger
+        if conn:
+            conn.rollback()
+        detail_msg = getattr(e, "msg", str(e)) or str(e)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Showtime import failed: {detail_msg}",
+        )
+    except PoolError:
+        raise
     except Exception as e:
+        if conn:
+            conn.rollback()
         raise HTTPException(
             status_code=500,
-            detail=f"Error fetching showtimes: {e}",
+            detail=f"Unexpected error during showtime import: {e}",
         )
     finally:
         if cursor is not None:
@@ -1,16 +1,27 @@
-import mysql.connector
-
+from collections import Counter
 from datetime import date
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Path, Query
 from app.models import (
     TicketSaleRead,
+    TicketSalePage,
     TicketPurchaseRequest,
     TicketPurchaseResponse,
+    GroupTicketPurchaseRequest,
+    GroupTicketPurchaseResponse,
     CustomerTicketHistoryEntry,
+    CustomerTicketHistoryPage,
+)
+from app import cache, fastjson, live, soldout
+from app.pool import PoolError
+from app.repository import PurchaseRejected, UnknownShowtime, get_repository
+from app.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
 )
-from app.db import get_connection
 
 router = APIRouter(
     prefix="/tickets",
@@ -38,57 +49,136 @@ def purchase_ticket(req: TicketPurchaseRequest):
     - Output: a status flag and human-readable message.
 
     Implementation notes:
-    - Calls: CALL Process_Ticket_Purchase(p_CustomerID, p_ShowtimeID).
+    - Calls: CALL Process_Ticket_Purchase(p_CustomerID, p_ShowtimeID) through
+      the repository (the SQLite backend runs the same rules in Python).
     - On success: COMMIT and return success status/message.
     - On error: ROLLBACK and surface DB error message to the client.
+    - Showtimes that already failed with "Sold out"/"Auditorium full" are
+      rejected in-process (app.soldout) without taking a DB connection.
     """
-    conn = None
-    cursor = None
-
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # Call stored procedure defined in SQL:
-        # CREATE PROCEDURE Process_Ticket_Purchase(IN p_CustomerID INT, IN p_ShowtimeID INT) ...
-        cursor.callproc(
-            "Process_Ticket_Purchase",
-            [req.customer_id, req.showtime_id],
+    if soldout.is_sold_out(req.showtime_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Ticket purchase failed: Sold out",
         )
 
-        # If we reach here, the procedure completed without SIGNAL / errors
-        conn.commit()
-
-        return TicketPurchaseResponse(
-            status="success",
-            message="Ticket purchased successfully.",
+    try:
+        # Read the new counter while the purchase still holds its lock, only
+        # if someone is listening for live updates
+        live_state = get_repository().purchase_ticket(
+            req.customer_id,
+            req.showtime_id,
+            read_availability=bool(live.hub.subscribers),
         )
-    except mysql.connector.Error as e:
-        # Errors raised with SIGNAL inside the procedure/triggers will show up here
-        if conn:
-            conn.rollback()
-
-        # e.msg will usually contain the MESSAGE_TEXT you set in SIGNAL.
-        detail_msg = getattr(e, "msg", str(e)) or str(e)
+    except PurchaseRejected as e:
+        # Errors raised with SIGNAL inside the procedure/triggers end up here
+        detail_msg = str(e)
+        soldout.mark_if_sold_out(req.showtime_id, detail_msg)
 
         # 400 = client error (bad request) since its usually a rule violation (theater specific)
         raise HTTPException(
             status_code=400,
             detail=f"Ticket purchase failed: {detail_msg}",
         )
+    except PoolError:
+        raise
     except Exception as e:
-        if conn:
-            conn.rollback()
         # Unexpected server error
         raise HTTPException(
             status_code=500,
             detail=f"Unexpected error during ticket purchase: {e}",
         )
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+
+    # Seat counts and sold-out flags for this showtime just changed
+    cache.invalidate("seat_availability", key=req.showtime_id)
+    cache.invalidate("showtime_status")
+    if live_state:
+        live.publish_availability(req.showtime_id, *live_state)
+
+    return TicketPurchaseResponse(
+        status="success",
+        message="Ticket purchased successfully.",
+    )
+
+
+@router.post(
+    "/purchase/batch",
+    response_model=GroupTicketPurchaseResponse,
+    summary="Purchase several tickets in one transaction",
+    description=(
+        "Books N tickets for a customer and showtime, or a list of such lines, "
+        "in a single transaction. Capacity and showtime rules are checked once "
+        "per showtime, all tickets are written with one multi-row insert, and "
+        "either every ticket is booked or none are."
+    ),
+)
+def purchase_tickets_batch(req: GroupTicketPurchaseRequest):
+    """
+    Group purchase endpoint:
+
+    - Input: customer_id/showtime_id/quantity, or a list of lines.
+    - Output: status, message and number of tickets booked.
+
+    Implementation notes:
+    - The repository locks the affected Showtimes rows (FOR UPDATE, in
+      ShowtimeID order to avoid deadlocks), then applies the same rules as
+      Process_Ticket_Purchase against the TicketsSold counter.
+    - executemany() on a plain INSERT is sent as one multi-row INSERT; the
+      existing triggers still run per row and keep TicketsSold/IsSoldOut right.
+    - One COMMIT at the end; any failure rolls everything back.
+    """
+    wanted = Counter()
+    for line in req.lines:
+        wanted[line.showtime_id] += line.quantity
+
+    for showtime_id in sorted(wanted):
+        if soldout.is_sold_out(showtime_id):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Ticket purchase failed for showtime {showtime_id}: Sold out",
+            )
+
+    try:
+        availability = get_repository().purchase_tickets(
+            [(line.customer_id, line.showtime_id, line.quantity) for line in req.lines]
+        )
+    except UnknownShowtime as e:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Ticket purchase failed: {e}",
+        )
+    except PurchaseRejected as e:
+        if e.showtime_id is None:
+            # Trigger errors and FK violations (unknown customer)
+            raise HTTPException(
+                status_code=400,
+                detail=f"Ticket purchase failed: {e}",
+            )
+        if e.sold_out:
+            soldout.mark(e.showtime_id)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Ticket purchase failed for showtime {e.showtime_id}: {e}",
+        )
+    except PoolError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Unexpected error during ticket purchase: {e}",
+        )
+
+    for showtime_id, (tickets_sold, seat_capacity) in availability.items():
+        cache.invalidate("seat_availability", key=showtime_id)
+        live.publish_availability(showtime_id, tickets_sold, seat_capacity)
+    cache.invalidate("showtime_status")
+
+    booked = sum(wanted.values())
+    return GroupTicketPurchaseResponse(
+        status="success",
+        message=f"{booked} tickets purchased successfully.",
+        tickets_purchased=booked,
+    )
 
 
 @router.get(
@@ -104,187 +194,146 @@ def get_tickets_sold_today():
     """
     General endpoint:
 
-    - Output: list of TicketSales where DATE(TimeTicketSold) = todays date.
+    - Output: list of TicketSales sold on todays date.
 
     Implementation notes:
-    - Uses CURDATE() on the MySQL side to match the current date.
+    - Uses CURDATE() on the MySQL side to match the current date (repository).
+    - Half-open range on TimeTicketSold (not DATE(...)) so MySQL can range
+      scan idx_ticketsales_sold_at.
     """
-    conn = None
-    cursor = None
-
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        query = """
-         SELECT
-               TicketSaleID  AS ticket_sale_id,
-               CustomerID   AS customer_id,
-               ShowtimeID  AS showtime_id,
-               TicketPrice   AS ticket_price,
-               TimeTicketSold AS time_ticket_sold
-         FROM TicketSales
-         WHERE DATE(TimeTicketSold) = CURDATE()
-         ORDER BY TimeTicketSold ASC
-      """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-
-        return [
-            TicketSaleRead(
-                ticket_sale_id=row["ticket_sale_id"],
-                customer_id=row["customer_id"],
-                showtime_id=row["showtime_id"],
-                ticket_price=float(row["ticket_price"]),
-                time_ticket_sold=row["time_ticket_sold"],
-            )
-            for row in rows
-        ]
-
+        return [TicketSaleRead(**row) for row in get_repository().tickets_sold_today()]
+    except PoolError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Database error while fetching todays ticket sales: {e}",
         )
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
 
 
 @router.get(
     "/customers/{customer_id}/tickets",
-    response_model=List[CustomerTicketHistoryEntry],
+    response_model=CustomerTicketHistoryPage,
     summary="Get all tickets purchased by a given customer",
     description=(
         "Returns a ticket history for a specific customer, including movie titles, "
-        "showtime information, and ticket sale details."
+        "showtime information, and ticket sale details. Results are paginated "
+        "newest first; pass next_cursor back as `cursor` for the next page."
     ),
 )
 def get_customer_ticket_history(
     customer_id: int = Path(
         ..., description="ID of the customer whose ticket history to fetch"
     ),
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
 ):
     """
     General endpoint:
 
-    - Input: CustomerID.
-    - Output: list of ticket purchases with movie and showtime details.
+    - Input: CustomerID, page size and optional cursor.
+    - Output: one page of ticket purchases with movie and showtime details.
 
     Implementation notes:
     - JOIN TicketSales ts
       JOIN Showtimes s ON ts.ShowtimeID = s.ShowtimeID
       JOIN Movies    m ON s.MovieID    = m.MovieID
-    - Filter WHERE ts.CustomerID = :customer_id.
+    - Filter WHERE ts.CustomerID = :customer_id (repository).
+    - Keyset pagination on (TimeTicketSold, TicketSaleID), served by
+      idx_ticketsales_customer_sold_at, so every page costs the same.
     """
-    conn = None
-    cursor = None
-
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        query = """
-            SELECT
-                ts.TicketSaleID   AS ticket_sale_id,
-                m.Title      AS movie_title,
-                ts.ShowtimeID   AS showtime_id,
-                s.TheaterID    AS theater_id,
-                s.StartTime    AS start_time,
-                ts.TicketPrice  AS ticket_price,
-                ts.TimeTicketSold AS time_ticket_sold
-            FROM TicketSales ts
-            JOIN Showtimes s ON ts.ShowtimeID = s.ShowtimeID
-            JOIN Movies    m ON s.MovieID    = m.MovieID
-            WHERE ts.CustomerID = %s
-            ORDER BY ts.TimeTicketSold DESC
-        """
-        cursor.execute(query, (customer_id,))
-        rows = cursor.fetchall()
-
-        return [
-            CustomerTicketHistoryEntry(
-                ticket_sale_id=row["ticket_sale_id"],
-                movie_title=row["movie_title"],
-                showtime_id=row["showtime_id"],
-                theater_id=row["theater_id"],
-                start_time=row["start_time"],
-                ticket_price=float(row["ticket_price"]),
-                time_ticket_sold=row["time_ticket_sold"],
-            )
-            for row in rows
-        ]
+        after = decode_cursor(cursor) if cursor is not None else None
+        # One extra row tells us whether there is a next page
+        rows = get_repository().customer_ticket_history(customer_id, limit + 1, after)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["time_ticket_sold"], last["ticket_sale_id"])
+
+        return CustomerTicketHistoryPage(
+            items=[CustomerTicketHistoryEntry(**row) for row in rows],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
 
+    except (HTTPException, PoolError):
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Database error while fetching ticket history: {e}",
         )
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
 
 
 @router.get(
     "",
-    response_model=List[TicketSaleRead],
+    response_model=TicketSalePage,
     summary="List all ticket sales",
     description=(
-        "Returns every ticket sale in the system. "
+        "Returns ticket sales newest first, one page at a time. "
+        "Pass next_cursor back as `cursor` for the next page. "
         "Useful as a general admin/debugging endpoint."
     ),
 )
-def list_all_tickets():
+def list_all_tickets(
+    limit: int = Query(
+        DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    fast: bool = Query(
+        False, description="Skip model validation and encode JSON directly (same schema)"
+    ),
+):
     """
     General endpoint:
 
-    - Output: list of all TicketSales records in the database.
+    - Input: page size and optional cursor.
+    - Output: one page of TicketSales records.
 
     Implementation notes:
-    - Simple SELECT from TicketSales, ordered by TimeTicketSold, most recent first
+    - SELECT from TicketSales ordered by (TimeTicketSold, TicketSaleID), most
+      recent first (repository).
+    - Keyset pagination (no OFFSET) served by idx_ticketsales_sold_at, so
+      page N costs the same as page 1 regardless of table size.
+    - fast=true returns the repository's JSON-ready dicts as a
+      FastJSONResponse, skipping the Pydantic models and the response_model pass.
     """
-    conn = None
-    cursor = None
-
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-
-        query = """
-            SELECT
-                TicketSaleID AS ticket_sale_id,
-                CustomerID   AS customer_id,
-                ShowtimeID   AS showtime_id,
-                TicketPrice  AS ticket_price,
-                TimeTicketSold AS time_ticket_sold
-            FROM TicketSales
-            ORDER BY TimeTicketSold DESC
-        """
-        cursor.execute(query)
-        rows = cursor.fetchall()
-
-        return [
-            TicketSaleRead(
-                ticket_sale_id=row["ticket_sale_id"],
-                customer_id=row["customer_id"],
-                showtime_id=row["showtime_id"],
-                ticket_price=float(row["ticket_price"]),
-                time_ticket_sold=row["time_ticket_sold"],
+        after = decode_cursor(cursor) if cursor is not None else None
+        # One extra row tells us whether there is a next page
+        rows = get_repository().list_tickets(limit + 1, after)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["time_ticket_sold"], last["ticket_sale_id"])
+
+        if fast:
+            return fastjson.FastJSONResponse(
+                {"items": rows, "limit": limit, "next_cursor": next_cursor}
             )
-            for row in rows
-        ]
 
+        return TicketSalePage(
+            items=[TicketSaleRead(**row) for row in rows],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+
+    except (HTTPException, PoolError):
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Database error while fetching all ticket sales: {e}",
         )
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
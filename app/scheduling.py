@@ -0,0 +1,41 @@
+import heapq
+from collections import defaultdict
+
+
+def find_conflicts(new, existing=()):
+    """
+    Find every overlapping pair of showtimes that involves at least one new
+    showtime, using a sort-and-sweep per auditorium.
+
+    `new` is a list of (theater_id, start, end); the i-th entry is reported
+    by its index. `existing` is a list of (showtime_id, theater_id, start,
+    end) already in the database. Showtimes are half-open [start, end), the
+    same rule as the EnforceShowtimeOverlap trigger, so back-to-back shows
+    don't conflict.
+
+    Returns a list of (index, other) tuples where other is ("new", index) or
+    ("existing", showtime_id), ordered by index. O(n log n + conflicts).
+    """
+    by_theater = defaultdict(list)
+    for index, (theater_id, start, end) in enumerate(new):
+        by_theater[theater_id].append((start, end, "new", index))
+    for showtime_id, theater_id, start, end in existing:
+        if theater_id in by_theater:
+            by_theater[theater_id].append((start, end, "existing", showtime_id))
+
+    conflicts = []
+    for intervals in by_theater.values():
+        intervals.sort()
+        active = []  # heap of (end, kind, ref) still running at the sweep line
+        for start, end, kind, ref in intervals:
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _, other_kind, other_ref in active:
+                if kind == "new":
+                    conflicts.append((ref, (other_kind, other_ref)))
+                elif other_kind == "new":
+                    conflicts.append((other_ref, (kind, ref)))
+            heapq.heappush(active, (end, kind, ref))
+
+    conflicts.sort(key=lambda c: (c[0], c[1][0] != "existing", c[1][1]))
+    return conflicts
@@ -0,0 +1,62 @@
+import os
+import threading
+import time
+
+# How long a showtime stays in the fast-reject set. Sold out is permanent in
+# practice, the TTL only bounds how long a manual fix (check_tickets_sold
+# --fix, refunds) takes to be noticed by a running server.
+SOLDOUT_TTL = float(os.getenv("SOLDOUT_TTL", "300"))
+
+# Procedure/trigger messages that mean "no seats left"
+SOLD_OUT_MESSAGES = ("Sold out", "Auditorium full")
+
+_expires = {}  # showtime_id -> monotonic expiry
+_lock = threading.Lock()
+_rejected = 0
+
+
+def mark(showtime_id):
+    """Remember that `showtime_id` has no seats left."""
+    with _lock:
+        _expires[showtime_id] = time.monotonic() + SOLDOUT_TTL
+
+
+def mark_if_sold_out(showtime_id, message):
+    """mark() the showtime when a purchase failed because it is full."""
+    if any(text in message for text in SOLD_OUT_MESSAGES):
+        mark(showtime_id)
+
+
+def is_sold_out(showtime_id):
+    """
+    True if a purchase for `showtime_id` can be rejected without asking
+    MySQL. Each True answer is counted as a fast reject in stats().
+    """
+    global _rejected
+    with _lock:
+        expires_at = _expires.get(showtime_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del _expires[showtime_id]
+            return False
+        _rejected += 1
+        return True
+
+
+def forget(showtime_id=None):
+    """Drop one showtime (or all of them), e.g. after seats were freed."""
+    with _lock:
+        if showtime_id is None:
+            _expires.clear()
+        else:
+            _expires.pop(showtime_id, None)
+
+
+def stats():
+    with _lock:
+        return {
+            "ttl_s": SOLDOUT_TTL,
+            "showtimes": len(_expires),
+            "fast_rejects": _rejected,
+        }
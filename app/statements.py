@@ -0,0 +1,135 @@
+"""
+Server-side prepared statements for hot parameterized queries.
+
+Each pooled connection keeps a small LRU registry of prepared cursors keyed
+by SQL text. The first call with a given SQL on a connection prepares it
+(COM_STMT_PREPARE). Later calls, including from later checkouts of the same
+connection, only send COM_STMT_EXECUTE with the new parameters, so MySQL
+skips parsing and planning the text again.
+
+The registry belongs to the physical connection: the pool drops it with the
+connection when that is recycled or replaced. If the connection reconnected
+underneath (new connection id), the server has already forgotten the
+statements, so the registry starts over instead of using stale handles.
+
+DB_PREPARED_STATEMENTS caps the statements per connection (default 32, keep
+connections * cap below MySQL's max_prepared_stmt_count); 0 sends plain text
+queries instead.
+"""
+
+import os
+from collections import OrderedDict
+
+import mysql.connector
+
+from app import metrics
+
+MAX_STATEMENTS = int(os.getenv("DB_PREPARED_STATEMENTS", "32"))
+
+# ER_UNKNOWN_STMT_HANDLER: the server no longer knows the statement id
+_UNKNOWN_STATEMENT = 1243
+# ER_MAX_PREPARED_STMT_COUNT_REACHED: server-wide limit, use text instead
+_TOO_MANY_STATEMENTS = 1461
+
+_STATEMENTS = metrics.Counter(
+    "theater_prepared_statements_total",
+    "Prepared statement lookups: reused (hit) or prepared on this connection (prepare).",
+    labels=("result",),
+)
+
+
+class StatementRegistry:
+    """Prepared cursors of one physical connection, least recently used first."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.connection_id = conn.connection_id
+        self._cursors = OrderedDict()
+
+    def cursor(self, sql):
+        """The prepared cursor for `sql`, creating it on first use."""
+        if self.conn.connection_id != self.connection_id:
+            # Reconnected: the handles belong to the old session. Don't close
+            # them, ids restart per session and could hit a new statement.
+            self._cursors.clear()
+            self.connection_id = self.conn.connection_id
+
+        cursor = self._cursors.get(sql)
+        if cursor is not None:
+            self._cursors.move_to_end(sql)
+            _STATEMENTS.inc("hit")
+            return cursor
+
+        while self._cursors and len(self._cursors) >= max(MAX_STATEMENTS, 1):
+            _, evicted = self._cursors.popitem(last=False)
+            _close_quietly(evicted)
+        cursor = self.conn.cursor(prepared=True)
+        self._cursors[sql] = cursor
+        _STATEMENTS.inc("prepare")
+        return cursor
+
+    def discard(self, sql):
+        """Drop (and deallocate) the statement for `sql`, e.g. after an error."""
+        cursor = self._cursors.pop(sql, None)
+        if cursor is not None:
+            _close_quietly(cursor)
+
+    def __len__(self):
+        return len(self._cursors)
+
+
+def _close_quietly(cursor):
+    try:
+        cursor.close()
+    except Exception:
+        pass
+
+
+def _rows(cursor, rows, dictionary):
+    if not dictionary:
+        return rows
+    columns = cursor.column_names
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def _text_fetchall(conn, name, sql, params, dictionary):
+    cursor = conn.cursor(dictionary=dictionary)
+    try:
+        return metrics.fetchall(cursor, name, sql, params)
+    finally:
+        cursor.close()
+
+
+def fetchall(conn, name, sql, params=(), dictionary=False):
+    """
+    metrics.fetchall() through the connection's prepared statement for `sql`.
+
+    Rows are tuples, or dicts keyed by column alias with dictionary=True.
+    Connections that don't come from app.pool (or MAX_STATEMENTS=0) run a
+    plain text query instead.
+    """
+    registry = getattr(conn, "statements", None)
+    if MAX_STATEMENTS <= 0 or registry is None:
+        return _text_fetchall(conn, name, sql, params, dictionary)
+
+    for attempt in range(2):
+        cursor = registry.cursor(sql)
+        try:
+            rows = metrics.fetchall(cursor, name, sql, tuple(params))
+            return _rows(cursor, rows, dictionary)
+        except mysql.connector.Error as e:
+            # Cursor state is unknown after an error; prepare afresh next time
+            registry.discard(sql)
+            if e.errno == _TOO_MANY_STATEMENTS:
+                return _text_fetchall(conn, name, sql, params, dictionary)
+            if e.errno != _UNKNOWN_STATEMENT or attempt:
+                raise
+
+
+def fetchone(conn, name, sql, params=(), dictionary=False):
+    """
+    Like fetchall() for single-row lookups. Reads the whole result, so
+    nothing is left unread on a statement that stays prepared.
+    """
+    rows = fetchall(conn, name, sql, params, dictionary)
+    return rows[0] if rows else None
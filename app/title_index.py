@@ -0,0 +1,219 @@
+"""
+In-process movie title index for title lookups and suggestions.
+
+Titles are normalized (accents stripped, case folded, punctuation turned
+into spaces), so "Amélie!" and "amelie" are the same key. Lookups try, in
+order: exact match, prefix of the title or of any word in it, and finally
+approximate matches within a bounded edit distance. The index is built from
+the movie catalog and cached like the other catalog data (tag "movies"), so
+cache.invalidate("movies") rebuilds it on the next lookup.
+"""
+
+import bisect
+import os
+import re
+import unicodedata
+
+from app.cache import TTLCache
+from app.repository import get_repository
+
+# Edit distance allowed for approximate matches; short queries get less so
+# "up" doesn't match every four-letter title
+MAX_EDIT_DISTANCE = int(os.getenv("TITLE_MAX_EDIT_DISTANCE", "2"))
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+_index_cache = TTLCache("movies.title_index", ttl=300, max_entries=1, tags=("movies",))
+
+
+def normalize(text):
+    """Lowercase ASCII words separated by single spaces."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", stripped.casefold()).strip()
+
+
+def edit_distance(a, b, bound):
+    """
+    Levenshtein distance between a and b, or bound + 1 as soon as it is
+    known to exceed `bound` (rows are abandoned once every cell is over it).
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ca != cb),
+                )
+            )
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return min(previous[-1], bound + 1)
+
+
+def prefix_distance(query, text, bound):
+    """
+    Smallest edit distance between `query` and any prefix of `text` (what a
+    user who mistyped the start of a title is closest to), capped at
+    bound + 1 like edit_distance().
+    """
+    text = text[: len(query) + bound]
+    previous = list(range(len(text) + 1))
+    for i, cq in enumerate(query, 1):
+        current = [i]
+        for j, ct in enumerate(text, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (cq != ct),
+                )
+            )
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return min(min(previous[max(0, len(query) - bound) :]), bound + 1)
+
+
+def distance_bound(query):
+    """Edit distance allowed for a normalized query of this length."""
+    if len(query) <= 3:
+        return 0
+    if len(query) <= 6:
+        return min(1, MAX_EDIT_DISTANCE)
+    return MAX_EDIT_DISTANCE
+
+
+class TitleIndex:
+    """
+    Normalized titles of a movie list.
+
+    `movies` are dicts with at least movie_id and title (repository rows).
+    Several movies can share a normalized title (remakes); lookups return
+    all of them.
+    """
+
+    def __init__(self, movies):
+        self._by_key = {}  # normalized title -> [(movie_id, title)]
+        for movie in movies:
+            key = normalize(movie["title"])
+            self._by_key.setdefault(key, []).append(
+                (movie["movie_id"], movie["title"])
+            )
+        # (suffix starting at a word, normalized title), sorted for bisect
+        self._words = sorted(
+            (" ".join(words[i:]), key)
+            for key in self._by_key
+            for words in [key.split()]
+            for i in range(len(words))
+        )
+        # Letters of each suffix, to skip hopeless ones before the DP
+        self._letters = [frozenset(suffix) for suffix, _ in self._words]
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def _prefixed(self, query):
+        """Normalized titles with a word starting with `query`, title prefixes first."""
+        titles = []
+        start = bisect.bisect_left(self._words, (query,))
+        for suffix, key in self._words[start:]:
+            if not suffix.startswith(query):
+                break
+            if key not in titles:
+                titles.append(key)
+        titles.sort(key=lambda key: (not key.startswith(query), key))
+        return titles
+
+    def _fuzzy(self, query, bound):
+        """
+        (distance, key) of titles with a word-aligned prefix within `bound`
+        edits of the query, closest first.
+        """
+        best = {}
+        letters = set(query)
+        for (suffix, key), suffix_letters in zip(self._words, self._letters):
+            # Every query letter the suffix lacks costs at least one edit
+            if len(letters - suffix_letters) > bound:
+                continue
+            distance = prefix_distance(query, suffix, bound)
+            if distance < best.get(key, bound + 1):
+                best[key] = distance
+        return sorted((distance, key) for key, distance in best.items())
+
+    def suggest(self, query, limit=10):
+        """
+        Up to `limit` (movie_id, title, match, distance) tuples, best first.
+        match is "exact", "prefix" (of the title or one of its words) or
+        "fuzzy".
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        ranked = []  # (match, distance, key)
+        seen = set()
+        if query in self._by_key:
+            ranked.append(("exact", 0, query))
+            seen.add(query)
+        for key in self._prefixed(query):
+            if key not in seen:
+                ranked.append(("prefix", 0, key))
+                seen.add(key)
+        if len(ranked) < limit:
+            for distance, key in self._fuzzy(query, distance_bound(query)):
+                if key not in seen:
+                    ranked.append(("fuzzy", distance, key))
+                    seen.add(key)
+
+        suggestions = []
+        for match, distance, key in ranked:
+            for movie_id, title in self._by_key[key]:
+                suggestions.append((movie_id, title, match, distance))
+        return suggestions[:limit]
+
+    def resolve(self, title):
+        """
+        MovieIDs the title most likely refers to, or [] if it is unknown or
+        ambiguous: the exact normalized title, else the only title (or title
+        word) starting with it, else the single closest title within the
+        edit bound.
+        """
+        query = normalize(title)
+        if not query:
+            return []
+        if query in self._by_key:
+            return [movie_id for movie_id, _ in self._by_key[query]]
+
+        prefixed = self._prefixed(query)
+        # Title prefixes beat word prefixes ("batman" -> Batman Begins, not
+        # The Batman), but either must be unambiguous
+        prefixed = [key for key in prefixed if key.startswith(query)] or prefixed
+        if len(prefixed) == 1:
+            return [movie_id for movie_id, _ in self._by_key[prefixed[0]]]
+        if prefixed:
+            return []
+
+        bound = distance_bound(query)
+        close = [
+            (distance, key)
+            for key in self._by_key
+            if (distance := edit_distance(query, key, bound)) <= bound
+        ]
+        close.sort()
+        if not close or (len(close) > 1 and close[0][0] == close[1][0]):
+            return []
+        return [movie_id for movie_id, _ in self._by_key[close[0][1]]]
+
+
+def get_title_index():
+    """The index over the current catalog (rebuilt when "movies" is invalidated)."""
+    return _index_cache.get_or_load(
+        "all", lambda: TitleIndex(get_repository().list_movies())
+    )
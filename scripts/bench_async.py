@@ -0,0 +1,84 @@
+"""
+Benchmark the threadpool (sync) endpoints against their aiomysql versions.
+
+Start the server first (e.g. `uvicorn app.main:app --workers 1`), then run
+from the project root:
+
+    python -m scripts.bench_async --base-url http://127.0.0.1:8000
+
+Every concurrency level is run against /api (sync handlers) and /api/async
+(async handlers) with the same request mix, and requests/sec plus p50/p99
+latency are printed for each.
+"""
+
+import argparse
+import asyncio
+
+from scripts.loadgen import format_table, run_load
+
+# Mix of the catalog and report endpoints the dashboard hits most
+REQUEST_MIX = [
+    "/movies",
+    "/movies/now-playing",
+    "/reports/upcoming-showtimes",
+    "/reports/showtime-availability?showtime_id=1",
+    "/reports/concessions/top-categories",
+    "/reports/movie-lifetime-sales?movie_id=1",
+    "/tickets/customers/1/tickets",
+]
+
+VERSIONS = {"sync": "/api", "async": "/api/async"}
+
+
+def _request_factory(i):
+    return "GET", REQUEST_MIX[i % len(REQUEST_MIX)], None
+
+
+async def main(args):
+    rows = []
+    for concurrency in args.concurrency:
+        for version, prefix in VERSIONS.items():
+            # Short warm-up so both versions start with a filled pool
+            await run_load(args.base_url + prefix, _request_factory, concurrency, total=concurrency)
+            result = await run_load(
+                args.base_url + prefix,
+                _request_factory,
+                concurrency,
+                duration=args.duration,
+            )
+            rows.append(
+                [
+                    version,
+                    concurrency,
+                    result.requests,
+                    f"{result.rps:.1f}",
+                    f"{result.percentile(50):.1f}",
+                    f"{result.percentile(99):.1f}",
+                    result.errors + sum(n for s, n in result.statuses.items() if s >= 500),
+                ]
+            )
+            print(f"done: {version} @ {concurrency}", flush=True)
+
+    print()
+    print(
+        format_table(
+            ["version", "clients", "requests", "req/s", "p50 ms", "p99 ms", "errors"],
+            rows,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[50, 100, 250, 500],
+        help="Concurrent client counts to test",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=15.0, help="Seconds per run"
+    )
+    asyncio.run(main(parser.parse_args()))
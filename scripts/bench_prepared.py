@@ -0,0 +1,193 @@
+"""
+Benchmark prepared statements against plain text queries on the hot lookups.
+
+Runs in-process against the configured database (no server needed). Worker
+threads call seat availability, customer ticket history, movie lifetime
+sales and movie profit back to back with random IDs, once with
+DB_PREPARED_STATEMENTS behaviour on and once with plain text queries. From
+the project root:
+
+    python -m scripts.bench_prepared --concurrency 8 32 64 --duration 10
+
+Per run it reports client throughput and p50/p99 latency, plus the server
+side: statement CPU time from performance_schema (MySQL 8.0.28+, "n/a"
+otherwise) per 1000 requests, and the COM_STMT_PREPARE / COM_STMT_EXECUTE /
+text SELECT counts. The server counters are global and read on the primary,
+so run it on an otherwise idle server without DB_REPLICA_HOSTS. Concurrency
+above DB_POOL_SIZE queues for connections.
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from app import statements
+from app.db import get_connection
+from app.repository.mysql import MySQLRepository
+from app.routers import reports, tickets
+from scripts.loadgen import LoadResult, format_table
+
+_STATUS = ("Com_stmt_prepare", "Com_stmt_execute", "Com_select")
+
+
+def _ids(cursor, query):
+    cursor.execute(query)
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _sample_ids():
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        return {
+            "showtime": _ids(cursor, "SELECT ShowtimeID FROM Showtimes"),
+            "movie": _ids(cursor, "SELECT MovieID FROM Movies"),
+            "customer": _ids(
+                cursor, "SELECT DISTINCT CustomerID FROM TicketSales LIMIT 1000"
+            ),
+        }
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def _server_counters():
+    """(statement CPU seconds or None, {status name: value})"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        try:
+            cursor.execute(
+                """
+                SELECT SUM(SUM_CPU_TIME)
+                FROM performance_schema.events_statements_summary_global_by_event_type
+                """
+            )
+            (picoseconds,) = cursor.fetchone()
+            cpu = float(picoseconds) / 1e12 if picoseconds is not None else None
+        except Exception:
+            cpu = None
+        cursor.execute(
+            "SHOW GLOBAL STATUS WHERE Variable_name IN (%s, %s, %s)", _STATUS
+        )
+        status = {name: int(value) for name, value in cursor.fetchall()}
+    finally:
+        cursor.close()
+        conn.close()
+    return cpu, status
+
+
+def _calls(ids):
+    repo = MySQLRepository()
+    return [
+        lambda: repo.showtime_availability(random.choice(ids["showtime"])),
+        lambda: tickets.get_customer_ticket_history(
+            customer_id=random.choice(ids["customer"]), limit=20, cursor=None
+        ),
+        lambda: reports.get_movie_lifetime_sales(movie_id=random.choice(ids["movie"])),
+        lambda: reports.get_movie_profit(movie_id=random.choice(ids["movie"])),
+    ]
+
+
+def run(calls, concurrency, duration):
+    result = LoadResult(concurrency)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        latencies = []
+        errors = 0
+        while time.perf_counter() < deadline:
+            call = random.choice(calls)
+            started = time.perf_counter()
+            try:
+                call()
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+        with lock:
+            result.latencies.extend(latencies)
+            result.statuses[200] = result.statuses.get(200, 0) + len(latencies)
+            result.errors += errors
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def main(args):
+    random.seed(args.seed)
+    calls = _calls(_sample_ids())
+    max_statements = statements.MAX_STATEMENTS or 32
+
+    rows = []
+    for concurrency in args.concurrency:
+        for mode, cap in (("text", 0), ("prepared", max_statements)):
+            statements.MAX_STATEMENTS = cap
+            # Warm up: fill the pool and prepare on every connection
+            run(calls, concurrency, 1)
+            cpu_before, status_before = _server_counters()
+            result = run(calls, concurrency, args.duration)
+            cpu_after, status_after = _server_counters()
+
+            per_1k = 1000 / max(result.requests, 1)
+            if cpu_before is None or cpu_after is None:
+                cpu_text = "n/a"
+            else:
+                cpu_text = f"{(cpu_after - cpu_before) * 1000 * per_1k:.1f}"
+            delta = {n: status_after[n] - status_before[n] for n in _STATUS}
+            rows.append(
+                [
+                    concurrency,
+                    mode,
+                    result.requests,
+                    result.errors,
+                    f"{result.rps:.0f}",
+                    f"{result.percentile(50):.2f}",
+                    f"{result.percentile(99):.2f}",
+                    cpu_text,
+                    delta["Com_stmt_prepare"],
+                    delta["Com_stmt_execute"],
+                    delta["Com_select"],
+                ]
+            )
+            print(f"concurrency={concurrency} {mode}: {result.rps:.0f} req/s")
+
+    print()
+    print(
+        format_table(
+            [
+                "concurrency",
+                "mode",
+                "requests",
+                "errors",
+                "req/s",
+                "p50 ms",
+                "p99 ms",
+                "server cpu ms/1k req",
+                "prepares",
+                "executes",
+                "text selects",
+            ],
+            rows,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[8, 32, 64]
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10, help="Seconds per measured run"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
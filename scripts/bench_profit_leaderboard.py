@@ -0,0 +1,116 @@
+"""
+Benchmark the profit leaderboard against per-movie get_movie_profits calls.
+
+Runs in-process against the configured database (no server needed). From the
+project root:
+
+    python -m scripts.bench_profit_leaderboard --repeat 20
+
+Three ways of ranking the whole catalog are timed:
+
+- per-movie:  GET /movies/{id}/profit once per movie (N round trips, 2N queries)
+- embedded:   SELECT get_movie_profits(MovieID) FROM Movies (one round trip,
+              MySQL still runs the function row by row)
+- leaderboard: GET /movies/profit-leaderboard (one grouped join)
+
+The script also checks that the leaderboard and get_movie_profits agree on
+every movie's net profit, and exits 1 if they don't.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from app.db import get_connection
+from app.routers import reports
+from scripts.loadgen import format_table
+
+
+def _movie_ids():
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT MovieID FROM Movies ORDER BY MovieID")
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def per_movie(movie_ids):
+    return {m: reports.get_movie_profit(movie_id=m).net_profit for m in movie_ids}
+
+
+def embedded(movie_ids):
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT MovieID, get_movie_profits(MovieID)
+            FROM Movies
+            ORDER BY get_movie_profits(MovieID) DESC
+            """
+        )
+        return {movie_id: float(net) for movie_id, net in cursor.fetchall()}
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def leaderboard(movie_ids):
+    entries = reports.get_movie_profit_leaderboard(
+        start_date=None, end_date=None, sort="net_profit", order="desc", limit=None
+    )
+    return {entry.movie_id: entry.net_profit for entry in entries}
+
+
+APPROACHES = {
+    "per-movie": per_movie,
+    "embedded": embedded,
+    "leaderboard": leaderboard,
+}
+
+
+def main(args):
+    movie_ids = _movie_ids()
+    print(f"{len(movie_ids)} movies, {args.repeat} runs per approach", flush=True)
+
+    rows = []
+    results = {}
+    for name, approach in APPROACHES.items():
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            results[name] = approach(movie_ids)
+            timings.append((time.perf_counter() - started) * 1000)
+        rows.append(
+            [
+                name,
+                f"{statistics.median(timings):.2f}",
+                f"{max(timings):.2f}",
+            ]
+        )
+
+    print()
+    print(format_table(["approach", "median ms", "max ms"], rows))
+
+    mismatched = [
+        m
+        for m in movie_ids
+        if abs(results["leaderboard"].get(m, 0.0) - results["per-movie"][m]) >= 0.01
+    ]
+    if mismatched:
+        print(f"\nFAIL: leaderboard disagrees with get_movie_profits for {mismatched}")
+        return 1
+    print("\nOK: leaderboard matches get_movie_profits for every movie")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Timed runs per approach"
+    )
+    sys.exit(main(parser.parse_args()))
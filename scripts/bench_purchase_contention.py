@@ -0,0 +1,117 @@
+"""
+Fire thousands of parallel purchases at one showtime and check for oversell.
+
+Pick a future showtime with free seats, start the server, then run from the
+project root:
+
+    python -m scripts.bench_purchase_contention --showtime-id 3
+
+Every request buys one ticket for the same showtime, so all of them contend
+for the same Showtimes row. Afterwards the script recounts TicketSales
+through the repository (same DB_BACKEND settings as the server) and exits 1
+if the auditorium was oversold, if TicketsSold drifted from the real count,
+or if the number of 200 responses doesn't match the number of new rows.
+Throughput and latency are printed for the run; once the showtime is full
+the remaining requests measure the sold-out fast-reject path.
+
+With DB_BACKEND=sqlite, point both the server and this script at the same
+database file (SQLITE_PATH), the default in-memory database is per process.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.repository import get_repository
+from scripts.loadgen import format_table, run_load
+
+
+def _snapshot(showtime_id):
+    """(capacity, TicketsSold counter, real ticket count) for one showtime."""
+    counts = get_repository().ticket_counts(showtime_id)
+    if counts is None:
+        raise SystemExit(f"Showtime {showtime_id} not found.")
+    return counts["seat_capacity"], counts["tickets_sold"], counts["ticket_rows"]
+
+
+async def main(args):
+    capacity, _, sold_before = _snapshot(args.showtime_id)
+    print(
+        f"showtime {args.showtime_id}: capacity={capacity} sold={sold_before}, "
+        f"sending {args.total} purchases with {args.concurrency} clients",
+        flush=True,
+    )
+
+    body = {"customer_id": args.customer_id, "showtime_id": args.showtime_id}
+
+    def request_factory(i):
+        return "POST", "/tickets/purchase", body
+
+    result = await run_load(
+        args.base_url + args.prefix,
+        request_factory,
+        args.concurrency,
+        total=args.total,
+    )
+
+    _, counter_after, sold_after = _snapshot(args.showtime_id)
+    booked = result.statuses.get(200, 0)
+    new_rows = sold_after - sold_before
+
+    print()
+    print(
+        format_table(
+            ["requests", "req/s", "p50 ms", "p99 ms", "200", "400", "5xx/errors"],
+            [
+                [
+                    result.requests,
+                    f"{result.rps:.1f}",
+                    f"{result.percentile(50):.1f}",
+                    f"{result.percentile(99):.1f}",
+                    booked,
+                    result.statuses.get(400, 0),
+                    result.errors
+                    + sum(n for s, n in result.statuses.items() if s >= 500),
+                ]
+            ],
+        )
+    )
+    print()
+    print(
+        f"tickets sold: {sold_after}/{capacity} "
+        f"(TicketsSold={counter_after}, new rows={new_rows}, 200 responses={booked})"
+    )
+
+    failures = []
+    if sold_after > capacity:
+        failures.append(f"oversold by {sold_after - capacity}")
+    if counter_after != sold_after:
+        failures.append("TicketsSold does not match TicketSales")
+    if new_rows != booked:
+        failures.append("200 responses do not match inserted rows")
+
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        return 1
+    print("OK: no oversell")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--prefix",
+        default="/api",
+        choices=["/api", "/api/async"],
+        help="Purchase through the sync or the async endpoint",
+    )
+    parser.add_argument("--showtime-id", type=int, required=True)
+    parser.add_argument("--customer-id", type=int, default=1)
+    parser.add_argument(
+        "--total", type=int, default=5000, help="Number of purchase requests"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=200, help="Parallel clients"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,81 @@
+"""
+Compare the default and ?fast=true serialization paths of the list endpoints.
+
+Start the server first, then run from the project root:
+
+    python -m scripts.bench_serialization --base-url http://127.0.0.1:8000
+
+Every endpoint is driven with and without fast=true, and requests/sec,
+rows/sec and p50/p99 latency are printed for each. Start the server with
+CACHE_ENABLED=0 to include the query and row decoding in every request;
+with caching on, the fast path serves pre-encoded bytes.
+"""
+
+import argparse
+import asyncio
+import json
+import urllib.request
+
+from scripts.loadgen import format_table, run_load
+
+ENDPOINTS = [
+    "/movies",
+    "/reports/upcoming-showtimes",
+    "/tickets?limit=500",
+]
+
+
+def _row_count(url):
+    """Rows in one response (list endpoints or a page's items)."""
+    with urllib.request.urlopen(url) as resp:
+        body = json.load(resp)
+    return len(body["items"] if isinstance(body, dict) else body)
+
+
+def _with_fast(path):
+    return path + ("&" if "?" in path else "?") + "fast=true"
+
+
+async def main(args):
+    base = args.base_url + "/api"
+    rows = []
+    for endpoint in ENDPOINTS:
+        for mode, path in (("default", endpoint), ("fast", _with_fast(endpoint))):
+            row_count = _row_count(base + path)
+            result = await run_load(
+                base,
+                lambda i, path=path: ("GET", path, None),
+                args.concurrency,
+                duration=args.duration,
+            )
+            rows.append(
+                [
+                    endpoint,
+                    mode,
+                    row_count,
+                    f"{result.rps:.1f}",
+                    f"{result.rps * row_count:.0f}",
+                    f"{result.percentile(50):.1f}",
+                    f"{result.percentile(99):.1f}",
+                ]
+            )
+            print(f"done: {endpoint} ({mode})", flush=True)
+
+    print()
+    print(
+        format_table(
+            ["endpoint", "mode", "rows", "req/s", "rows/s", "p50 ms", "p99 ms"], rows
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Concurrent clients"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="Seconds per run"
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,489 @@
+"""
+Query plan baseline and regression check for the named report/ticket/movie queries.
+
+Runs the sync report, ticket and movie handlers (and the MySQL repository
+behind the catalog endpoints) once each with sample parameters taken from
+the data, captures every named query they send (metrics.capture_queries)
+and runs EXPLAIN FORMAT=JSON on it. Per table it records the access type,
+the chosen key and the estimated rows examined per scan. Run from the
+project root:
+
+    # record the baseline on a generated dataset
+    python -m scripts.check_query_plans --generate-days 365 --update
+
+    # later, after a schema or query change: exits 1 on a regression
+    python -m scripts.check_query_plans
+
+A query regresses when a table's access type gets worse (e.g. ref -> ALL),
+it loses its key, or its examined rows grow by more than --max-row-growth.
+Row estimates depend on the data, so compare against a baseline recorded on
+the same dataset (same --generate-days / --seed on a fresh schema).
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+from app import metrics
+from app.db import get_connection
+from app.repository.mysql import MySQLRepository
+from app.routers import reports, tickets
+from scripts.generate_data import generate
+from scripts.loadgen import format_table
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = ROOT / "scripts" / "query_plans.json"
+
+# Sources scanned for query names, to report the ones no probe reaches
+SOURCES = (
+    "app/routers/reports.py",
+    "app/routers/tickets.py",
+    "app/routers/movies.py",
+    "app/repository/mysql.py",
+)
+_NAME_PATTERN = re.compile(
+    r'(?:metrics\.\w+|statements\.\w+|_fetch)\(\s*(?:\w+,\s*)?"([a-z_]+(?:\.[a-z_]+)+)"'
+)
+
+# MySQL EXPLAIN access types, best first
+ACCESS_TYPES = (
+    "system",
+    "const",
+    "eq_ref",
+    "ref",
+    "fulltext",
+    "ref_or_null",
+    "index_merge",
+    "unique_subquery",
+    "index_subquery",
+    "range",
+    "index",
+    "ALL",
+)
+
+# Tables worth refreshing statistics on before EXPLAIN (--analyze)
+ANALYZE_TABLES = (
+    "Movies",
+    "Customers",
+    "Auditoriums",
+    "Showtimes",
+    "TicketSales",
+    "ConcessionSales",
+    "DailySalesRollup",
+    "ConcessionSalesCube",
+)
+
+
+def _sample_params(conn):
+    """Latest sales day, the most scheduled movie and its busiest showtime."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT DATE(MAX(TimeTicketSold)) FROM TicketSales")
+        (day,) = cursor.fetchone()
+        cursor.execute(
+            """
+            SELECT m.MovieID, m.Title
+            FROM Showtimes s
+            JOIN Movies m ON s.MovieID = m.MovieID
+            GROUP BY m.MovieID, m.Title
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+            """
+        )
+        movie_id, title = cursor.fetchone()
+        cursor.execute(
+            """
+            SELECT ShowtimeID, TheaterID, DATE(StartTime)
+            FROM Showtimes
+            WHERE MovieID = %s
+            ORDER BY TicketsSold DESC, ShowtimeID
+            LIMIT 1
+            """,
+            (movie_id,),
+        )
+        showtime_id, theater_id, show_day = cursor.fetchone()
+        cursor.execute(
+            """
+            SELECT CustomerID
+            FROM TicketSales
+            GROUP BY CustomerID
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+            """
+        )
+        (customer_id,) = cursor.fetchone()
+    finally:
+        cursor.close()
+    return {
+        "day": day,
+        "from": day - timedelta(days=90),
+        "movie_id": movie_id,
+        "title": title,
+        "showtime_id": showtime_id,
+        "theater_id": theater_id,
+        "show_day": show_day,
+        "customer_id": customer_id,
+    }
+
+
+def _probes(p):
+    """
+    (variant, call) pairs that together run every named query once.
+
+    Handlers are called directly, so every Query() parameter is passed.
+    Cached endpoints are probed through the repository they load from.
+    """
+    repo = MySQLRepository()
+
+    def next_page(handler, **kwargs):
+        page = handler(limit=50, cursor=None, **kwargs)
+        if page.next_cursor is not None:
+            handler(limit=50, cursor=page.next_cursor, **kwargs)
+
+    return [
+        ("", repo.ping),
+        ("", repo.list_movies),
+        ("", repo.list_now_playing_movies),
+        ("", repo.list_upcoming_movies),
+        ("", repo.list_customers),
+        ("", lambda: repo.search_customers("Jo", 10)),
+        ("two words", lambda: repo.search_customers("Jo Sm", 10)),
+        ("", repo.list_showtimes),
+        ("", lambda: repo.showtime_availability(p["showtime_id"])),
+        ("", lambda: repo.ticket_counts(p["showtime_id"])),
+        ("", lambda: repo.upcoming_showtimes()),
+        ("days_ahead", lambda: repo.upcoming_showtimes(days_ahead=7)),
+        ("", repo.tickets_sold_today),
+        (
+            "",
+            lambda: reports.get_movie_showtimes(
+                title=p["title"], show_date=p["show_day"]
+            ),
+        ),
+        (
+            "ids",
+            lambda: reports.get_showtime_availability_batch(
+                showtime_ids=[p["showtime_id"]], show_date=None, theater_id=None
+            ),
+        ),
+        (
+            "date+theater",
+            lambda: reports.get_showtime_availability_batch(
+                showtime_ids=None,
+                show_date=p["show_day"],
+                theater_id=p["theater_id"],
+            ),
+        ),
+        ("", lambda: reports.get_concession_category_revenue(limit=None)),
+        (
+            "",
+            lambda: reports.get_concession_cube(
+                start_date=p["from"],
+                end_date=p["day"],
+                dimensions=["weekday", "hour"],
+                category=None,
+            ),
+        ),
+        ("", lambda: reports.get_movie_lifetime_sales(movie_id=p["movie_id"])),
+        ("", lambda: reports.get_daily_ticket_sales(target_date=p["day"])),
+        (
+            "",
+            lambda: reports.get_sales_series(
+                start_date=p["from"],
+                end_date=p["day"],
+                granularity="day",
+                movie_id=None,
+                theater_id=None,
+            ),
+        ),
+        (
+            "movie",
+            lambda: reports.get_sales_series(
+                start_date=p["from"],
+                end_date=p["day"],
+                granularity="week",
+                movie_id=p["movie_id"],
+                theater_id=None,
+            ),
+        ),
+        (
+            "",
+            lambda: reports.get_movie_profit_leaderboard(
+                start_date=None,
+                end_date=None,
+                sort="net_profit",
+                order="desc",
+                limit=None,
+            ),
+        ),
+        (
+            "window",
+            lambda: reports.get_movie_profit_leaderboard(
+                start_date=p["from"],
+                end_date=p["day"],
+                sort="revenue",
+                order="desc",
+                limit=10,
+            ),
+        ),
+        ("", lambda: reports.get_movie_profit(movie_id=p["movie_id"])),
+        ("pages", lambda: next_page(tickets.list_all_tickets, fast=False)),
+        (
+            "pages",
+            lambda: next_page(
+                tickets.get_customer_ticket_history, customer_id=p["customer_id"]
+            ),
+        ),
+    ]
+
+
+def capture(params):
+    """Run every probe; returns {key: (name, sql, params)} in first-seen order."""
+    queries = {}
+    for variant, call in _probes(params):
+        with metrics.capture_queries() as captured:
+            try:
+                call()
+            except Exception as e:
+                # Queries that ran before the error are still explained
+                print(f"warning: probe failed ({variant or 'default'}): {e}")
+        seen = {}
+        for name, sql, query_params in captured:
+            seen[name] = seen.get(name, 0) + 1
+            key = name
+            if variant:
+                key += f" [{variant}]"
+            if seen[name] > 1:
+                # e.g. the second (keyset) page of a paginated query
+                key += f" #{seen[name]}"
+            queries.setdefault(key, (name, sql, query_params))
+    return queries
+
+
+def _table_plans(node, found):
+    """Depth-first walk of EXPLAIN FORMAT=JSON collecting every table access."""
+    if isinstance(node, dict):
+        if "access_type" in node:
+            found.append(
+                {
+                    "table": node.get("table_name", "?"),
+                    "access_type": node["access_type"],
+                    "key": node.get("key"),
+                    "rows": node.get("rows_examined_per_scan", 0),
+                }
+            )
+        for value in node.values():
+            _table_plans(value, found)
+    elif isinstance(node, list):
+        for value in node:
+            _table_plans(value, found)
+    return found
+
+
+def explain(conn, sql, params):
+    """Per-table plan of one statement, in EXPLAIN order."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("EXPLAIN FORMAT=JSON " + sql, params or ())
+        (plan,) = cursor.fetchone()
+    finally:
+        cursor.close()
+    return _table_plans(json.loads(plan), [])
+
+
+def _normalize(sql):
+    return " ".join(str(sql).split())
+
+
+def compare(baseline, current, max_row_growth, min_rows):
+    """
+    Yields (status, key, table, current plan, baseline plan, reason) rows.
+    status is "ok", "changed" (worth a look) or "REGRESSION".
+    """
+    for key, entry in current.items():
+        old = baseline.get(key)
+        if old is None:
+            yield "changed", key, None, None, None, "new query"
+            continue
+        if old["sql"] != entry["sql"]:
+            yield "changed", key, None, None, None, "SQL text changed"
+
+        old_tables = {}
+        for plan in old["tables"]:
+            old_tables.setdefault(plan["table"], []).append(plan)
+        for plan in entry["tables"]:
+            candidates = old_tables.get(plan["table"])
+            if not candidates:
+                yield "changed", key, plan["table"], plan, None, "new table access"
+                continue
+            before = candidates.pop(0)
+            yield _compare_table(key, plan, before, max_row_growth, min_rows)
+        for table, leftover in old_tables.items():
+            for before in leftover:
+                yield "changed", key, table, None, before, "table no longer accessed"
+
+    for key in baseline:
+        if key not in current:
+            yield "changed", key, None, None, None, "not captured any more"
+
+
+def _compare_table(key, plan, before, max_row_growth, min_rows):
+    table = plan["table"]
+
+    def rank(access_type):
+        # Unknown types sort as worst so they get looked at
+        if access_type in ACCESS_TYPES:
+            return ACCESS_TYPES.index(access_type)
+        return len(ACCESS_TYPES)
+
+    if rank(plan["access_type"]) > rank(before["access_type"]):
+        reason = f"access {before['access_type']} -> {plan['access_type']}"
+        return "REGRESSION", key, table, plan, before, reason
+    if before["key"] and not plan["key"]:
+        reason = f"no longer uses {before['key']}"
+        return "REGRESSION", key, table, plan, before, reason
+    if plan["rows"] > min_rows and plan["rows"] > before["rows"] * max_row_growth:
+        reason = f"rows {before['rows']} -> {plan['rows']}"
+        return "REGRESSION", key, table, plan, before, reason
+    if plan["key"] != before["key"]:
+        reason = f"key {before['key']} -> {plan['key']}"
+        return "changed", key, table, plan, before, reason
+    return "ok", key, table, plan, before, ""
+
+
+def _static_names():
+    names = set()
+    for source in SOURCES:
+        names.update(_NAME_PATTERN.findall((ROOT / source).read_text()))
+    return names
+
+
+def _format_plan(plan):
+    if plan is None:
+        return "-"
+    return f"{plan['access_type']} {plan['key'] or '-'} {plan['rows']}"
+
+
+def main(args):
+    conn = get_connection()
+    try:
+        if args.generate_days:
+            counts = generate(conn, args.generate_days, args.seed)
+            print(
+                f"generated {counts['Showtimes']} showtimes and "
+                f"{counts['TicketSales']} ticket sales"
+            )
+        if args.analyze:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("ANALYZE TABLE " + ", ".join(ANALYZE_TABLES))
+                cursor.fetchall()
+            finally:
+                cursor.close()
+
+        params = _sample_params(conn)
+        print("params: " + ", ".join(f"{k}={v}" for k, v in params.items()))
+
+        current = {}
+        skipped = []
+        for key, (name, sql, query_params) in capture(params).items():
+            if not _normalize(sql).upper().startswith(("SELECT", "WITH")):
+                skipped.append(key)
+                continue
+            current[key] = {
+                "query": name,
+                "sql": _normalize(sql),
+                "tables": explain(conn, sql, query_params),
+            }
+    finally:
+        conn.close()
+
+    not_reached = sorted(_static_names() - {e["query"] for e in current.values()})
+    if skipped:
+        print("not explained (no SELECT): " + ", ".join(skipped))
+    if not_reached:
+        print("not exercised by any probe: " + ", ".join(not_reached))
+
+    if args.update or not args.baseline.exists():
+        args.baseline.write_text(
+            json.dumps(
+                {"params": {k: str(v) for k, v in params.items()}, "queries": current},
+                indent=2,
+            )
+            + "\n"
+        )
+        rows = [
+            [key if n == 0 else "", plan["table"], _format_plan(plan)]
+            for key, entry in current.items()
+            for n, plan in enumerate(entry["tables"])
+        ]
+        print()
+        print(format_table(["query", "table", "type key rows"], rows))
+        print(f"\nwrote baseline for {len(current)} queries to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["params"] != {k: str(v) for k, v in params.items()}:
+        print("warning: sample params differ from the baseline's dataset")
+
+    results = list(
+        compare(baseline["queries"], current, args.max_row_growth, args.min_rows)
+    )
+    shown = results if args.verbose else [r for r in results if r[0] != "ok"]
+    print()
+    print(
+        format_table(
+            ["status", "query", "table", "now", "baseline", "reason"],
+            [
+                [status, key, table or "-", _format_plan(plan), _format_plan(old), why]
+                for status, key, table, plan, old, why in shown
+            ],
+        )
+    )
+    regressions = sum(1 for r in results if r[0] == "REGRESSION")
+    print(f"\n{len(current)} queries checked, {regressions} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON file (written on first run or with --update)",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Record a new baseline instead of checking"
+    )
+    parser.add_argument(
+        "--generate-days",
+        type=int,
+        default=0,
+        help="Insert this many days of synthetic showtimes/tickets first",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help="Run ANALYZE TABLE first so row estimates use fresh statistics",
+    )
+    parser.add_argument(
+        "--max-row-growth",
+        type=float,
+        default=10.0,
+        help="Fail when a table's examined rows grow by more than this factor",
+    )
+    parser.add_argument(
+        "--min-rows",
+        type=int,
+        default=1000,
+        help="Ignore row growth on tables examining at most this many rows",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Also list unchanged table plans"
+    )
+    sys.exit(main(parser.parse_args()))
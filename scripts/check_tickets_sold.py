@@ -0,0 +1,121 @@
+"""
+Consistency check for the materialized Showtimes.TicketsSold counter.
+
+Compares TicketsSold and IsSoldOut against the real TicketSales rows and
+reports every showtime that has drifted. Exits 1 if any drift was found, so
+it can run from cron. Run from the project root:
+
+    python -m scripts.check_tickets_sold          # report only
+    python -m scripts.check_tickets_sold --fix    # also repair drifted rows
+"""
+
+import argparse
+import sys
+
+from app.db import get_connection
+
+DRIFT_QUERY = """
+    SELECT
+        s.ShowtimeID          AS showtime_id,
+        s.TicketsSold         AS tickets_sold,
+        s.IsSoldOut           AS is_sold_out,
+        a.SeatCapacity        AS seat_capacity,
+        COUNT(t.TicketSaleID) AS actual_sold
+    FROM Showtimes s
+    JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+    LEFT JOIN TicketSales t ON t.ShowtimeID = s.ShowtimeID
+    GROUP BY s.ShowtimeID, s.TicketsSold, s.IsSoldOut, a.SeatCapacity
+    HAVING s.TicketsSold <> COUNT(t.TicketSaleID)
+        OR (COUNT(t.TicketSaleID) >= a.SeatCapacity AND s.IsSoldOut = 0)
+    ORDER BY s.ShowtimeID
+"""
+
+
+def find_drift(conn):
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(DRIFT_QUERY)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+        # End the read snapshot so the repair below sees fresh data
+        conn.rollback()
+
+
+def repair(conn, showtime_id):
+    """
+    Recount one showtime and overwrite its counter.
+
+    The showtime row is locked *before* counting, so a concurrent purchase
+    either committed already (and is counted) or is blocked on this lock in
+    its trigger and will increment the repaired value afterwards.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT a.SeatCapacity
+            FROM Showtimes s
+            JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+            WHERE s.ShowtimeID = %s
+            FOR UPDATE
+            """,
+            (showtime_id,),
+        )
+        (capacity,) = cursor.fetchone()
+
+        cursor.execute(
+            "SELECT COUNT(*) FROM TicketSales WHERE ShowtimeID = %s",
+            (showtime_id,),
+        )
+        (actual,) = cursor.fetchone()
+
+        cursor.execute(
+            """
+            UPDATE Showtimes
+            SET TicketsSold = %s,
+                IsSoldOut = IF(%s >= %s, 1, IsSoldOut)
+            WHERE ShowtimeID = %s
+            """,
+            (actual, actual, capacity, showtime_id),
+        )
+        conn.commit()
+        return actual
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def main(args):
+    conn = get_connection()
+    try:
+        drifted = find_drift(conn)
+        if not drifted:
+            print("TicketsSold is consistent for every showtime.")
+            return 0
+
+        print(f"{len(drifted)} showtime(s) drifted:")
+        for row in drifted:
+            print(
+                f"  showtime {row['showtime_id']}: TicketsSold={row['tickets_sold']} "
+                f"actual={row['actual_sold']} capacity={row['seat_capacity']} "
+                f"IsSoldOut={row['is_sold_out']}"
+            )
+
+        if args.fix:
+            for row in drifted:
+                fixed = repair(conn, row["showtime_id"])
+                print(f"  repaired showtime {row['showtime_id']} -> {fixed}")
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--fix", action="store_true", help="Repair drifted counters in place"
+    )
+    sys.exit(main(parser.parse_args()))
@@ -40,6 +40,9 @@ CREATE TABLE Showtimes (
     EndTime DATETIME NOT NULL,
     Status VARCHAR(20) NOT NULL,
     IsSoldOut TINYINT(1) NOT NULL DEFAULT 0,
+    -- Maintained by the UpdateShowtimeStatus trigger; saves a COUNT(*) over
+    -- TicketSales on every purchase and availability check
+    TicketsSold INT NOT NULL DEFAULT 0,
     CHECK (Status IN ('Scheduled', 'In Progress', 'Completed', 'Canceled')),
     FOREIGN KEY (MovieID) REFERENCES Movies(MovieID)
         ON UPDATE CASCADE ON DELETE RESTRICT,
@@ -84,18 +87,90 @@ CREATE TABLE ConcessionSales (
         ON UPDATE CASCADE ON DELETE RESTRICT
 );
 
+-- Pre-aggregated sales per day / movie / auditorium for the sales-series
+-- report. Maintained by the RollupTicketSale and RollupConcessionSale
+-- triggers. Concession sales have no movie or auditorium and are stored
+-- under MovieID = 0, TheaterID = 0 (hence no foreign keys).
+CREATE TABLE DailySalesRollup (
+    SalesDate DATE NOT NULL,
+    MovieID INT NOT NULL,
+    TheaterID INT NOT NULL,
+    TicketCount INT NOT NULL DEFAULT 0,
+    TicketRevenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+    ConcessionRevenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (SalesDate, MovieID, TheaterID)
+);
+
+-- Concession units and revenue per (day, hour of day, category) for the
+-- concession cube report. Maintained by the CubeConcessionSale trigger;
+-- day of week is derived from SalesDate at query time.
+CREATE TABLE ConcessionSalesCube (
+    SalesDate DATE NOT NULL,
+    SaleHour TINYINT NOT NULL,
+    Category VARCHAR(10) NOT NULL,
+    Units INT NOT NULL DEFAULT 0,
+    Revenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (SalesDate, SaleHour, Category)
+);
+
+-- ============================
+-- INDEXES
+-- ============================
+
+-- Keyset pagination for GET /api/tickets (newest first), /api/tickets/today
+-- and get_number_of_ticket_sales. Carries every column those read, so
+-- none of them has to touch the clustered index.
+CREATE INDEX idx_ticketsales_sold_at
+    ON TicketSales (TimeTicketSold, TicketSaleID, CustomerID, ShowtimeID, TicketPrice);
+
+-- Keyset pagination for a customer's ticket history
+CREATE INDEX idx_ticketsales_customer_sold_at
+    ON TicketSales (CustomerID, TimeTicketSold, TicketSaleID);
+
+-- Day / auditorium schedule lookups (batch availability)
+CREATE INDEX idx_showtimes_start
+    ON Showtimes (StartTime);
+CREATE INDEX idx_showtimes_theater_start
+    ON Showtimes (TheaterID, StartTime);
+-- Overlap checks (EnforceShowtimeOverlap, POST /api/showtimes/bulk) only
+-- need showtimes that end after the new one starts
+CREATE INDEX idx_showtimes_theater_end
+    ON Showtimes (TheaterID, EndTime, StartTime);
+
+-- GET /api/reports/movie-showtimes: title -> MovieID, then one movie's day.
+-- The showtimes index covers the whole select list and replaces the
+-- implicit FK index on MovieID.
+CREATE INDEX idx_movies_title
+    ON Movies (Title);
+CREATE INDEX idx_showtimes_movie_start
+    ON Showtimes (MovieID, StartTime, EndTime, TheaterID);
+
+-- GET /api/customers/search: name prefix typeahead, one range scan per
+-- name column. Covering, so no clustered index lookups.
+CREATE INDEX idx_customers_fname
+    ON Customers (FName, LName, MembershipStatus);
+CREATE INDEX idx_customers_lname
+    ON Customers (LName, FName, MembershipStatus);
+
+-- Date-range exports of concession sales
+CREATE INDEX idx_concessionsales_sold_at
+    ON ConcessionSales (TimeConcessionSold, ConcessionSaleID);
+
+-- Per-movie totals from the rollup (profit leaderboard), covering
+CREATE INDEX idx_dailysales_movie_date
+    ON DailySalesRollup (MovieID, SalesDate, TicketCount, TicketRevenue);
+
 -- ============================
 -- TRIGGERS
 -- ============================
 
--- Update sold-out status
+-- Maintain TicketsSold and the sold-out flag
 DELIMITER //
 CREATE TRIGGER UpdateShowtimeStatus
 AFTER INSERT ON TicketSales
 FOR EACH ROW
 BEGIN
     DECLARE v_Capacity INT;
-    DECLARE v_Sold INT;
 
     SELECT A.SeatCapacity
       INTO v_Capacity
@@ -103,15 +178,12 @@ BEGIN
     JOIN Showtimes S ON A.TheaterID = S.TheaterID
     WHERE S.ShowtimeID = NEW.ShowtimeID;
 
-    SELECT COUNT(*) INTO v_Sold
-    FROM TicketSales
+    -- Single-table UPDATE assigns left to right, so IsSoldOut sees the
+    -- count before this ticket
+    UPDATE Showtimes
+    SET IsSoldOut = IF(TicketsSold + 1 >= v_Capacity, 1, IsSoldOut),
+        TicketsSold = TicketsSold + 1
     WHERE ShowtimeID = NEW.ShowtimeID;
-
-    IF v_Sold >= v_Capacity THEN
-        UPDATE Showtimes
-        SET IsSoldOut = 1
-        WHERE ShowtimeID = NEW.ShowtimeID;
-    END IF;
 END//
 DELIMITER ;
 
@@ -169,6 +241,53 @@ BEGIN
 END//
 DELIMITER ;
 
+-- Keep DailySalesRollup current, one upsert per sale
+DELIMITER //
+CREATE TRIGGER RollupTicketSale
+AFTER INSERT ON TicketSales
+FOR EACH ROW
+FOLLOWS UpdateShowtimeStatus
+BEGIN
+    INSERT INTO DailySalesRollup (SalesDate, MovieID, TheaterID, TicketCount, TicketRevenue)
+    SELECT DATE(NEW.TimeTicketSold), S.MovieID, S.TheaterID, 1, NEW.TicketPrice
+    FROM Showtimes S
+    WHERE S.ShowtimeID = NEW.ShowtimeID
+    ON DUPLICATE KEY UPDATE
+        TicketCount = TicketCount + 1,
+        TicketRevenue = TicketRevenue + NEW.TicketPrice;
+END//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER RollupConcessionSale
+AFTER INSERT ON ConcessionSales
+FOR EACH ROW
+BEGIN
+    INSERT INTO DailySalesRollup (SalesDate, MovieID, TheaterID, ConcessionRevenue)
+    SELECT DATE(NEW.TimeConcessionSold), 0, 0, C.ConcessionPrice
+    FROM Concessions C
+    WHERE C.ConcessionID = NEW.ConcessionID
+    ON DUPLICATE KEY UPDATE
+        ConcessionRevenue = ConcessionRevenue + C.ConcessionPrice;
+END//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER CubeConcessionSale
+AFTER INSERT ON ConcessionSales
+FOR EACH ROW
+FOLLOWS RollupConcessionSale
+BEGIN
+    INSERT INTO ConcessionSalesCube (SalesDate, SaleHour, Category, Units, Revenue)
+    SELECT DATE(NEW.TimeConcessionSold), HOUR(NEW.TimeConcessionSold), C.Category, 1, C.ConcessionPrice
+    FROM Concessions C
+    WHERE C.ConcessionID = NEW.ConcessionID
+    ON DUPLICATE KEY UPDATE
+        Units = Units + 1,
+        Revenue = Revenue + C.ConcessionPrice;
+END//
+DELIMITER ;
+
 -- ============================
 -- VIEWS
 -- ============================
@@ -226,25 +345,23 @@ BEGIN
     DECLARE v_Cap INT;
     DECLARE v_Sold INT;
 
-    SELECT s.StartTime, s.EndTime, s.IsSoldOut, m.Price
-      INTO v_Start, v_End, v_SoldOut, v_Price
+    -- One primary-key read for everything (TicketsSold replaces COUNT(*)).
+    -- FOR UPDATE serializes purchases per showtime: the next buyer waits here
+    -- until this transaction commits and then sees the new TicketsSold, so
+    -- two buyers can't both take the last seat. The trigger's UPDATE then
+    -- reuses this lock instead of queueing for it.
+    SELECT s.StartTime, s.EndTime, s.IsSoldOut, s.TicketsSold, a.SeatCapacity, m.Price
+      INTO v_Start, v_End, v_SoldOut, v_Sold, v_Cap, v_Price
     FROM Showtimes s
     JOIN Movies m ON s.MovieID = m.MovieID
-    WHERE s.ShowtimeID = p_ShowtimeID;
+    JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+    WHERE s.ShowtimeID = p_ShowtimeID
+    FOR UPDATE OF s;
 
     IF v_SoldOut = 1 THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Sold out'; END IF;
     IF NOW() > v_End THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Show completed'; END IF;
     IF NOW() BETWEEN v_Start AND v_End THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Show in progress'; END IF;
 
-    SELECT SeatCapacity INTO v_Cap
-    FROM Auditoriums a
-    JOIN Showtimes s ON a.TheaterID = s.TheaterID
-    WHERE s.ShowtimeID = p_ShowtimeID;
-
-    SELECT COUNT(*) INTO v_Sold
-    FROM TicketSales
-    WHERE ShowtimeID = p_ShowtimeID;
-
     IF v_Sold >= v_Cap THEN
         SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Auditorium full';
     END IF;
@@ -265,9 +382,12 @@ DETERMINISTIC
 BEGIN
     DECLARE v_Count INT;
 
+    -- Half-open range instead of DATE(TimeTicketSold) = p_Date so the
+    -- count is an index range scan on idx_ticketsales_sold_at
     SELECT COUNT(*) INTO v_Count
     FROM TicketSales
-    WHERE DATE(TimeTicketSold) = p_Date;
+    WHERE TimeTicketSold >= p_Date
+      AND TimeTicketSold < p_Date + INTERVAL 1 DAY;
 
     RETURN v_Count;
 END $$
@@ -0,0 +1,205 @@
+"""
+Before/after EXPLAIN and timing report for the date-filtered queries.
+
+For every access path touched by migration 006 this runs the old
+function-wrapped form (DATE(col) = ...) and the half-open range form side by
+side, printing the plan MySQL picks (access type, key, estimated rows) and
+the median runtime of each. Run it once before and once after applying the
+migration to see the index effect as well. From the project root:
+
+    # optional: add a year of synthetic showtimes/tickets first
+    python -m scripts.explain_report --generate-days 365
+    python -m scripts.explain_report --repeat 20
+
+Data is generated with scripts.generate_data (see there for larger or
+differently shaped datasets).
+"""
+
+import argparse
+import statistics
+import time
+
+from app.db import get_connection
+from app.title_index import get_title_index
+from scripts.generate_data import generate
+from scripts.loadgen import format_table
+
+# name -> (old SQL, rewritten SQL); both take the same params. The rewritten
+# movie_showtimes is what the route runs: the title is resolved to a MovieID
+# in-process (app.title_index) before the query
+QUERIES = {
+    "tickets_today": (
+        """
+        SELECT TicketSaleID, CustomerID, ShowtimeID, TicketPrice, TimeTicketSold
+        FROM TicketSales
+        WHERE DATE(TimeTicketSold) = %(day)s
+        ORDER BY TimeTicketSold
+        """,
+        """
+        SELECT TicketSaleID, CustomerID, ShowtimeID, TicketPrice, TimeTicketSold
+        FROM TicketSales
+        WHERE TimeTicketSold >= %(day)s
+          AND TimeTicketSold < %(day)s + INTERVAL 1 DAY
+        ORDER BY TimeTicketSold
+        """,
+    ),
+    # Body of get_number_of_ticket_sales (EXPLAIN can't see inside functions)
+    "daily_ticket_count": (
+        """
+        SELECT COUNT(*)
+        FROM TicketSales
+        WHERE DATE(TimeTicketSold) = %(day)s
+        """,
+        """
+        SELECT COUNT(*)
+        FROM TicketSales
+        WHERE TimeTicketSold >= %(day)s
+          AND TimeTicketSold < %(day)s + INTERVAL 1 DAY
+        """,
+    ),
+    "movie_showtimes": (
+        """
+        SELECT m.Title, s.ShowtimeID, s.TheaterID, s.StartTime, s.EndTime
+        FROM Showtimes s
+        JOIN Movies m ON s.MovieID = m.MovieID
+        WHERE m.Title = %(title)s
+          AND DATE(s.StartTime) = %(day)s
+        ORDER BY s.StartTime
+        """,
+        """
+        SELECT m.Title, s.ShowtimeID, s.TheaterID, s.StartTime, s.EndTime
+        FROM Showtimes s
+        JOIN Movies m ON s.MovieID = m.MovieID
+        WHERE s.MovieID = %(movie_id)s
+          AND s.StartTime >= %(day)s
+          AND s.StartTime < %(day)s + INTERVAL 1 DAY
+        ORDER BY s.StartTime
+        """,
+    ),
+}
+
+
+def _default_params(conn):
+    """Busiest sales day and the movie with the most showtimes."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT DATE(MAX(TimeTicketSold)) FROM TicketSales")
+        (day,) = cursor.fetchone()
+        cursor.execute(
+            """
+            SELECT m.MovieID, m.Title
+            FROM Showtimes s
+            JOIN Movies m ON s.MovieID = m.MovieID
+            GROUP BY m.MovieID, m.Title
+            ORDER BY COUNT(*) DESC
+            LIMIT 1
+            """
+        )
+        movie_id, title = cursor.fetchone()
+    finally:
+        cursor.close()
+    return {"day": day, "title": title, "movie_id": movie_id}
+
+
+def explain(conn, sql, params):
+    """One line per table: (table, type, key, rows)."""
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("EXPLAIN " + sql, params)
+        return [
+            (row["table"], row["type"], row["key"] or "-", row["rows"])
+            for row in cursor.fetchall()
+        ]
+    finally:
+        cursor.close()
+
+
+def time_query(conn, sql, params, repeat):
+    """Median wall time in milliseconds over `repeat` runs."""
+    cursor = conn.cursor()
+    timings = []
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            cursor.execute(sql, params)
+            cursor.fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        cursor.close()
+    return statistics.median(timings)
+
+
+def main(args):
+    conn = get_connection()
+    try:
+        if args.generate_days:
+            counts = generate(conn, args.generate_days, args.seed)
+            print(
+                f"generated {counts['Showtimes']} showtimes and "
+                f"{counts['TicketSales']} ticket sales"
+            )
+
+        params = _default_params(conn)
+        if args.date:
+            params["day"] = args.date
+        if args.title:
+            movie_ids = get_title_index().resolve(args.title)
+            if not movie_ids:
+                raise SystemExit(f"unknown or ambiguous title: {args.title!r}")
+            # The old form filters on the stored title, so both read the same rows
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT Title FROM Movies WHERE MovieID = %s", (movie_ids[0],)
+            )
+            (params["title"],) = cursor.fetchone()
+            cursor.close()
+            params["movie_id"] = movie_ids[0]
+        print(
+            f"params: day={params['day']} title={params['title']!r} "
+            f"movie_id={params['movie_id']}"
+        )
+
+        rows = []
+        for name, (old_sql, new_sql) in QUERIES.items():
+            for form, sql in (("DATE()", old_sql), ("range", new_sql)):
+                ms = time_query(conn, sql, params, args.repeat)
+                for n, (table, access, key, est_rows) in enumerate(
+                    explain(conn, sql, params)
+                ):
+                    rows.append(
+                        [
+                            name if n == 0 else "",
+                            form if n == 0 else "",
+                            table,
+                            access,
+                            key,
+                            est_rows,
+                            f"{ms:.2f}" if n == 0 else "",
+                        ]
+                    )
+    finally:
+        conn.close()
+
+    print()
+    print(
+        format_table(
+            ["query", "form", "table", "type", "key", "rows", "median ms"], rows
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--generate-days",
+        type=int,
+        default=0,
+        help="Insert this many days of synthetic showtimes/tickets first",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--date", help="Day to query (default: latest sale date)")
+    parser.add_argument("--title", help="Movie title (default: most scheduled)")
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Timed runs per query"
+    )
+    main(parser.parse_args())
@@ -0,0 +1,467 @@
+"""
+Generate a production-size synthetic dataset (showtimes, tickets, concessions).
+
+Fills `--days` days from `--start` with non-overlapping showtimes in every
+auditorium and sells tickets and concessions against them. Demand is skewed
+the way a real theater's is: weekends and evenings sell more, and a movie
+sells best in its first weeks after release. From the project root:
+
+    # ~300k tickets: one year on the four seeded auditoriums
+    python -m scripts.generate_data --days 365
+
+    # millions of rows: three years on 20 auditoriums, loaded with LOAD DATA
+    python -m scripts.generate_data --days 1095 --auditoriums 20 --load-data
+
+The same --seed on the same starting database produces the same rows (for
+windows entirely in the past; sales after now are skipped).
+
+All rows go through the normal triggers, so TicketsSold, IsSoldOut and the
+rollup tables stay consistent, and no showtime sells past its capacity.
+New movies and customers get IDs above the current maximum, so run this
+against a database nobody else is writing to. `--load-data` needs
+local_infile=ON on the server.
+"""
+
+import argparse
+import math
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import mysql.connector
+
+from app.db import dbconfig
+
+DEFAULT_START = date(2000, 1, 1)  # well before any real showtime
+
+# Schedule of one auditorium-day: first show between 10:00 and 11:00, then
+# back to back (runtime + trailers, cleaning) until the last start time
+FIRST_SHOW = timedelta(hours=10)
+LAST_START = timedelta(hours=22, minutes=30)
+TRAILERS = timedelta(minutes=20)
+CLEANING = timedelta(minutes=20)
+
+# Demand model: expected fill = BASE_FILL * weekday * time of day * premiere
+BASE_FILL = 0.35
+WEEKDAY_DEMAND = [0.8, 0.8, 0.9, 1.0, 1.3, 1.6, 1.4]  # Monday .. Sunday
+PREMIERE_BOOST = 1.5  # extra demand on release day, decaying ...
+PREMIERE_DECAY_DAYS = 10  # ... with this time constant
+RUN_WEEKS = (4, 12)  # how long a movie stays in the schedule
+PRESALE_MEAN_HOURS = 36  # tickets are bought this long before the show on average
+PRESALE_MAX_DAYS = 30
+
+CONCESSION_RATE = 0.45  # share of tickets that come with a concession order
+CONCESSION_WEIGHTS = {"Popcorn": 5, "Beverage": 6, "Snack": 3, "Meal": 1}
+
+GENRES = ["Action", "Adventure", "Comedy", "Drama", "Horror", "Animation", "Sci-Fi"]
+TITLE_WORDS = (
+    ["The Last", "Return of the", "Rise of the", "Beyond the", "Secret", "Midnight"],
+    ["Horizon", "Kingdom", "Signal", "Voyage", "Empire", "Garden", "Protocol"],
+)
+FIRST_NAMES = ["Ana", "Ben", "Chloe", "David", "Elena", "Felix", "Grace", "Hiro"]
+LAST_NAMES = ["Garcia", "Smith", "Nguyen", "Kim", "Patel", "Brown", "Rossi"]
+
+TABLE_COLUMNS = {
+    "Auditoriums": ("TheaterID", "ProjType", "SeatCapacity"),
+    "Distributors": ("DistributorID", "DistributorName", "DistributionFee"),
+    "Movies": (
+        "MovieID",
+        "Title",
+        "Genre",
+        "Runtime",
+        "ReleaseDate",
+        "Price",
+        "IsActive",
+        "DistributorID",
+    ),
+    "Customers": ("CustomerID", "FName", "LName", "MembershipStatus"),
+    "Concessions": ("ConcessionID", "ConcessionPrice", "Category"),
+    "Showtimes": (
+        "ShowtimeID",
+        "MovieID",
+        "TheaterID",
+        "StartTime",
+        "EndTime",
+        "Status",
+    ),
+    "TicketSales": ("CustomerID", "ShowtimeID", "TicketPrice", "TimeTicketSold"),
+    "ConcessionSales": ("CustomerID", "ConcessionID", "TimeConcessionSold"),
+}
+
+
+class BulkLoader:
+    """
+    Buffers rows per table and writes them in batches, parents before
+    children so foreign keys always resolve. Batches go out as one
+    multi-row INSERT each, or through LOAD DATA LOCAL INFILE.
+    """
+
+    def __init__(self, conn, batch_size, load_data=False):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.load_data = load_data
+        self.buffers = {table: [] for table in TABLE_COLUMNS}
+        self.counts = dict.fromkeys(TABLE_COLUMNS, 0)
+
+    def add(self, table, row):
+        buffer = self.buffers[table]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for table, rows in self.buffers.items():  # dict order = FK order
+            if rows:
+                if self.load_data:
+                    self._load_data(table, rows)
+                else:
+                    self._insert(table, rows)
+                self.counts[table] += len(rows)
+                rows.clear()
+        self.conn.commit()
+
+    def _insert(self, table, rows):
+        columns = TABLE_COLUMNS[table]
+        cursor = self.conn.cursor()
+        try:
+            # executemany() rewrites a plain INSERT into one multi-row INSERT
+            cursor.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})",
+                rows,
+            )
+        finally:
+            cursor.close()
+
+    def _load_data(self, table, rows):
+        columns = TABLE_COLUMNS[table]
+        with tempfile.NamedTemporaryFile("w", suffix=".tsv", delete=False) as f:
+            for row in rows:
+                f.write("\t".join(_tsv(value) for value in row))
+                f.write("\n")
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+                "FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+                f"({', '.join(columns)})",
+                (f.name,),
+            )
+        finally:
+            cursor.close()
+            os.unlink(f.name)
+
+
+def _tsv(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value)
+
+
+def _next_id(cursor, table, column):
+    cursor.execute(f"SELECT COALESCE(MAX({column}), 0) + 1 FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def _quarter_hour(moment):
+    """Round up to the next quarter hour."""
+    extra = -moment.minute % 15
+    return moment.replace(second=0, microsecond=0) + timedelta(minutes=extra)
+
+
+def _reference_data(conn, loader, rng, auditoriums):
+    """Make sure there are enough auditoriums, distributors and concessions."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT TheaterID, SeatCapacity FROM Auditoriums ORDER BY TheaterID"
+        )
+        existing = cursor.fetchall()
+        next_theater = _next_id(cursor, "Auditoriums", "TheaterID")
+        missing = auditoriums - len(existing)
+        for theater_id in range(next_theater, next_theater + missing):
+            proj_type = rng.choices(["2D", "3D", "IMAX"], weights=[6, 3, 1])[0]
+            if proj_type == "IMAX":
+                capacity = rng.randint(150, 300)
+            else:
+                capacity = rng.randint(60, 180)
+            loader.add("Auditoriums", (theater_id, proj_type, capacity))
+            existing.append((theater_id, capacity))
+
+        cursor.execute("SELECT DistributorID FROM Distributors")
+        distributor_ids = [row[0] for row in cursor.fetchall()]
+        if not distributor_ids:
+            for distributor_id in range(1, 5):
+                fee = rng.choice([10, 12, 15, 18])
+                loader.add(
+                    "Distributors", (distributor_id, f"Studio {distributor_id}", fee)
+                )
+                distributor_ids.append(distributor_id)
+
+        cursor.execute("SELECT ConcessionID, Category FROM Concessions")
+        concessions = cursor.fetchall()
+        if not concessions:
+            menu = [
+                (8.50, "Popcorn"),
+                (5.00, "Beverage"),
+                (6.00, "Snack"),
+                (12.00, "Meal"),
+            ]
+            for concession_id, (price, category) in enumerate(menu, start=1):
+                loader.add("Concessions", (concession_id, price, category))
+                concessions.append((concession_id, category))
+    finally:
+        cursor.close()
+
+    loader.flush()
+    return existing, distributor_ids, concessions
+
+
+def _movies(conn, loader, rng, count, distributor_ids, start, end):
+    """
+    `count` new movies released over the generated window (plus some that
+    premiered shortly before it). Returns (id, runtime, price, release, last day).
+    """
+    cursor = conn.cursor()
+    try:
+        next_movie = _next_id(cursor, "Movies", "MovieID")
+    finally:
+        cursor.close()
+
+    window = (end - start).days
+    movies = []
+    for movie_id in range(next_movie, next_movie + count):
+        release = start + timedelta(days=rng.randint(-60, max(window - 14, 0)))
+        runtime = rng.randint(85, 180)
+        price = rng.choice([9.00, 10.50, 11.00, 12.50, 13.00, 14.50])
+        title = f"{rng.choice(TITLE_WORDS[0])} {rng.choice(TITLE_WORDS[1])}"
+        loader.add(
+            "Movies",
+            (
+                movie_id,
+                f"{title} {movie_id}",
+                rng.choice(GENRES),
+                runtime,
+                release,
+                price,
+                0,
+                rng.choice(distributor_ids),
+            ),
+        )
+        last_day = release + timedelta(weeks=rng.randint(*RUN_WEEKS))
+        movies.append((movie_id, runtime, price, release, last_day))
+    loader.flush()
+    return movies
+
+
+def _customers(conn, loader, rng, count):
+    cursor = conn.cursor()
+    try:
+        next_customer = _next_id(cursor, "Customers", "CustomerID")
+    finally:
+        cursor.close()
+
+    for customer_id in range(next_customer, next_customer + count):
+        loader.add(
+            "Customers",
+            (
+                customer_id,
+                rng.choice(FIRST_NAMES),
+                rng.choice(LAST_NAMES),
+                int(rng.random() < 0.3),
+            ),
+        )
+    loader.flush()
+    return range(next_customer, next_customer + count)
+
+
+def _demand(rng, start, release):
+    """Expected share of seats sold for a show starting at `start`."""
+    hour = start.hour
+    time_of_day = 0.7 if hour < 13 else 1.3 if hour >= 18 else 1.0
+    days_out = max((start.date() - release).days, 0)
+    premiere = 1 + PREMIERE_BOOST * math.exp(-days_out / PREMIERE_DECAY_DAYS)
+    noise = rng.uniform(0.6, 1.4)
+    weekday = WEEKDAY_DEMAND[start.weekday()]
+    return min(1.0, BASE_FILL * weekday * time_of_day * premiere * noise)
+
+
+def _sell(loader, rng, showtime_id, show_start, sold, price, customer_ids, menu, now):
+    """`sold` tickets for one show, each maybe with a concession order."""
+    concession_ids, concession_weights = menu
+    for _ in range(sold):
+        minutes_ahead = min(
+            rng.expovariate(1 / (PRESALE_MEAN_HOURS * 60)),
+            PRESALE_MAX_DAYS * 24 * 60,
+        )
+        sold_at = show_start - timedelta(minutes=1 + int(minutes_ahead))
+        if sold_at > now:
+            continue  # future show, this sale hasn't happened yet
+        customer_id = rng.choice(customer_ids)
+        loader.add("TicketSales", (customer_id, showtime_id, price, sold_at))
+
+        if rng.random() < CONCESSION_RATE:
+            bought_at = show_start - timedelta(minutes=rng.randint(0, 40))
+            if bought_at > now:
+                continue
+            items = rng.choices(
+                concession_ids, concession_weights, k=rng.choice([1, 1, 2, 3])
+            )
+            for concession_id in items:
+                loader.add("ConcessionSales", (customer_id, concession_id, bought_at))
+
+
+def generate(
+    conn,
+    days,
+    seed,
+    start=DEFAULT_START,
+    movies=40,
+    customers=5000,
+    auditoriums=0,
+    batch_size=5000,
+    load_data=False,
+):
+    """
+    Insert the dataset and return row counts per table.
+
+    Refuses to run if any showtime already exists in the window, since the
+    EnforceShowtimeOverlap trigger would reject the schedule part way.
+    """
+    rng = random.Random(seed)
+    end = start + timedelta(days=days)
+    now = datetime.now()
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT COUNT(*) FROM Showtimes WHERE StartTime < %s AND EndTime > %s",
+            (end + timedelta(days=1), start),
+        )
+        (existing,) = cursor.fetchone()
+    finally:
+        cursor.close()
+    if existing:
+        raise SystemExit(
+            f"{existing} showtimes already exist between {start} and {end}; "
+            "pick another --start or recreate the database."
+        )
+
+    loader = BulkLoader(conn, batch_size, load_data)
+    theaters, distributor_ids, concessions = _reference_data(
+        conn, loader, rng, auditoriums
+    )
+    catalog = _movies(conn, loader, rng, movies, distributor_ids, start, end)
+    customer_ids = _customers(conn, loader, rng, customers)
+    menu = (
+        [concession_id for concession_id, _ in concessions],
+        [CONCESSION_WEIGHTS.get(category, 1) for _, category in concessions],
+    )
+
+    cursor = conn.cursor()
+    try:
+        showtime_id = _next_id(cursor, "Showtimes", "ShowtimeID")
+    finally:
+        cursor.close()
+
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        midnight = datetime.combine(day, datetime.min.time())
+        playing = [m for m in catalog if m[3] <= day <= m[4]] or catalog
+        # Recent releases get more screens
+        weights = [
+            1 + PREMIERE_BOOST * math.exp(-(day - release).days / PREMIERE_DECAY_DAYS)
+            if day >= release
+            else 0.2
+            for _, _, _, release, _ in playing
+        ]
+
+        for theater_id, capacity in theaters:
+            show_start = midnight + FIRST_SHOW
+            show_start += timedelta(minutes=15 * rng.randint(0, 4))
+            while show_start <= midnight + LAST_START:
+                movie_id, runtime, price, release, _ = rng.choices(playing, weights)[0]
+                show_end = show_start + timedelta(minutes=runtime) + TRAILERS
+                status = "Completed" if show_end < now else "Scheduled"
+                loader.add(
+                    "Showtimes",
+                    (showtime_id, movie_id, theater_id, show_start, show_end, status),
+                )
+
+                fill = _demand(rng, show_start, release)
+                sold = min(capacity, round(capacity * fill))
+                _sell(
+                    loader, rng, showtime_id, show_start, sold, price,
+                    customer_ids, menu, now,
+                )
+
+                showtime_id += 1
+                show_start = _quarter_hour(show_end + CLEANING)
+
+    loader.flush()
+    return loader.counts
+
+
+def main(args):
+    start = date.fromisoformat(args.start)
+    # Bulk loads bypass the request pool; LOAD DATA LOCAL must be enabled
+    # on the client connection explicitly
+    conn = mysql.connector.connect(**dbconfig, allow_local_infile=args.load_data)
+    started = time.perf_counter()
+    try:
+        counts = generate(
+            conn,
+            args.days,
+            args.seed,
+            start=start,
+            movies=args.movies,
+            customers=args.customers,
+            auditoriums=args.auditoriums,
+            batch_size=args.batch_size,
+            load_data=args.load_data,
+        )
+    finally:
+        conn.close()
+    elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    for table, count in counts.items():
+        if count:
+            print(f"{table:16} {count:>12,}")
+    print(f"{total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=365, help="Days of showtimes")
+    parser.add_argument(
+        "--start",
+        default=DEFAULT_START.isoformat(),
+        help="First day (YYYY-MM-DD); must not overlap existing showtimes",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--movies", type=int, default=40, help="New movies to create")
+    parser.add_argument(
+        "--customers", type=int, default=5000, help="New customers to create"
+    )
+    parser.add_argument(
+        "--auditoriums",
+        type=int,
+        default=0,
+        help="Add auditoriums until there are at least this many",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Rows per INSERT / LOAD DATA"
+    )
+    parser.add_argument(
+        "--load-data",
+        action="store_true",
+        help="Load with LOAD DATA LOCAL INFILE instead of multi-row INSERTs",
+    )
+    main(parser.parse_args())
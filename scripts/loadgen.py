@@ -0,0 +1,171 @@
+"""
+Tiny dependency-free HTTP/1.1 load generator shared by the benchmark scripts.
+
+Each worker keeps one keep-alive connection open and fires requests back to
+back, so `concurrency` == number of in-flight requests. Only what uvicorn
+sends back is supported (Content-Length or chunked bodies).
+"""
+
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+
+
+class LoadResult:
+    """Latencies and status counts for one load run."""
+
+    def __init__(self, concurrency):
+        self.concurrency = concurrency
+        self.latencies = []  # seconds, successful requests only
+        self.statuses = {}
+        self.errors = 0
+        self.elapsed = 0.0
+
+    @property
+    def requests(self):
+        return sum(self.statuses.values()) + self.errors
+
+    @property
+    def rps(self):
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct):
+        """Latency percentile in milliseconds (nearest-rank)."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index] * 1000
+
+
+class _Connection:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def _ensure_open(self):
+        if self.writer is None or self.writer.is_closing():
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.writer = None
+
+    async def request(self, method, path, body=None):
+        await self._ensure_open()
+
+        payload = b""
+        headers = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+        ]
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers.append("Content-Type: application/json")
+        headers.append(f"Content-Length: {len(payload)}")
+        self.writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("server closed the connection")
+        status = int(status_line.split()[1])
+
+        length = None
+        chunked = False
+        keep_alive = True
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            value = value.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding" and "chunked" in value:
+                chunked = True
+            elif name == "connection" and value == "close":
+                keep_alive = False
+
+        if chunked:
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).strip(), 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            data = b"".join(chunks)
+        else:
+            data = await self.reader.readexactly(length or 0)
+
+        if not keep_alive:
+            await self.close()
+        return status, data
+
+
+async def run_load(base_url, request_factory, concurrency, duration=None, total=None):
+    """
+    Drive `concurrency` workers against base_url.
+
+    request_factory(i) -> (method, path, body) builds the i-th request; path is
+    appended to base_url's path. Stops after `duration` seconds or `total`
+    requests, whichever is given.
+    """
+    parts = urlsplit(base_url)
+    prefix = parts.path.rstrip("/")
+    result = LoadResult(concurrency)
+    counter = iter(range(total if total is not None else 10**12))
+    deadline = None
+
+    async def worker():
+        conn = _Connection(parts.hostname, parts.port or 80)
+        try:
+            for i in counter:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                method, path, body = request_factory(i)
+                started = time.perf_counter()
+                try:
+                    status, _ = await conn.request(method, prefix + path, body)
+                except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+                    result.errors += 1
+                    await conn.close()
+                    continue
+                result.statuses[status] = result.statuses.get(status, 0) + 1
+                if status < 500:
+                    result.latencies.append(time.perf_counter() - started)
+        finally:
+            await conn.close()
+
+    started = time.perf_counter()
+    if duration is not None:
+        deadline = started + duration
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def format_table(headers, rows):
+    """Render rows as a fixed-width text table."""
+    cells = [[str(h) for h in headers]] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+    lines = []
+    for n, row in enumerate(cells):
+        lines.append("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            lines.append("  ".join("-" * w for w in widths))
+    return "\n".join(lines)
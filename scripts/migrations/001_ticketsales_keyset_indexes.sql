@@ -0,0 +1,12 @@
+-- Migration 001: composite indexes for keyset pagination on TicketSales.
+-- Already included in define_db.sql; run this on databases created before it.
+USE theater_db;
+
+-- GET /api/tickets?cursor=...
+CREATE INDEX idx_ticketsales_sold_at
+    ON TicketSales (TimeTicketSold, TicketSaleID);
+
+-- GET /api/tickets/customers/{id}/tickets?cursor=...
+-- Also replaces the implicit FK index on CustomerID (it has the same prefix).
+CREATE INDEX idx_ticketsales_customer_sold_at
+    ON TicketSales (CustomerID, TimeTicketSold, TicketSaleID);
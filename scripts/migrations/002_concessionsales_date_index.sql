@@ -0,0 +1,7 @@
+-- Migration 002: date index for streaming concession sales exports.
+-- Already included in define_db.sql; run this on databases created before it.
+USE theater_db;
+
+-- GET /api/exports/concession-sales?from=...&to=...
+CREATE INDEX idx_concessionsales_sold_at
+    ON ConcessionSales (TimeConcessionSold, ConcessionSaleID);
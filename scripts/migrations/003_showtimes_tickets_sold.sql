@@ -0,0 +1,81 @@
+-- Migration 003: materialized Showtimes.TicketsSold counter.
+-- Already included in define_db.sql; run this on databases created before it.
+--
+-- Pause ticket sales while this runs: the backfill and the trigger swap
+-- are not atomic with respect to concurrent purchases. Afterwards,
+-- `python -m scripts.check_tickets_sold` should report no drift.
+USE theater_db;
+
+ALTER TABLE Showtimes
+    ADD COLUMN TicketsSold INT NOT NULL DEFAULT 0 AFTER IsSoldOut;
+
+-- Backfill from the ticket history
+UPDATE Showtimes s
+LEFT JOIN (
+    SELECT ShowtimeID, COUNT(*) AS Sold
+    FROM TicketSales
+    GROUP BY ShowtimeID
+) t ON t.ShowtimeID = s.ShowtimeID
+SET s.TicketsSold = IFNULL(t.Sold, 0);
+
+-- Trigger now increments the counter instead of re-counting the table
+DROP TRIGGER IF EXISTS UpdateShowtimeStatus;
+
+DELIMITER //
+CREATE TRIGGER UpdateShowtimeStatus
+AFTER INSERT ON TicketSales
+FOR EACH ROW
+BEGIN
+    DECLARE v_Capacity INT;
+
+    SELECT A.SeatCapacity
+      INTO v_Capacity
+    FROM Auditoriums A
+    JOIN Showtimes S ON A.TheaterID = S.TheaterID
+    WHERE S.ShowtimeID = NEW.ShowtimeID;
+
+    -- Single-table UPDATE assigns left to right, so IsSoldOut sees the
+    -- count before this ticket
+    UPDATE Showtimes
+    SET IsSoldOut = IF(TicketsSold + 1 >= v_Capacity, 1, IsSoldOut),
+        TicketsSold = TicketsSold + 1
+    WHERE ShowtimeID = NEW.ShowtimeID;
+END//
+DELIMITER ;
+
+-- Procedure reads the counter instead of COUNT(*)
+DROP PROCEDURE IF EXISTS Process_Ticket_Purchase;
+
+DELIMITER $$
+CREATE PROCEDURE Process_Ticket_Purchase(
+    IN p_CustomerID INT,
+    IN p_ShowtimeID INT
+)
+BEGIN
+    DECLARE v_Price DECIMAL(6,2);
+    DECLARE v_Start DATETIME;
+    DECLARE v_End DATETIME;
+    DECLARE v_SoldOut TINYINT(1);
+    DECLARE v_Cap INT;
+    DECLARE v_Sold INT;
+
+    -- One primary-key read for everything (TicketsSold replaces COUNT(*))
+    SELECT s.StartTime, s.EndTime, s.IsSoldOut, s.TicketsSold, a.SeatCapacity, m.Price
+      INTO v_Start, v_End, v_SoldOut, v_Sold, v_Cap, v_Price
+    FROM Showtimes s
+    JOIN Movies m ON s.MovieID = m.MovieID
+    JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+    WHERE s.ShowtimeID = p_ShowtimeID;
+
+    IF v_SoldOut = 1 THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Sold out'; END IF;
+    IF NOW() > v_End THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Show completed'; END IF;
+    IF NOW() BETWEEN v_Start AND v_End THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Show in progress'; END IF;
+
+    IF v_Sold >= v_Cap THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Auditorium full';
+    END IF;
+
+    INSERT INTO TicketSales(CustomerID, ShowtimeID, TicketPrice, TimeTicketSold)
+    VALUES (p_CustomerID, p_ShowtimeID, v_Price, NOW());
+END$$
+DELIMITER ;
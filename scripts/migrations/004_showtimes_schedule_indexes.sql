@@ -0,0 +1,12 @@
+-- Migration 004: schedule indexes for batch showtime availability.
+-- Already included in define_db.sql; run this on databases created before it.
+USE theater_db;
+
+-- /api/reports/showtime-availability/batch?date=...
+CREATE INDEX idx_showtimes_start
+    ON Showtimes (StartTime);
+
+-- /api/reports/showtime-availability/batch?date=...&theater_id=...
+-- Also replaces the implicit FK index on TheaterID (it has the same prefix).
+CREATE INDEX idx_showtimes_theater_start
+    ON Showtimes (TheaterID, StartTime);
@@ -0,0 +1,47 @@
+-- Migration 005: lock the showtime row in Process_Ticket_Purchase.
+-- Already included in define_db.sql; run this on databases created before it.
+--
+-- Without the lock, concurrent purchases for the last seats all read the
+-- same TicketsSold and oversell the auditorium.
+USE theater_db;
+
+DROP PROCEDURE IF EXISTS Process_Ticket_Purchase;
+
+DELIMITER $$
+CREATE PROCEDURE Process_Ticket_Purchase(
+    IN p_CustomerID INT,
+    IN p_ShowtimeID INT
+)
+BEGIN
+    DECLARE v_Price DECIMAL(6,2);
+    DECLARE v_Start DATETIME;
+    DECLARE v_End DATETIME;
+    DECLARE v_SoldOut TINYINT(1);
+    DECLARE v_Cap INT;
+    DECLARE v_Sold INT;
+
+    -- One primary-key read for everything (TicketsSold replaces COUNT(*)).
+    -- FOR UPDATE serializes purchases per showtime: the next buyer waits here
+    -- until this transaction commits and then sees the new TicketsSold, so
+    -- two buyers can't both take the last seat. The trigger's UPDATE then
+    -- reuses this lock instead of queueing for it.
+    SELECT s.StartTime, s.EndTime, s.IsSoldOut, s.TicketsSold, a.SeatCapacity, m.Price
+      INTO v_Start, v_End, v_SoldOut, v_Sold, v_Cap, v_Price
+    FROM Showtimes s
+    JOIN Movies m ON s.MovieID = m.MovieID
+    JOIN Auditoriums a ON s.TheaterID = a.TheaterID
+    WHERE s.ShowtimeID = p_ShowtimeID
+    FOR UPDATE OF s;
+
+    IF v_SoldOut = 1 THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Sold out'; END IF;
+    IF NOW() > v_End THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Show completed'; END IF;
+    IF NOW() BETWEEN v_Start AND v_End THEN SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Show in progress'; END IF;
+
+    IF v_Sold >= v_Cap THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT='Auditorium full';
+    END IF;
+
+    INSERT INTO TicketSales(CustomerID, ShowtimeID, TicketPrice, TimeTicketSold)
+    VALUES (p_CustomerID, p_ShowtimeID, v_Price, NOW());
+END$$
+DELIMITER ;
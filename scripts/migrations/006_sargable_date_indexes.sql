@@ -0,0 +1,38 @@
+-- Migration 006: covering indexes for date-filtered reads, sargable
+-- get_number_of_ticket_sales.
+-- Already included in define_db.sql; run this on databases created before it.
+USE theater_db;
+
+-- Widen the keyset index so /api/tickets, /api/tickets/today and the daily
+-- count are served from the index alone
+ALTER TABLE TicketSales
+    DROP INDEX idx_ticketsales_sold_at,
+    ADD INDEX idx_ticketsales_sold_at
+        (TimeTicketSold, TicketSaleID, CustomerID, ShowtimeID, TicketPrice);
+
+-- /api/reports/movie-showtimes
+CREATE INDEX idx_movies_title
+    ON Movies (Title);
+CREATE INDEX idx_showtimes_movie_start
+    ON Showtimes (MovieID, StartTime, EndTime, TheaterID);
+
+-- DATE(TimeTicketSold) = p_Date -> half-open range
+DROP FUNCTION IF EXISTS get_number_of_ticket_sales;
+
+DELIMITER $$
+CREATE FUNCTION get_number_of_ticket_sales(p_Date DATE)
+RETURNS INT
+DETERMINISTIC
+BEGIN
+    DECLARE v_Count INT;
+
+    -- Half-open range instead of DATE(TimeTicketSold) = p_Date so the
+    -- count is an index range scan on idx_ticketsales_sold_at
+    SELECT COUNT(*) INTO v_Count
+    FROM TicketSales
+    WHERE TimeTicketSold >= p_Date
+      AND TimeTicketSold < p_Date + INTERVAL 1 DAY;
+
+    RETURN v_Count;
+END $$
+DELIMITER ;
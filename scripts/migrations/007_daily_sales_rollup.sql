@@ -0,0 +1,65 @@
+-- Migration 007: DailySalesRollup for /api/reports/sales-series.
+-- Already included in define_db.sql; run this on databases created before it.
+--
+-- Pause ticket and concession sales while this runs: sales made between the
+-- backfill and the trigger creation would be missing from the rollup.
+USE theater_db;
+
+-- Pre-aggregated sales per day / movie / auditorium for the sales-series
+-- report. Maintained by the RollupTicketSale and RollupConcessionSale
+-- triggers. Concession sales have no movie or auditorium and are stored
+-- under MovieID = 0, TheaterID = 0 (hence no foreign keys).
+CREATE TABLE DailySalesRollup (
+    SalesDate DATE NOT NULL,
+    MovieID INT NOT NULL,
+    TheaterID INT NOT NULL,
+    TicketCount INT NOT NULL DEFAULT 0,
+    TicketRevenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+    ConcessionRevenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (SalesDate, MovieID, TheaterID)
+);
+
+-- Backfill from the sales history
+INSERT INTO DailySalesRollup (SalesDate, MovieID, TheaterID, TicketCount, TicketRevenue)
+SELECT DATE(t.TimeTicketSold), s.MovieID, s.TheaterID, COUNT(*), SUM(t.TicketPrice)
+FROM TicketSales t
+JOIN Showtimes s ON t.ShowtimeID = s.ShowtimeID
+GROUP BY DATE(t.TimeTicketSold), s.MovieID, s.TheaterID;
+
+INSERT INTO DailySalesRollup (SalesDate, MovieID, TheaterID, ConcessionRevenue)
+SELECT DATE(cs.TimeConcessionSold), 0, 0, SUM(c.ConcessionPrice)
+FROM ConcessionSales cs
+JOIN Concessions c ON cs.ConcessionID = c.ConcessionID
+GROUP BY DATE(cs.TimeConcessionSold);
+
+-- Keep DailySalesRollup current, one upsert per sale
+DELIMITER //
+CREATE TRIGGER RollupTicketSale
+AFTER INSERT ON TicketSales
+FOR EACH ROW
+FOLLOWS UpdateShowtimeStatus
+BEGIN
+    INSERT INTO DailySalesRollup (SalesDate, MovieID, TheaterID, TicketCount, TicketRevenue)
+    SELECT DATE(NEW.TimeTicketSold), S.MovieID, S.TheaterID, 1, NEW.TicketPrice
+    FROM Showtimes S
+    WHERE S.ShowtimeID = NEW.ShowtimeID
+    ON DUPLICATE KEY UPDATE
+        TicketCount = TicketCount + 1,
+        TicketRevenue = TicketRevenue + NEW.TicketPrice;
+END//
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER RollupConcessionSale
+AFTER INSERT ON ConcessionSales
+FOR EACH ROW
+BEGIN
+    INSERT INTO DailySalesRollup (SalesDate, MovieID, TheaterID, ConcessionRevenue)
+    SELECT DATE(NEW.TimeConcessionSold), 0, 0, C.ConcessionPrice
+    FROM Concessions C
+    WHERE C.ConcessionID = NEW.ConcessionID
+    ON DUPLICATE KEY UPDATE
+        ConcessionRevenue = ConcessionRevenue + C.ConcessionPrice;
+END//
+DELIMITER ;
+
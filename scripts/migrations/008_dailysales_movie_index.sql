@@ -0,0 +1,6 @@
+-- Migration 008: per-movie index on DailySalesRollup for the profit leaderboard.
+-- Already included in define_db.sql; run this on databases created before it.
+USE theater_db;
+
+CREATE INDEX idx_dailysales_movie_date
+    ON DailySalesRollup (MovieID, SalesDate, TicketCount, TicketRevenue);
@@ -0,0 +1,42 @@
+-- Migration 009: ConcessionSalesCube for /api/reports/concessions/cube.
+-- Already included in define_db.sql; run this on databases created before it.
+--
+-- Pause concession sales while this runs: sales made between the backfill
+-- and the trigger creation would be missing from the cube.
+USE theater_db;
+
+-- Concession units and revenue per (day, hour of day, category) for the
+-- concession cube report. Maintained by the CubeConcessionSale trigger;
+-- day of week is derived from SalesDate at query time.
+CREATE TABLE ConcessionSalesCube (
+    SalesDate DATE NOT NULL,
+    SaleHour TINYINT NOT NULL,
+    Category VARCHAR(10) NOT NULL,
+    Units INT NOT NULL DEFAULT 0,
+    Revenue DECIMAL(12,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (SalesDate, SaleHour, Category)
+);
+
+-- Backfill from the sales history
+INSERT INTO ConcessionSalesCube (SalesDate, SaleHour, Category, Units, Revenue)
+SELECT DATE(cs.TimeConcessionSold), HOUR(cs.TimeConcessionSold), c.Category,
+       COUNT(*), SUM(c.ConcessionPrice)
+FROM ConcessionSales cs
+JOIN Concessions c ON cs.ConcessionID = c.ConcessionID
+GROUP BY DATE(cs.TimeConcessionSold), HOUR(cs.TimeConcessionSold), c.Category;
+
+DELIMITER //
+CREATE TRIGGER CubeConcessionSale
+AFTER INSERT ON ConcessionSales
+FOR EACH ROW
+FOLLOWS RollupConcessionSale
+BEGIN
+    INSERT INTO ConcessionSalesCube (SalesDate, SaleHour, Category, Units, Revenue)
+    SELECT DATE(NEW.TimeConcessionSold), HOUR(NEW.TimeConcessionSold), C.Category, 1, C.ConcessionPrice
+    FROM Concessions C
+    WHERE C.ConcessionID = NEW.ConcessionID
+    ON DUPLICATE KEY UPDATE
+        Units = Units + 1,
+        Revenue = Revenue + C.ConcessionPrice;
+END//
+DELIMITER ;
@@ -0,0 +1,9 @@
+-- Migration 010: end-time index for showtime overlap checks.
+-- Already included in define_db.sql; run this on databases created before it.
+USE theater_db;
+
+-- EnforceShowtimeOverlap and POST /api/showtimes/bulk look for showtimes in
+-- the same auditorium with EndTime > new StartTime; with this index that is a
+-- short range instead of the auditorium's whole history
+CREATE INDEX idx_showtimes_theater_end
+    ON Showtimes (TheaterID, EndTime, StartTime);
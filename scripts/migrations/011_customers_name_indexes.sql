@@ -0,0 +1,11 @@
+-- Migration 011: name prefix indexes for the customer typeahead.
+-- Already included in define_db.sql; run this on databases created before it.
+USE theater_db;
+
+-- GET /api/customers/search matches FName LIKE 'q%' and LName LIKE 'q%' in
+-- two branches; each becomes a short covering range scan instead of a full
+-- scan of Customers
+CREATE INDEX idx_customers_fname
+    ON Customers (FName, LName, MembershipStatus);
+CREATE INDEX idx_customers_lname
+    ON Customers (LName, FName, MembershipStatus);
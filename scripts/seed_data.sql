@@ -1,6 +1,8 @@
 USE theater_db;
 
 -- Clear existing data
+DELETE FROM DailySalesRollup;
+DELETE FROM ConcessionSalesCube;
 DELETE FROM ConcessionSales;
 DELETE FROM TicketSales;
 DELETE FROM Showtimes;
@@ -82,9 +82,9 @@ function initNavigation() {
 
 // ----------- OVERVIEW SECTION -----------
 
-async function loadNowPlaying() {
+async function loadNowPlaying(movies) {
   try {
-    const movies = await apiGet("/movies/now-playing");
+    movies = movies ?? (await apiGet("/movies/now-playing"));
     const tbody = document.getElementById("table-now-playing");
     tbody.innerHTML = "";
 
@@ -111,9 +111,9 @@ async function loadNowPlaying() {
   }
 }
 
-async function loadUpcomingMovies() {
+async function loadUpcomingMovies(movies) {
   try {
-    const movies = await apiGet("/movies/upcoming");
+    movies = movies ?? (await apiGet("/movies/upcoming"));
     const tbody = document.getElementById("table-upcoming");
     tbody.innerHTML = "";
 
@@ -137,9 +137,9 @@ async function loadUpcomingMovies() {
   }
 }
 
-async function loadAllMovies() {
+async function loadAllMovies(movies) {
   try {
-    const movies = await apiGet("/movies");
+    movies = movies ?? (await apiGet("/movies"));
     const tbody = document.getElementById("table-all-movies");
     tbody.innerHTML = "";
 
@@ -169,38 +169,109 @@ async function loadAllMovies() {
 function initOverviewSection() {
   document
     .getElementById("btn-refresh-now-playing")
-    .addEventListener("click", loadNowPlaying);
+    .addEventListener("click", () => loadNowPlaying());
   document
     .getElementById("btn-refresh-upcoming")
-    .addEventListener("click", loadUpcomingMovies);
+    .addEventListener("click", () => loadUpcomingMovies());
   document
     .getElementById("btn-refresh-all-movies")
-    .addEventListener("click", loadAllMovies);
+    .addEventListener("click", () => loadAllMovies());
 }
 
 // ----------- SHARED DROPDOWN DATA (customers, showtimes, movies) -----------
 
-async function loadCustomersIntoSelect(selectId) {
-  try {
-    const customers = await apiGet("/customers");
-    const select = document.getElementById(selectId);
-    select.innerHTML = `<option value="">Select a customer...</option>`;
-    for (const c of customers) {
-      const opt = document.createElement("option");
-      opt.value = c.customer_id;
-      opt.textContent = `${c.customer_id} — ${c.fname} ${c.lname ?? ""}`.trim();
-      select.appendChild(opt);
+function customerLabel(c) {
+  return `${c.customer_id} — ${c.fname} ${c.lname ?? ""}`.trim();
+}
+
+// Customers are looked up as the user types (/customers/search) instead of
+// loading every customer into a <select>. The chosen ID goes into the hidden
+// input `valueId`, which fires "change" like the old select did.
+function initCustomerTypeahead(inputId, valueId) {
+  const input = document.getElementById(inputId);
+  const valueInput = document.getElementById(valueId);
+  const results = input.parentElement.querySelector(
+    ".customer-typeahead-results"
+  );
+  let timer = null;
+  let latestRequest = 0;
+  let matches = [];
+
+  const hide = () => results.classList.add("d-none");
+  const setValue = (value) => {
+    if (valueInput.value !== value) {
+      valueInput.value = value;
+      valueInput.dispatchEvent(new Event("change"));
     }
-  } catch (err) {
-    console.error(err);
-    showGlobalAlert(`Failed to load customers: ${err.message}`, "danger");
-  }
+  };
+  const choose = (c) => {
+    input.value = customerLabel(c);
+    hide();
+    setValue(String(c.customer_id));
+  };
+
+  const render = () => {
+    results.innerHTML = "";
+    if (!matches.length) {
+      results.innerHTML = `<div class="list-group-item small text-muted py-1">No matching customers.</div>`;
+    }
+    for (const c of matches) {
+      const item = document.createElement("button");
+      item.type = "button";
+      item.className = "list-group-item list-group-item-action small py-1";
+      item.textContent = customerLabel(c);
+      // mousedown fires before the input's blur hides the list
+      item.addEventListener("mousedown", (e) => {
+        e.preventDefault();
+        choose(c);
+      });
+      results.appendChild(item);
+    }
+    results.classList.remove("d-none");
+  };
+
+  input.addEventListener("input", () => {
+    clearTimeout(timer);
+    setValue("");
+    matches = [];
+    const q = input.value.trim();
+    if (!q) {
+      latestRequest++;
+      hide();
+      return;
+    }
+    timer = setTimeout(async () => {
+      const request = ++latestRequest;
+      try {
+        const found = await apiGet(
+          `/customers/search?q=${encodeURIComponent(q)}&limit=10`
+        );
+        // Ignore answers to keystrokes that have been superseded
+        if (request !== latestRequest) return;
+        matches = found;
+        render();
+      } catch (err) {
+        console.error(err);
+        showGlobalAlert(`Failed to search customers: ${err.message}`, "danger");
+      }
+    }, 150);
+  });
+
+  input.addEventListener("keydown", (e) => {
+    if (e.key === "Escape") {
+      hide();
+    } else if (e.key === "Enter" && matches.length) {
+      e.preventDefault();
+      choose(matches[0]);
+    }
+  });
+  input.addEventListener("blur", hide);
 }
 
-async function loadShowtimesIntoSelect(selectId) {
+async function loadShowtimesIntoSelect(selectId, showtimes, movies) {
   try {
-    const showtimes = await apiGet("/showtimes");
-    const movies = await apiGet("/movies"); // to map movie titles
+    showtimes = showtimes ?? (await apiGet("/showtimes"));
+    movies = movies ?? (await apiGet("/movies")); // to map movie titles
 
     const moviesById = {};
     movies.forEach((m) => {
@@ -223,9 +294,9 @@ async function loadShowtimesIntoSelect(selectId) {
   }
 }
 
-async function loadMoviesIntoSelect(selectId) {
+async function loadMoviesIntoSelect(selectId, movies) {
   try {
-    const movies = await apiGet("/movies");
+    movies = movies ?? (await apiGet("/movies"));
     const select = document.getElementById(selectId);
     select.innerHTML = `<option value="">Select a movie...</option>`;
     for (const m of movies) {
@@ -285,9 +356,9 @@ function initTicketPurchaseForm() {
   });
 }
 
-async function loadTicketsToday() {
+async function loadTicketsToday(tickets) {
   try {
-    const tickets = await apiGet("/tickets/today");
+    tickets = tickets ?? (await apiGet("/tickets/today"));
     const tbody = document.getElementById("table-tickets-today");
     tbody.innerHTML = "";
 
@@ -312,13 +383,25 @@ async function loadTicketsToday() {
   }
 }
 
-async function loadAllTickets() {
+// Cursor for the next page of /tickets (null = no more pages)
+let allTicketsCursor = null;
+
+async function loadAllTickets(append = false) {
   try {
-    const tickets = await apiGet("/tickets");
+    let path = "/tickets";
+    if (append && allTicketsCursor) {
+      path += `?cursor=${encodeURIComponent(allTicketsCursor)}`;
+    }
+    const page = await apiGet(path);
+    const tickets = page.items;
     const tbody = document.getElementById("table-all-tickets");
-    tbody.innerHTML = "";
+    const moreBtn = document.getElementById("btn-more-all-tickets");
+    if (!append) tbody.innerHTML = "";
 
-    if (!tickets.length) {
+    allTicketsCursor = page.next_cursor;
+    moreBtn.classList.toggle("d-none", !allTicketsCursor);
+
+    if (!append && !tickets.length) {
       tbody.innerHTML = `<tr><td colspan="5" class="text-muted">No tickets found.</td></tr>`;
       return;
     }
@@ -340,61 +423,134 @@ async function loadAllTickets() {
   }
 }
 
+// Cursor for the next page of the selected customer's history
+let customerHistoryCursor = null;
+
+async function loadCustomerHistory(customerId, append = false) {
+  const tbody = document.getElementById("table-customer-history");
+  const moreBtn = document.getElementById("btn-more-customer-history");
+  if (!append) tbody.innerHTML = "";
+
+  try {
+    let path = `/tickets/customers/${customerId}/tickets`;
+    if (append && customerHistoryCursor) {
+      path += `?cursor=${encodeURIComponent(customerHistoryCursor)}`;
+    }
+    const page = await apiGet(path);
+    const history = page.items;
+
+    customerHistoryCursor = page.next_cursor;
+    moreBtn.classList.toggle("d-none", !customerHistoryCursor);
+
+    if (!append && !history.length) {
+      tbody.innerHTML = `<tr><td colspan="4" class="text-muted">No tickets for this customer.</td></tr>`;
+      return;
+    }
+
+    for (const row of history) {
+      const tr = document.createElement("tr");
+      tr.innerHTML = `
+        <td>${row.ticket_sale_id}</td>
+        <td>${row.movie_title}</td>
+        <td>${row.showtime_id}</td>
+        <td>$${row.ticket_price.toFixed(2)}</td>
+      `;
+      tbody.appendChild(tr);
+    }
+  } catch (err) {
+    console.error(err);
+    showGlobalAlert(
+      `Failed to load customer ticket history: ${err.message}`,
+      "danger"
+    );
+  }
+}
+
 function initTicketsSection() {
   // Purchase form
+  initCustomerTypeahead("select-customer-search", "select-customer");
   initTicketPurchaseForm();
 
   // Tickets today
   document
     .getElementById("btn-refresh-tickets-today")
-    .addEventListener("click", loadTicketsToday);
+    .addEventListener("click", () => loadTicketsToday());
 
   // All tickets
   document
     .getElementById("btn-refresh-all-tickets")
-    .addEventListener("click", loadAllTickets);
+    .addEventListener("click", () => loadAllTickets(false));
+  document
+    .getElementById("btn-more-all-tickets")
+    .addEventListener("click", () => loadAllTickets(true));
 
   // Customer ticket history
+  initCustomerTypeahead(
+    "select-history-customer-search",
+    "select-history-customer"
+  );
   const selectHistoryCustomer = document.getElementById(
     "select-history-customer"
   );
-  selectHistoryCustomer.addEventListener("change", async () => {
+  selectHistoryCustomer.addEventListener("change", () => {
     const customerId = selectHistoryCustomer.value;
-    const tbody = document.getElementById("table-customer-history");
-    tbody.innerHTML = "";
-    if (!customerId) return;
-
-    try {
-      const history = await apiGet(`/tickets/customers/${customerId}/tickets`);
-      if (!history.length) {
-        tbody.innerHTML = `<tr><td colspan="4" class="text-muted">No tickets for this customer.</td></tr>`;
-        return;
-      }
-
-      for (const row of history) {
-        const tr = document.createElement("tr");
-        tr.innerHTML = `
-          <td>${row.ticket_sale_id}</td>
-          <td>${row.movie_title}</td>
-          <td>${row.showtime_id}</td>
-          <td>$${row.ticket_price.toFixed(2)}</td>
-        `;
-        tbody.appendChild(tr);
-      }
-    } catch (err) {
-      console.error(err);
-      showGlobalAlert(
-        `Failed to load customer ticket history: ${err.message}`,
-        "danger"
-      );
+    if (!customerId) {
+      document.getElementById("table-customer-history").innerHTML = "";
+      document
+        .getElementById("btn-more-customer-history")
+        .classList.add("d-none");
+      return;
     }
+    loadCustomerHistory(customerId, false);
   });
+  document
+    .getElementById("btn-more-customer-history")
+    .addEventListener("click", () => {
+      const customerId = selectHistoryCustomer.value;
+      if (customerId) loadCustomerHistory(customerId, true);
+    });
 }
 
 // ----------- REPORTS SECTION -----------
 
+// Fill a <datalist> with /movies/suggest results as the user types a title
+function initTitleSuggestions(inputId, datalistId) {
+  const input = document.getElementById(inputId);
+  const datalist = document.getElementById(datalistId);
+  let timer = null;
+  let latestRequest = 0;
+
+  input.addEventListener("input", () => {
+    clearTimeout(timer);
+    const q = input.value.trim();
+    if (!q) {
+      latestRequest++;
+      datalist.innerHTML = "";
+      return;
+    }
+    timer = setTimeout(async () => {
+      const request = ++latestRequest;
+      try {
+        const suggestions = await apiGet(
+          `/movies/suggest?q=${encodeURIComponent(q)}&limit=8`
+        );
+        if (request !== latestRequest) return;
+        datalist.innerHTML = "";
+        for (const s of suggestions) {
+          const opt = document.createElement("option");
+          opt.value = s.title;
+          datalist.appendChild(opt);
+        }
+      } catch (err) {
+        console.error(err);
+      }
+    }, 150);
+  });
+}
+
 function initReportsSection() {
   // Query 1: movie showtimes by date
+  initTitleSuggestions("report-q1-title", "report-q1-title-suggestions");
   const formQ1 = document.getElementById("form-report-movie-showtimes");
   formQ1.addEventListener("submit", async (e) => {
     e.preventDefault();
@@ -449,11 +605,11 @@ function initReportsSection() {
         )}`
       );
       resultDiv.innerHTML = `
-        <div class="alert alert-success mb-0" role="alert">
+        <div class="alert alert-success mb-0" role="alert" data-showtime-id="${data.showtime_id}">
           <div><strong>Showtime:</strong> ${data.showtime_id}</div>
           <div><strong>Capacity:</strong> ${data.seat_capacity}</div>
-          <div><strong>Tickets Sold:</strong> ${data.tickets_sold}</div>
-          <div><strong>Seats Remaining:</strong> ${data.seats_remaining}</div>
+          <div><strong>Tickets Sold:</strong> <span data-field="tickets_sold">${data.tickets_sold}</span></div>
+          <div><strong>Seats Remaining:</strong> <span data-field="seats_remaining">${data.seats_remaining}</span></div>
         </div>
       `;
     } catch (err) {
@@ -542,12 +698,13 @@ function initReportsSection() {
       }
       for (const row of data) {
         const tr = document.createElement("tr");
+        tr.dataset.showtimeId = row.showtime_id;
         tr.innerHTML = `
           <td>${row.showtime_id}</td>
           <td>${row.movie_title}</td>
           <td>${row.theater_id}</td>
           <td>${row.start_time}</td>
-          <td>${row.dynamic_status}</td>
+          <td data-field="status">${row.dynamic_status}</td>
         `;
         tbody.appendChild(tr);
       }
@@ -611,6 +768,52 @@ function initReportsSection() {
   });
 }
 
+// ----------- LIVE UPDATES -----------
+
+// Apply a pushed event to whatever is currently on screen
+function applyLiveEvent(event) {
+  if (event.type === "availability") {
+    const box = document.querySelector(
+      `#report-q2-result [data-showtime-id="${event.showtime_id}"]`
+    );
+    if (box) {
+      box.querySelector('[data-field="tickets_sold"]').textContent =
+        event.tickets_sold;
+      box.querySelector('[data-field="seats_remaining"]').textContent =
+        event.seats_remaining;
+    }
+  } else if (event.type === "status") {
+    const row = document.querySelector(
+      `#table-report-q5 tr[data-showtime-id="${event.showtime_id}"]`
+    );
+    if (!row) return;
+    if (event.status === "Completed") {
+      // Upcoming showtimes only lists shows that haven't ended
+      row.remove();
+    } else {
+      row.querySelector('[data-field="status"]').textContent = event.status;
+    }
+  }
+}
+
+// One WebSocket per tab; reconnect with backoff if the server goes away
+function initLiveUpdates(retryMs = 1000) {
+  const scheme = window.location.protocol === "https:" ? "wss" : "ws";
+  const socket = new WebSocket(
+    `${scheme}://${window.location.host}${API_BASE}/live/ws`
+  );
+
+  socket.addEventListener("open", () => {
+    retryMs = 1000;
+  });
+  socket.addEventListener("message", (msg) => {
+    applyLiveEvent(JSON.parse(msg.data));
+  });
+  socket.addEventListener("close", () => {
+    setTimeout(() => initLiveUpdates(Math.min(retryMs * 2, 30000)), retryMs);
+  });
+}
+
 // ----------- INITIALIZATION -----------
 
 async function initApp() {
@@ -618,22 +821,29 @@ async function initApp() {
   initOverviewSection();
   initTicketsSection();
   initReportsSection();
+  initLiveUpdates();
+
+  // Initial loads: one /dashboard request for everything, falling back to
+  // the individual endpoints if it fails
+  let data = {};
+  try {
+    data = await apiGet("/dashboard");
+  } catch (err) {
+    console.error(err);
+  }
 
-  // Initial loads
   await Promise.all([
-    loadNowPlaying(),
-    loadUpcomingMovies(),
-    loadAllMovies(),
-    loadCustomersIntoSelect("select-customer"),
-    loadCustomersIntoSelect("select-history-customer"),
-    loadShowtimesIntoSelect("select-showtime"),
-    loadShowtimesIntoSelect("report-q2-showtime-id"),
-    loadMoviesIntoSelect("report-q4-movie-id"),
-    loadMoviesIntoSelect("report-profit-movie-id"),
+    loadNowPlaying(data.now_playing),
+    loadUpcomingMovies(data.upcoming),
+    loadAllMovies(data.movies),
+    loadShowtimesIntoSelect("select-showtime", data.showtimes, data.movies),
+    loadShowtimesIntoSelect("report-q2-showtime-id", data.showtimes, data.movies),
+    loadMoviesIntoSelect("report-q4-movie-id", data.movies),
+    loadMoviesIntoSelect("report-profit-movie-id", data.movies),
   ]);
 
   // Optionally preload today's tickets
-  loadTicketsToday();
+  loadTicketsToday(data.tickets_today);
 }
 
 document.addEventListener("DOMContentLoaded", () => {